@@ -11,8 +11,8 @@ Steps to be implemented are:
 """
 
 from typing import Dict, List, Any, Optional
-import pandas as pd
-import numpy as np
+
+from functions_store.tabulated import result_tables
 
 ## TODO could include label converter here (as part of the function)
 ## maybe even give option to user to do so in the GUI
@@ -20,26 +20,17 @@ import numpy as np
 # save (& load) all of those in a JSON file, which stays with the app
 
 def retrieve_csv_result(
-    csv_file_path: str, **inputs: Dict[str, float]
+    csv_file_path: str,
+    inputs: Dict[str, float],
+    outputs: Optional[List[str]] = None,
 ) -> Dict[str, float]:
     """
     Retrieve the result from a csv file.
-    """
-
-    df = pd.read_csv(csv_file_path)
-
-    for col in inputs.keys():
-        if col not in df.columns:
-            raise ValueError(
-                f"Input {col} not in the csv file. Columns are: {df.columns.values}"
-            )
-    result = df.loc[np.all(df[inputs.keys()] == inputs.values(), axis=1)]  #type: ignore
-    # Check if the result is empty or has multiple rows
-    assert len(result) != 0, f"No result found for inputs {inputs}."
-    assert len(result) == 1, f"Multiple results found for inputs {inputs}."
 
-    result = result.drop(columns=inputs.keys())
-    result = result.iloc[0].to_dict()
+    The file is read once and indexed on the input columns (see
+    functions_store.tabulated), instead of being read and scanned on every call.
+    """
+    result = result_tables.load(csv_file_path).lookup(inputs, outputs)
     print(f"Result found for inputs {inputs}: \n\n {result}")
     return result
 
@@ -193,6 +184,14 @@ if __name__ == "__main__":
         tags=["cacheable"],
         url="./examples/csv_retrieval_functions.py:nih_in_silico",
     )
+    # Same lookup, executed by the server without loading a Python file
+    functions["nih_in_silico_tabulated"] = Function(
+        name="nih_in_silico_tabulated",
+        type="tabulated",
+        description="Retrieve the NIH results (Final) from a csv file.",
+        input_schema=functions["nih_in_silico"].input_schema,
+        url=f"{example_csv_file_path}?outputs=Thermal_Peak_Overall,Thermal_Peak_Nerve,Thermal_Peak_Saline",
+    )
 
     for function_name, function in functions.items():
         print(f"Adding function: {function_name}")
@@ -210,6 +209,7 @@ if __name__ == "__main__":
     function_job = funcapi.run_function(
         function_id=created_functions["nih_in_silico"].id,
         inputs=dict_to_text_inputs(example_inputs),
+        wait=30,
     )
     print(function_job)
 
@@ -82,10 +82,12 @@ response = funcapi.batch_run_function(
     max_workers=2,
 )
 
-while "COMPLETED" not in funcjobcolapi.get_collection_status(response.id).status:
+# Without the job ids, each poll reads only the counters of the collection
+status = funcjobcolapi.get_collection_status(response.id, include_job_ids=False)
+while status.progress < 1:
     time.sleep(1)
-    response = funcjobcolapi.get_collection_status(response.id)
-    print(response)
+    status = funcjobcolapi.get_collection_status(response.id, include_job_ids=False)
+    print(status)
 
 print("\nJobs done, results:")
 for job_id in response.job_ids:
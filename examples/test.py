@@ -1,10 +1,11 @@
 import pprint
-import time
 
 import openapi_client
 import openapi_client.api.function_api
 import openapi_client.api.function_job_api
 import openapi_client.api.function_job_collection_api
+from openapi_client.columnar import collection_results_dataframe
+from openapi_client.events import iter_collection_events
 
 
 configuration = openapi_client.Configuration()
@@ -82,15 +83,14 @@ response = funcapi.batch_run_function(
     max_workers=2,
 )
 
-while "COMPLETED" not in funcjobcolapi.get_collection_status(response.id).status:
-    time.sleep(1)
-    response = funcjobcolapi.get_collection_status(response.id)
-    print(response)
+for event in iter_collection_events(response.id, api_client):
+    if event.event == "progress":
+        print(f"Progress: {event.data.job_counts}")
+    elif event.event == "job":
+        print(f"Job done: {event.data}")
 
 print("\nJobs done, results:")
-for job_id in response.job_ids:
-    function_job = funcjobapi.get_function_job(function_job_id=job_id)
-    print(function_job)
+print(collection_results_dataframe(response.id, api_client))
 
 
 # pprint.pprint(
@@ -16,6 +16,7 @@ import ApiClient from "../ApiClient";
 import Function from '../model/Function';
 import FunctionJob from '../model/FunctionJob';
 import FunctionJobCollection from '../model/FunctionJobCollection';
+import FunctionSummary from '../model/FunctionSummary';
 import HTTPValidationError from '../model/HTTPValidationError';
 
 /**
@@ -174,6 +175,51 @@ export default class FunctionApi {
       );
     }
 
+    /**
+     * Callback function to receive the result of the listFunctionSummaries operation.
+     * @callback module:api/FunctionApi~listFunctionSummariesCallback
+     * @param {String} error Error message, if any.
+     * @param {Array.<module:model/Function>} data The data returned by the service call.
+     * @param {String} response The complete HTTP response.
+     */
+
+    /**
+     * List Function Summaries
+     * List summaries of the functions in the store, in id order, with only the selected fields read from the database (by default, not the schemas).  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     fields: Comma-separated fields of the functions to return, among the         fields of a function (default: id,name,type,tags). The id is         always returned.     limit: Maximum number of functions to return (default: 100)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of the functions with the selected fields  Raises:     HTTPException: If a field is not a field of functions
+     * @param {Object} opts Optional parameters
+     * @param {String} [fields = 'id,name,type,tags')] Comma-separated fields of the functions to return
+     * @param {Number} [limit = 100)] Maximum number of functions to return
+     * @param {String} [cursor] Cursor of the page, from the X-Next-Cursor header
+     * @param {module:api/FunctionApi~listFunctionSummariesCallback} callback The callback function, accepting three arguments: error, data, response
+     * data is of type: {@link Array.<module:model/Function>}
+     */
+    listFunctionSummaries(opts, callback) {
+      opts = opts || {};
+      let postBody = null;
+
+      let pathParams = {
+      };
+      let queryParams = {
+        'fields': opts['fields'],
+        'limit': opts['limit'],
+        'cursor': opts['cursor']
+      };
+      let headerParams = {
+      };
+      let formParams = {
+      };
+
+      let authNames = [];
+      let contentTypes = [];
+      let accepts = ['application/json'];
+      let returnType = [FunctionSummary];
+      return this.apiClient.callApi(
+        '/function/summary', 'GET',
+        pathParams, queryParams, headerParams, formParams, postBody,
+        authNames, contentTypes, accepts, returnType, null, callback
+      );
+    }
+
     /**
      * Callback function to receive the result of the listFunctions operation.
      * @callback module:api/FunctionApi~listFunctionsCallback
@@ -184,16 +230,22 @@ export default class FunctionApi {
 
     /**
      * List Functions
-     * List all functions in the store.  Returns:     List of all registered functions
+     * List all functions in the store, in id order.  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of all registered functions
+     * @param {Object} opts Optional parameters
+     * @param {Number} [limit] Maximum number of functions to return
+     * @param {String} [cursor] Cursor of the page, from the X-Next-Cursor header
      * @param {module:api/FunctionApi~listFunctionsCallback} callback The callback function, accepting three arguments: error, data, response
      * data is of type: {@link Array.<module:model/Function>}
      */
-    listFunctions(callback) {
+    listFunctions(opts, callback) {
+      opts = opts || {};
       let postBody = null;
 
       let pathParams = {
       };
       let queryParams = {
+        'limit': opts['limit'],
+        'cursor': opts['cursor']
       };
       let headerParams = {
       };
@@ -273,13 +325,17 @@ export default class FunctionApi {
 
     /**
      * Run Function
-     * Run a function with the given inputs. Validates inputs and outputs against JSON Schema if defined.
+     * Run a function with the given inputs.  The job is enqueued and returned right away as PENDING, to be executed by the workers like the jobs of map_function; poll it with get_function_job or wait_for_function_job. With wait, the job is returned as soon as it finished, or still PENDING or RUNNING when the wait timed out.  With sync, the function is run in the request as before, occupying a server thread until it finished. Either way, dict results are the outputs of the job, other results are stored as {"result": value}, and outputs that do not match the output schema fail the job.  Parameters:     function_id: ID of the function     inputs: JSON-encoded inputs     wait: Seconds to wait for the job to finish at most     sync: Run the function in the request  Returns:     The function job, FAILED if the inputs do not match the input schema  Raises:     HTTPException: If function is not found (404) or inputs are invalid         JSON (400)
      * @param {Number} functionId 
      * @param {String} inputs 
+     * @param {Object} opts Optional parameters
+     * @param {Number} [wait] Seconds to wait for the job to finish at most
+     * @param {Boolean} [sync = false)] Run the function in the request and return when it finished
      * @param {module:api/FunctionApi~runFunctionCallback} callback The callback function, accepting three arguments: error, data, response
      * data is of type: {@link module:model/FunctionJob}
      */
-    runFunction(functionId, inputs, callback) {
+    runFunction(functionId, inputs, opts, callback) {
+      opts = opts || {};
       let postBody = null;
       // verify the required parameter 'functionId' is set
       if (functionId === undefined || functionId === null) {
@@ -294,7 +350,9 @@ export default class FunctionApi {
         'function_id': functionId
       };
       let queryParams = {
-        'inputs': inputs
+        'inputs': inputs,
+        'wait': opts['wait'],
+        'sync': opts['sync']
       };
       let headerParams = {
       };
@@ -312,6 +370,55 @@ export default class FunctionApi {
       );
     }
 
+    /**
+     * Callback function to receive the result of the searchFunctions operation.
+     * @callback module:api/FunctionApi~searchFunctionsCallback
+     * @param {String} error Error message, if any.
+     * @param {Array.<module:model/Function>} data The data returned by the service call.
+     * @param {String} response The complete HTTP response.
+     */
+
+    /**
+     * Search Functions
+     * Full-text search over the names, descriptions and tags of the functions, for search-as-you-type.  Parameters:     q: Words to search for. Each must be the start of a word of the name,         description or tags of a function (case-insensitive)     limit: Maximum number of functions to return (default: 20)     offset: Number of functions to skip, for the next pages of results  Returns:     The matching functions, best match first: matches in names rank     above matches in tags, which rank above matches in descriptions
+     * @param {String} q Words to search for
+     * @param {Object} opts Optional parameters
+     * @param {Number} [limit = 20)] Maximum number of functions to return
+     * @param {Number} [offset] Number of functions to skip
+     * @param {module:api/FunctionApi~searchFunctionsCallback} callback The callback function, accepting three arguments: error, data, response
+     * data is of type: {@link Array.<module:model/Function>}
+     */
+    searchFunctions(q, opts, callback) {
+      opts = opts || {};
+      let postBody = null;
+      // verify the required parameter 'q' is set
+      if (q === undefined || q === null) {
+        throw new Error("Missing the required parameter 'q' when calling searchFunctions");
+      }
+
+      let pathParams = {
+      };
+      let queryParams = {
+        'q': q,
+        'limit': opts['limit'],
+        'offset': opts['offset']
+      };
+      let headerParams = {
+      };
+      let formParams = {
+      };
+
+      let authNames = [];
+      let contentTypes = [];
+      let accepts = ['application/json'];
+      let returnType = [Function];
+      return this.apiClient.callApi(
+        '/function/search', 'GET',
+        pathParams, queryParams, headerParams, formParams, postBody,
+        authNames, contentTypes, accepts, returnType, null, callback
+      );
+    }
+
     /**
      * Callback function to receive the result of the searchFunctionsByName operation.
      * @callback module:api/FunctionApi~searchFunctionsByNameCallback
@@ -365,10 +472,12 @@ export default class FunctionApi {
 
     /**
      * Search Functions By Tags
-     * Search for functions by tags.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.  Returns:     List of functions that match the tag criteria
+     * Search for functions by tags, in id order.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of functions that match the tag criteria
      * @param {Array.<String>} tags Tags to search for
      * @param {Object} opts Optional parameters
      * @param {Boolean} [matchAll = false)] If True, functions must have all tags. If False, functions must have any of the tags.
+     * @param {Number} [limit] Maximum number of functions to return
+     * @param {String} [cursor] Cursor of the page, from the X-Next-Cursor header
      * @param {module:api/FunctionApi~searchFunctionsByTagsCallback} callback The callback function, accepting three arguments: error, data, response
      * data is of type: {@link Array.<module:model/Function>}
      */
@@ -384,7 +493,9 @@ export default class FunctionApi {
       };
       let queryParams = {
         'tags': this.apiClient.buildCollectionParam(tags, 'multi'),
-        'match_all': opts['matchAll']
+        'match_all': opts['matchAll'],
+        'limit': opts['limit'],
+        'cursor': opts['cursor']
       };
       let headerParams = {
       };
@@ -89,11 +89,12 @@ export default class FunctionJobApi {
 
     /**
      * Get Function Jobs
-     * Get all jobs for a specific function with optional filtering and pagination.
+     * Get all jobs for a specific function with optional filtering and pagination, oldest first. The cursor of the next page is returned in the X-Next-Cursor header.
      * @param {Number} functionId ID of the function to get jobs for
      * @param {Object} opts Optional parameters
      * @param {Number} [limit] Maximum number of jobs to return
-     * @param {Number} [offset] Number of jobs to skip
+     * @param {Number} [offset] Number of jobs to skip (deprecated, use cursor)
+     * @param {String} [cursor] Cursor of the page, from the X-Next-Cursor header
      * @param {module:model/JobStatus} [status] Filter by job status
      * @param {Date} [startDate] Filter jobs after this date
      * @param {Date} [endDate] Filter jobs before this date
@@ -114,6 +115,7 @@ export default class FunctionJobApi {
       let queryParams = {
         'limit': opts['limit'],
         'offset': opts['offset'],
+        'cursor': opts['cursor'],
         'status': opts['status'],
         'start_date': opts['startDate'],
         'end_date': opts['endDate']
@@ -187,10 +189,11 @@ export default class FunctionJobApi {
 
     /**
      * List all function jobs with optional filtering
-     * List all function jobs with optional filtering and pagination.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0)     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
+     * List all function jobs with optional filtering and pagination, most recent first.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0), deprecated         in favor of cursor     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
      * @param {Object} opts Optional parameters
      * @param {Number} [limit] Maximum number of jobs to return
-     * @param {Number} [offset] Number of jobs to skip
+     * @param {Number} [offset] Number of jobs to skip (deprecated, use cursor)
+     * @param {String} [cursor] Cursor of the page, from the X-Next-Cursor header
      * @param {module:model/JobStatus} [status] Filter by job status
      * @param {Number} [functionId] Filter by function ID
      * @param {Date} [startDate] Filter jobs after this date
@@ -207,6 +210,7 @@ export default class FunctionJobApi {
       let queryParams = {
         'limit': opts['limit'],
         'offset': opts['offset'],
+        'cursor': opts['cursor'],
         'status': opts['status'],
         'function_id': opts['functionId'],
         'start_date': opts['startDate'],
@@ -87,12 +87,15 @@ export default class FunctionJobCollectionApi {
 
     /**
      * Get Collection Status
-     * Get status of a function job collection.  Parameters:     collection_id: ID of the collection to check  Returns:     Collection details including current status of all jobs
+     * Get status of a function job collection.  The number of jobs per status is maintained as jobs change status, so with include_job_ids=false this is a constant-time read of a single row however large the collection. By default the IDs of all jobs are read as well, which takes time proportional to the number of jobs.  Parameters:     collection_id: ID of the collection to check     include_job_ids: Whether to return the IDs of all jobs (default: true)  Returns:     Collection details including the number of jobs per status, the     fraction of finished jobs (progress) and when the first and last jobs     finished
      * @param {Number} collectionId 
+     * @param {Object} opts Optional parameters
+     * @param {Boolean} [includeJobIds = true)] Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.
      * @param {module:api/FunctionJobCollectionApi~getCollectionStatusCallback} callback The callback function, accepting three arguments: error, data, response
      * data is of type: {@link module:model/FunctionJobCollection}
      */
-    getCollectionStatus(collectionId, callback) {
+    getCollectionStatus(collectionId, opts, callback) {
+      opts = opts || {};
       let postBody = null;
       // verify the required parameter 'collectionId' is set
       if (collectionId === undefined || collectionId === null) {
@@ -103,6 +106,7 @@ export default class FunctionJobCollectionApi {
         'collection_id': collectionId
       };
       let queryParams = {
+        'include_job_ids': opts['includeJobIds']
       };
       let headerParams = {
       };
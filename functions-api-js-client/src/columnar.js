@@ -0,0 +1,87 @@
+/**
+ * Swagger Functions Store - OpenAPI 3.0
+ *
+ * Submitting a parameter matrix as a batch, one job per row.
+ *
+ * The matrix is sent as a single JSON columns payload (or as CSV text)
+ * instead of one JSON string per row, and fanned out into jobs by the server:
+ *
+ *   const collection = await batchRunColumns(ApiClient.instance, functionId,
+ *     {x: [1, 2, 3], y: [4, 5, 6]}, 'sweep');
+ *
+ * The results of a collection are read back as one row per job, streamed
+ * with fetch (browsers and Node.js 18+):
+ *
+ *   for await (const row of iterCollectionResults(ApiClient.instance, collection.id)) {
+ *     console.log(row.id, row['outputs.result']);
+ *   }
+ *
+ */
+
+
+import FunctionJobCollection from './model/FunctionJobCollection';
+
+/**
+ * Run a function with each row of a column-oriented matrix and create a job collection.
+ * @param {module:ApiClient} apiClient
+ * @param {Number} functionId ID of the function to run
+ * @param {Object.<String, Array>|String} columns Object mapping column names to
+ *   lists of values, or CSV text with a header line
+ * @param {String} collectionName Name for the job collection
+ * @return {Promise.<module:model/FunctionJobCollection>} The created collection,
+ *   with the ids of the jobs in row order
+ */
+export function batchRunColumns(apiClient, functionId, columns, collectionName) {
+  const contentType = typeof columns === 'string' ? 'text/csv' : 'application/json';
+  return new Promise((resolve, reject) => {
+    apiClient.callApi(
+      '/function/{function_id}/batch/columns', 'POST',
+      {'function_id': functionId}, {'collection_name': collectionName}, {}, {}, columns,
+      [], [contentType], ['application/json'], FunctionJobCollection, null,
+      (error, data) => (error ? reject(error) : resolve(data))
+    );
+  });
+}
+
+/**
+ * Iterate over the results of a function job collection, one row per job in
+ * the order the jobs were created, as they are streamed by the server.
+ * @param {module:ApiClient} apiClient
+ * @param {Number} collectionId ID of the collection
+ * @return {AsyncGenerator.<Object>} Rows with the id and status of the job, its
+ *   inputs.<name> and outputs.<name> values, and the error of failed jobs
+ */
+export async function* iterCollectionResults(apiClient, collectionId) {
+  const url = apiClient.buildUrl('/functionJobCollection/{collection_id}/results',
+    {'collection_id': collectionId}) + '?format=ndjson';
+  const response = await fetch(url, {
+    headers: Object.assign({}, apiClient.defaultHeaders, {Accept: 'application/x-ndjson'}),
+  });
+  if (!response.ok) {
+    throw new Error(`${response.status} ${response.statusText}: ${await response.text()}`);
+  }
+  const decoder = new TextDecoder();
+  const reader = response.body.getReader();
+  let buffer = '';
+  try {
+    while (true) {
+      const {done, value} = await reader.read();
+      if (done) {
+        break;
+      }
+      buffer += decoder.decode(value, {stream: true});
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+      for (const line of lines) {
+        if (line) {
+          yield JSON.parse(line);
+        }
+      }
+    }
+  } finally {
+    reader.releaseLock();
+  }
+  if (buffer) {
+    yield JSON.parse(buffer);
+  }
+}
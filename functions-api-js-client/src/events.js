@@ -0,0 +1,187 @@
+/**
+ * Swagger Functions Store - OpenAPI 3.0
+ *
+ * Following the progress of function jobs and collections without polling.
+ *
+ * The server streams the status transitions of a job, and the progress and
+ * outputs of the jobs of a collection, as Server-Sent Events over a single
+ * connection, and offers long-poll endpoints which return once a job or a
+ * collection finished:
+ *
+ *   for await (const {event, data} of iterCollectionEvents(ApiClient.instance, collectionId)) {
+ *     if (event === 'job') {
+ *       console.log(data.id, data.outputs);
+ *     }
+ *   }
+ *
+ *   const collection = await waitForCollection(ApiClient.instance, collectionId, 600);
+ *
+ * The streams are read with fetch, available in browsers and Node.js 18+.
+ *
+ */
+
+
+import FunctionJob from './model/FunctionJob';
+import FunctionJobCollection from './model/FunctionJobCollection';
+
+// Longest wait the server accepts per long-poll request
+export const MAX_WAIT_SECONDS = 300;
+
+// Model of the data of each event type
+const EVENT_MODELS = {
+  status: FunctionJob,
+  job: FunctionJob,
+  progress: FunctionJobCollection,
+  done: FunctionJobCollection,
+};
+
+/**
+ * Parse the chunks of a text/event-stream body into events.
+ * @param {AsyncIterable.<String>} chunks Decoded text of the body
+ * @return {AsyncGenerator.<{event: String, data: Object, id: String}>}
+ */
+export async function* parseEvents(chunks) {
+  let buffer = '';
+  let event = 'message';
+  let id;
+  let data = [];
+  for await (const chunk of chunks) {
+    buffer += chunk;
+    const lines = buffer.split(/\r?\n/);
+    buffer = lines.pop();
+    for (const line of lines) {
+      if (line === '') {
+        if (data.length) {
+          const payload = JSON.parse(data.join('\n'));
+          const model = EVENT_MODELS[event];
+          yield {event, id, data: model ? model.constructFromObject(payload) : payload};
+        }
+        event = 'message';
+        data = [];
+        continue;
+      }
+      if (line.startsWith(':')) {
+        // Keepalive comment
+        continue;
+      }
+      const colon = line.indexOf(':');
+      const field = colon === -1 ? line : line.slice(0, colon);
+      let value = colon === -1 ? '' : line.slice(colon + 1);
+      if (value.startsWith(' ')) {
+        value = value.slice(1);
+      }
+      if (field === 'event') {
+        event = value;
+      } else if (field === 'data') {
+        data.push(value);
+      } else if (field === 'id') {
+        id = value;
+      }
+    }
+  }
+}
+
+async function* decodeBody(body) {
+  const decoder = new TextDecoder();
+  const reader = body.getReader();
+  try {
+    while (true) {
+      const {done, value} = await reader.read();
+      if (done) {
+        return;
+      }
+      yield decoder.decode(value, {stream: true});
+    }
+  } finally {
+    reader.releaseLock();
+  }
+}
+
+async function* iterEvents(apiClient, path, pathParams, headers) {
+  const response = await fetch(apiClient.buildUrl(path, pathParams), {
+    headers: Object.assign({}, apiClient.defaultHeaders, headers, {Accept: 'text/event-stream'}),
+  });
+  if (!response.ok) {
+    throw new Error(`${response.status} ${response.statusText}: ${await response.text()}`);
+  }
+  yield* parseEvents(decodeBody(response.body));
+}
+
+/**
+ * Iterate over the status transitions of a function job, as "status" events
+ * with the job. The iteration ends once the job completed or failed.
+ * @param {module:ApiClient} apiClient
+ * @param {Number} functionJobId ID of the function job
+ * @return {AsyncGenerator.<{event: String, data: module:model/FunctionJob, id: String}>}
+ */
+export function iterJobEvents(apiClient, functionJobId) {
+  return iterEvents(apiClient, '/functionJob/{function_job_id}/events',
+    {'function_job_id': functionJobId});
+}
+
+/**
+ * Iterate over the progress of a function job collection: "progress" events
+ * with the collection when its job counts change, "job" events with each job
+ * that completed or failed, and a final "done" event.
+ * @param {module:ApiClient} apiClient
+ * @param {Number} collectionId ID of the collection
+ * @param {String} [lastEventId] id of the last "job" event received, to resume
+ *   an interrupted iteration without receiving the same jobs again
+ * @return {AsyncGenerator.<{event: String, data: Object, id: String}>}
+ */
+export function iterCollectionEvents(apiClient, collectionId, lastEventId) {
+  return iterEvents(apiClient, '/functionJobCollection/{collection_id}/events',
+    {'collection_id': collectionId}, lastEventId ? {'Last-Event-ID': lastEventId} : {});
+}
+
+function longPoll(apiClient, path, pathParams, timeout, returnType) {
+  return new Promise((resolve, reject) => {
+    apiClient.callApi(
+      path, 'GET', pathParams, {'timeout': timeout}, {}, {}, null,
+      [], [], ['application/json'], returnType, null,
+      (error, data) => (error ? reject(error) : resolve(data))
+    );
+  });
+}
+
+async function waitFor(apiClient, path, pathParams, returnType, finished, timeout) {
+  const deadline = timeout === undefined || timeout === null ? null : Date.now() + timeout * 1000;
+  while (true) {
+    // Leave the server time to answer before the request times out
+    let wait = Math.min(MAX_WAIT_SECONDS, Math.max(1, apiClient.timeout / 1000 - 5));
+    if (deadline !== null) {
+      wait = Math.max(0, Math.min(wait, (deadline - Date.now()) / 1000));
+    }
+    const result = await longPoll(apiClient, path, pathParams, wait, returnType);
+    if (finished(result) || (deadline !== null && Date.now() >= deadline)) {
+      return result;
+    }
+  }
+}
+
+/**
+ * Wait until a function job completed or failed.
+ * @param {module:ApiClient} apiClient
+ * @param {Number} functionJobId ID of the function job
+ * @param {Number} [timeout] Seconds to wait at most, as long as needed if omitted
+ * @return {Promise.<module:model/FunctionJob>} The job, still PENDING or RUNNING if the timeout expired
+ */
+export function waitForJob(apiClient, functionJobId, timeout) {
+  return waitFor(apiClient, '/functionJob/{function_job_id}/wait',
+    {'function_job_id': functionJobId}, FunctionJob,
+    (job) => job.status === 'COMPLETED' || job.status === 'FAILED', timeout);
+}
+
+/**
+ * Wait until all jobs of a function job collection completed or failed.
+ * @param {module:ApiClient} apiClient
+ * @param {Number} collectionId ID of the collection
+ * @param {Number} [timeout] Seconds to wait at most, as long as needed if omitted
+ * @return {Promise.<module:model/FunctionJobCollection>} The collection with its job counts
+ *   and progress (without job ids), not finished yet if the timeout expired
+ */
+export function waitForCollection(apiClient, collectionId, timeout) {
+  return waitFor(apiClient, '/functionJobCollection/{collection_id}/wait',
+    {'collection_id': collectionId}, FunctionJobCollection,
+    (collection) => (collection.progress || 0) >= 1, timeout);
+}
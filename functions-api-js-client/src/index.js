@@ -16,6 +16,7 @@ import ApiClient from './ApiClient';
 import Function from './model/Function';
 import FunctionJob from './model/FunctionJob';
 import FunctionJobCollection from './model/FunctionJobCollection';
+import FunctionSummary from './model/FunctionSummary';
 import HTTPValidationError from './model/HTTPValidationError';
 import JobStatus from './model/JobStatus';
 import ValidationError from './model/ValidationError';
@@ -82,6 +83,12 @@ export {
      */
     FunctionJobCollection,
 
+    /**
+     * The FunctionSummary model constructor.
+     * @property {module:model/FunctionSummary}
+     */
+    FunctionSummary,
+
     /**
      * The HTTPValidationError model constructor.
      * @property {module:model/HTTPValidationError}
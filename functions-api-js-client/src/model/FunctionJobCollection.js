@@ -73,6 +73,18 @@ class FunctionJobCollection {
             if (data.hasOwnProperty('status')) {
                 obj['status'] = ApiClient.convertToType(data['status'], 'String');
             }
+            if (data.hasOwnProperty('job_counts')) {
+                obj['job_counts'] = ApiClient.convertToType(data['job_counts'], {'String': 'Number'});
+            }
+            if (data.hasOwnProperty('progress')) {
+                obj['progress'] = ApiClient.convertToType(data['progress'], 'Number');
+            }
+            if (data.hasOwnProperty('first_finished_at')) {
+                obj['first_finished_at'] = ApiClient.convertToType(data['first_finished_at'], 'Date');
+            }
+            if (data.hasOwnProperty('last_finished_at')) {
+                obj['last_finished_at'] = ApiClient.convertToType(data['last_finished_at'], 'Date');
+            }
         }
         return obj;
     }
@@ -139,6 +151,26 @@ FunctionJobCollection.prototype['job_ids'] = undefined;
  */
 FunctionJobCollection.prototype['status'] = undefined;
 
+/**
+ * @member {Object.<String, Number>} job_counts
+ */
+FunctionJobCollection.prototype['job_counts'] = undefined;
+
+/**
+ * @member {Number} progress
+ */
+FunctionJobCollection.prototype['progress'] = undefined;
+
+/**
+ * @member {Date} first_finished_at
+ */
+FunctionJobCollection.prototype['first_finished_at'] = undefined;
+
+/**
+ * @member {Date} last_finished_at
+ */
+FunctionJobCollection.prototype['last_finished_at'] = undefined;
+
 
 
 
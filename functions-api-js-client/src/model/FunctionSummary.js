@@ -0,0 +1,168 @@
+/**
+ * Swagger Functions Store - OpenAPI 3.0
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.1
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ *
+ */
+
+import ApiClient from '../ApiClient';
+
+/**
+ * The FunctionSummary model module.
+ * @module model/FunctionSummary
+ * @version 0.0.1
+ */
+class FunctionSummary {
+    /**
+     * Constructs a new <code>FunctionSummary</code>.
+     * Projection of a function on the fields selected in a listing
+     * @alias module:model/FunctionSummary
+     * @param id {Number} 
+     */
+    constructor(id) { 
+        
+        FunctionSummary.initialize(this, id);
+    }
+
+    /**
+     * Initializes the fields of this object.
+     * This method is used by the constructors of any subclasses, in order to implement multiple inheritance (mix-ins).
+     * Only for internal use.
+     */
+    static initialize(obj, id) { 
+        obj['id'] = id;
+    }
+
+    /**
+     * Constructs a <code>FunctionSummary</code> from a plain JavaScript object, optionally creating a new instance.
+     * Copies all relevant properties from <code>data</code> to <code>obj</code> if supplied or a new instance if not.
+     * @param {Object} data The plain JavaScript object bearing properties of interest.
+     * @param {module:model/FunctionSummary} obj Optional instance to populate.
+     * @return {module:model/FunctionSummary} The populated <code>FunctionSummary</code> instance.
+     */
+    static constructFromObject(data, obj) {
+        if (data) {
+            obj = obj || new FunctionSummary();
+
+            if (data.hasOwnProperty('id')) {
+                obj['id'] = ApiClient.convertToType(data['id'], 'Number');
+            }
+            if (data.hasOwnProperty('name')) {
+                obj['name'] = ApiClient.convertToType(data['name'], 'String');
+            }
+            if (data.hasOwnProperty('type')) {
+                obj['type'] = ApiClient.convertToType(data['type'], 'String');
+            }
+            if (data.hasOwnProperty('url')) {
+                obj['url'] = ApiClient.convertToType(data['url'], 'String');
+            }
+            if (data.hasOwnProperty('description')) {
+                obj['description'] = ApiClient.convertToType(data['description'], 'String');
+            }
+            if (data.hasOwnProperty('input_schema')) {
+                obj['input_schema'] = ApiClient.convertToType(data['input_schema'], Object);
+            }
+            if (data.hasOwnProperty('output_schema')) {
+                obj['output_schema'] = ApiClient.convertToType(data['output_schema'], Object);
+            }
+            if (data.hasOwnProperty('tags')) {
+                obj['tags'] = ApiClient.convertToType(data['tags'], ['String']);
+            }
+        }
+        return obj;
+    }
+
+    /**
+     * Validates the JSON data with respect to <code>FunctionSummary</code>.
+     * @param {Object} data The plain JavaScript object bearing properties of interest.
+     * @return {boolean} to indicate whether the JSON data is valid with respect to <code>FunctionSummary</code>.
+     */
+    static validateJSON(data) {
+        // check to make sure all required properties are present in the JSON string
+        for (const property of FunctionSummary.RequiredProperties) {
+            if (!data.hasOwnProperty(property)) {
+                throw new Error("The required field `" + property + "` is not found in the JSON data: " + JSON.stringify(data));
+            }
+        }
+        // ensure the json data is a string
+        if (data['name'] && !(typeof data['name'] === 'string' || data['name'] instanceof String)) {
+            throw new Error("Expected the field `name` to be a primitive type in the JSON string but got " + data['name']);
+        }
+        // ensure the json data is a string
+        if (data['type'] && !(typeof data['type'] === 'string' || data['type'] instanceof String)) {
+            throw new Error("Expected the field `type` to be a primitive type in the JSON string but got " + data['type']);
+        }
+        // ensure the json data is a string
+        if (data['url'] && !(typeof data['url'] === 'string' || data['url'] instanceof String)) {
+            throw new Error("Expected the field `url` to be a primitive type in the JSON string but got " + data['url']);
+        }
+        // ensure the json data is a string
+        if (data['description'] && !(typeof data['description'] === 'string' || data['description'] instanceof String)) {
+            throw new Error("Expected the field `description` to be a primitive type in the JSON string but got " + data['description']);
+        }
+        // ensure the json data is an array
+        if (data['tags'] && !Array.isArray(data['tags'])) {
+            throw new Error("Expected the field `tags` to be an array in the JSON data but got " + data['tags']);
+        }
+
+        return true;
+    }
+
+
+}
+
+FunctionSummary.RequiredProperties = ["id"];
+
+/**
+ * @member {Number} id
+ */
+FunctionSummary.prototype['id'] = undefined;
+
+/**
+ * @member {String} name
+ */
+FunctionSummary.prototype['name'] = undefined;
+
+/**
+ * @member {String} type
+ */
+FunctionSummary.prototype['type'] = undefined;
+
+/**
+ * @member {String} url
+ */
+FunctionSummary.prototype['url'] = undefined;
+
+/**
+ * @member {String} description
+ */
+FunctionSummary.prototype['description'] = undefined;
+
+/**
+ * @member {Object} input_schema
+ */
+FunctionSummary.prototype['input_schema'] = undefined;
+
+/**
+ * @member {Object} output_schema
+ */
+FunctionSummary.prototype['output_schema'] = undefined;
+
+/**
+ * @member {Array.<String>} tags
+ */
+FunctionSummary.prototype['tags'] = undefined;
+
+
+
+
+
+
+export default FunctionSummary;
+
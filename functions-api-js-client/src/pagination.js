@@ -0,0 +1,101 @@
+/**
+ * Swagger Functions Store - OpenAPI 3.0
+ *
+ * Lazy iteration over the cursor-paginated job listings and function searches.
+ *
+ * The listing endpoints return the cursor of the next page in the
+ * X-Next-Cursor response header. The iterators below follow it, requesting a
+ * page only once the previous one has been consumed:
+ *
+ *   for await (const job of iterFunctionJobs(new FunctionJobApi(), {status: 'FAILED'})) {
+ *     console.log(job.id);
+ *   }
+ *
+ */
+
+
+export const NEXT_CURSOR_HEADER = 'x-next-cursor';
+export const DEFAULT_PAGE_SIZE = 100;
+
+/**
+ * Iterate over the pages of a cursor-paginated listing.
+ * @param {Function} fetchPage Calls a listing operation with the given opts and callback
+ * @param {Object} opts Filters of the listing
+ * @param {Number} [pageSize] Number of items requested per page
+ * @return {AsyncGenerator.<Array>} The pages
+ */
+export async function* iterPages(fetchPage, opts, pageSize = DEFAULT_PAGE_SIZE) {
+  let cursor;
+  do {
+    const pageOpts = Object.assign({}, opts, {limit: pageSize, cursor: cursor});
+    const {data, response} = await new Promise((resolve, reject) => {
+      fetchPage(pageOpts, (error, data, response) => {
+        if (error) {
+          reject(error);
+        } else {
+          resolve({data, response});
+        }
+      });
+    });
+    yield data;
+    cursor = response && response.headers ? response.headers[NEXT_CURSOR_HEADER] : undefined;
+  } while (cursor);
+}
+
+/**
+ * Iterate over all function jobs, most recent first.
+ * @param {module:api/FunctionJobApi} api
+ * @param {Object} opts Filters of listFunctionJobs, e.g. status or functionId
+ * @param {Number} [pageSize] Number of jobs requested per page
+ * @return {AsyncGenerator.<module:model/FunctionJob>}
+ */
+export async function* iterFunctionJobs(api, opts, pageSize = DEFAULT_PAGE_SIZE) {
+  const fetchPage = (pageOpts, callback) => api.listFunctionJobs(pageOpts, callback);
+  for await (const page of iterPages(fetchPage, opts, pageSize)) {
+    yield* page;
+  }
+}
+
+/**
+ * Iterate over all jobs of a function, oldest first.
+ * @param {module:api/FunctionJobApi} api
+ * @param {Number} functionId ID of the function
+ * @param {Object} opts Filters of getFunctionJobs, e.g. status or startDate
+ * @param {Number} [pageSize] Number of jobs requested per page
+ * @return {AsyncGenerator.<module:model/FunctionJob>}
+ */
+export async function* iterJobsOfFunction(api, functionId, opts, pageSize = DEFAULT_PAGE_SIZE) {
+  const fetchPage = (pageOpts, callback) => api.getFunctionJobs(functionId, pageOpts, callback);
+  for await (const page of iterPages(fetchPage, opts, pageSize)) {
+    yield* page;
+  }
+}
+
+/**
+ * Iterate over the functions with any, or all, of tags, in id order.
+ * @param {module:api/FunctionApi} api
+ * @param {Array.<String>} tags Tags to search for
+ * @param {Object} opts Options of searchFunctionsByTags, e.g. matchAll
+ * @param {Number} [pageSize] Number of functions requested per page
+ * @return {AsyncGenerator.<module:model/Function>}
+ */
+export async function* iterFunctionsByTags(api, tags, opts, pageSize = DEFAULT_PAGE_SIZE) {
+  const fetchPage = (pageOpts, callback) => api.searchFunctionsByTags(tags, pageOpts, callback);
+  for await (const page of iterPages(fetchPage, opts, pageSize)) {
+    yield* page;
+  }
+}
+
+/**
+ * Iterate over summaries of all functions, in id order.
+ * @param {module:api/FunctionApi} api
+ * @param {Object} opts Options of listFunctionSummaries, e.g. fields
+ * @param {Number} [pageSize] Number of functions requested per page
+ * @return {AsyncGenerator.<module:model/FunctionSummary>}
+ */
+export async function* iterFunctionSummaries(api, opts, pageSize = DEFAULT_PAGE_SIZE) {
+  const fetchPage = (pageOpts, callback) => api.listFunctionSummaries(pageOpts, callback);
+  for await (const page of iterPages(fetchPage, opts, pageSize)) {
+    yield* page;
+  }
+}
@@ -78,6 +78,16 @@
         done();
       });
     });
+    describe('listFunctionSummaries', function() {
+      it('should call listFunctionSummaries successfully', function(done) {
+        //uncomment below and update the code to test listFunctionSummaries
+        //instance.listFunctionSummaries(function(error) {
+        //  if (error) throw error;
+        //expect().to.be();
+        //});
+        done();
+      });
+    });
     describe('listFunctions', function() {
       it('should call listFunctions successfully', function(done) {
         //uncomment below and update the code to test listFunctions
@@ -22,6 +22,7 @@ from typing_extensions import Annotated
 from openapi_client.models.function import Function
 from openapi_client.models.function_job import FunctionJob
 from openapi_client.models.function_job_collection import FunctionJobCollection
+from openapi_client.models.function_summary import FunctionSummary
 
 from openapi_client.api_client import ApiClient, RequestSerialized
 from openapi_client.api_response import ApiResponse
@@ -888,9 +889,310 @@ class FunctionApi:
 
 
 
+    @validate_call
+    def list_function_summaries(
+        self,
+        fields: Annotated[Optional[StrictStr], Field(description="Comma-separated fields of the functions to return")] = None,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[FunctionSummary]:
+        """List Function Summaries
+
+        List summaries of the functions in the store, in id order, with only the selected fields read from the database (by default, not the schemas).  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     fields: Comma-separated fields of the functions to return, among the         fields of a function (default: id,name,type,tags). The id is         always returned.     limit: Maximum number of functions to return (default: 100)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of the functions with the selected fields  Raises:     HTTPException: If a field is not a field of functions
+
+        :param fields: Comma-separated fields of the functions to return
+        :type fields: str
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._list_function_summaries_serialize(
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[FunctionSummary]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def list_function_summaries_with_http_info(
+        self,
+        fields: Annotated[Optional[StrictStr], Field(description="Comma-separated fields of the functions to return")] = None,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[FunctionSummary]]:
+        """List Function Summaries
+
+        List summaries of the functions in the store, in id order, with only the selected fields read from the database (by default, not the schemas).  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     fields: Comma-separated fields of the functions to return, among the         fields of a function (default: id,name,type,tags). The id is         always returned.     limit: Maximum number of functions to return (default: 100)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of the functions with the selected fields  Raises:     HTTPException: If a field is not a field of functions
+
+        :param fields: Comma-separated fields of the functions to return
+        :type fields: str
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._list_function_summaries_serialize(
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[FunctionSummary]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def list_function_summaries_without_preload_content(
+        self,
+        fields: Annotated[Optional[StrictStr], Field(description="Comma-separated fields of the functions to return")] = None,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """List Function Summaries
+
+        List summaries of the functions in the store, in id order, with only the selected fields read from the database (by default, not the schemas).  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     fields: Comma-separated fields of the functions to return, among the         fields of a function (default: id,name,type,tags). The id is         always returned.     limit: Maximum number of functions to return (default: 100)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of the functions with the selected fields  Raises:     HTTPException: If a field is not a field of functions
+
+        :param fields: Comma-separated fields of the functions to return
+        :type fields: str
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._list_function_summaries_serialize(
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[FunctionSummary]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _list_function_summaries_serialize(
+        self,
+        fields,
+        limit,
+        cursor,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if fields is not None:
+            
+            _query_params.append(('fields', fields))
+            
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/function/summary',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
     @validate_call
     def list_functions(
         self,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -906,8 +1208,12 @@ class FunctionApi:
     ) -> List[Function]:
         """List Functions
 
-        List all functions in the store.  Returns:     List of all registered functions
+        List all functions in the store, in id order.  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of all registered functions
 
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -931,6 +1237,8 @@ class FunctionApi:
         """ # noqa: E501
 
         _param = self._list_functions_serialize(
+            limit=limit,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -939,6 +1247,7 @@ class FunctionApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "List[Function]",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -954,6 +1263,8 @@ class FunctionApi:
     @validate_call
     def list_functions_with_http_info(
         self,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -969,8 +1280,12 @@ class FunctionApi:
     ) -> ApiResponse[List[Function]]:
         """List Functions
 
-        List all functions in the store.  Returns:     List of all registered functions
+        List all functions in the store, in id order.  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of all registered functions
 
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -994,6 +1309,8 @@ class FunctionApi:
         """ # noqa: E501
 
         _param = self._list_functions_serialize(
+            limit=limit,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1002,6 +1319,7 @@ class FunctionApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "List[Function]",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1017,6 +1335,8 @@ class FunctionApi:
     @validate_call
     def list_functions_without_preload_content(
         self,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1032,8 +1352,12 @@ class FunctionApi:
     ) -> RESTResponseType:
         """List Functions
 
-        List all functions in the store.  Returns:     List of all registered functions
+        List all functions in the store, in id order.  Listings carry an ETag: when sent back in If-None-Match, the answer is a 304 while no function was created or deleted.  Parameters:     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of all registered functions
 
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1057,6 +1381,8 @@ class FunctionApi:
         """ # noqa: E501
 
         _param = self._list_functions_serialize(
+            limit=limit,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1065,6 +1391,7 @@ class FunctionApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "List[Function]",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1075,6 +1402,8 @@ class FunctionApi:
 
     def _list_functions_serialize(
         self,
+        limit,
+        cursor,
         _request_auth,
         _content_type,
         _headers,
@@ -1097,6 +1426,14 @@ class FunctionApi:
 
         # process the path parameters
         # process the query parameters
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -1447,6 +1784,8 @@ class FunctionApi:
         self,
         function_id: StrictInt,
         inputs: StrictStr,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=300, strict=True, ge=0)], Annotated[int, Field(le=300, strict=True, ge=0)]]], Field(description="Seconds to wait for the job to finish at most")] = None,
+        sync: Annotated[Optional[StrictBool], Field(description="Run the function in the request and return when it finished")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1462,12 +1801,16 @@ class FunctionApi:
     ) -> FunctionJob:
         """Run Function
 
-        Run a function with the given inputs. Validates inputs and outputs against JSON Schema if defined.
+        Run a function with the given inputs.  The job is enqueued and returned right away as PENDING, to be executed by the workers like the jobs of map_function; poll it with get_function_job or wait_for_function_job. With wait, the job is returned as soon as it finished, or still PENDING or RUNNING when the wait timed out.  With sync, the function is run in the request as before, occupying a server thread until it finished. Either way, dict results are the outputs of the job, other results are stored as {"result": value}, and outputs that do not match the output schema fail the job.  Parameters:     function_id: ID of the function     inputs: JSON-encoded inputs     wait: Seconds to wait for the job to finish at most     sync: Run the function in the request  Returns:     The function job, FAILED if the inputs do not match the input schema  Raises:     HTTPException: If function is not found (404) or inputs are invalid         JSON (400)
 
         :param function_id: (required)
         :type function_id: int
         :param inputs: (required)
         :type inputs: str
+        :param wait: Seconds to wait for the job to finish at most
+        :type wait: float
+        :param sync: Run the function in the request and return when it finished
+        :type sync: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1493,6 +1836,8 @@ class FunctionApi:
         _param = self._run_function_serialize(
             function_id=function_id,
             inputs=inputs,
+            wait=wait,
+            sync=sync,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1519,6 +1864,8 @@ class FunctionApi:
         self,
         function_id: StrictInt,
         inputs: StrictStr,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=300, strict=True, ge=0)], Annotated[int, Field(le=300, strict=True, ge=0)]]], Field(description="Seconds to wait for the job to finish at most")] = None,
+        sync: Annotated[Optional[StrictBool], Field(description="Run the function in the request and return when it finished")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1534,12 +1881,16 @@ class FunctionApi:
     ) -> ApiResponse[FunctionJob]:
         """Run Function
 
-        Run a function with the given inputs. Validates inputs and outputs against JSON Schema if defined.
+        Run a function with the given inputs.  The job is enqueued and returned right away as PENDING, to be executed by the workers like the jobs of map_function; poll it with get_function_job or wait_for_function_job. With wait, the job is returned as soon as it finished, or still PENDING or RUNNING when the wait timed out.  With sync, the function is run in the request as before, occupying a server thread until it finished. Either way, dict results are the outputs of the job, other results are stored as {"result": value}, and outputs that do not match the output schema fail the job.  Parameters:     function_id: ID of the function     inputs: JSON-encoded inputs     wait: Seconds to wait for the job to finish at most     sync: Run the function in the request  Returns:     The function job, FAILED if the inputs do not match the input schema  Raises:     HTTPException: If function is not found (404) or inputs are invalid         JSON (400)
 
         :param function_id: (required)
         :type function_id: int
         :param inputs: (required)
         :type inputs: str
+        :param wait: Seconds to wait for the job to finish at most
+        :type wait: float
+        :param sync: Run the function in the request and return when it finished
+        :type sync: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1565,6 +1916,8 @@ class FunctionApi:
         _param = self._run_function_serialize(
             function_id=function_id,
             inputs=inputs,
+            wait=wait,
+            sync=sync,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1591,6 +1944,8 @@ class FunctionApi:
         self,
         function_id: StrictInt,
         inputs: StrictStr,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=300, strict=True, ge=0)], Annotated[int, Field(le=300, strict=True, ge=0)]]], Field(description="Seconds to wait for the job to finish at most")] = None,
+        sync: Annotated[Optional[StrictBool], Field(description="Run the function in the request and return when it finished")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1606,12 +1961,16 @@ class FunctionApi:
     ) -> RESTResponseType:
         """Run Function
 
-        Run a function with the given inputs. Validates inputs and outputs against JSON Schema if defined.
+        Run a function with the given inputs.  The job is enqueued and returned right away as PENDING, to be executed by the workers like the jobs of map_function; poll it with get_function_job or wait_for_function_job. With wait, the job is returned as soon as it finished, or still PENDING or RUNNING when the wait timed out.  With sync, the function is run in the request as before, occupying a server thread until it finished. Either way, dict results are the outputs of the job, other results are stored as {"result": value}, and outputs that do not match the output schema fail the job.  Parameters:     function_id: ID of the function     inputs: JSON-encoded inputs     wait: Seconds to wait for the job to finish at most     sync: Run the function in the request  Returns:     The function job, FAILED if the inputs do not match the input schema  Raises:     HTTPException: If function is not found (404) or inputs are invalid         JSON (400)
 
         :param function_id: (required)
         :type function_id: int
         :param inputs: (required)
         :type inputs: str
+        :param wait: Seconds to wait for the job to finish at most
+        :type wait: float
+        :param sync: Run the function in the request and return when it finished
+        :type sync: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1637,6 +1996,8 @@ class FunctionApi:
         _param = self._run_function_serialize(
             function_id=function_id,
             inputs=inputs,
+            wait=wait,
+            sync=sync,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1658,6 +2019,8 @@ class FunctionApi:
         self,
         function_id,
         inputs,
+        wait,
+        sync,
         _request_auth,
         _content_type,
         _headers,
@@ -1686,6 +2049,14 @@ class FunctionApi:
             
             _query_params.append(('inputs', inputs))
             
+        if wait is not None:
+            
+            _query_params.append(('wait', wait))
+            
+        if sync is not None:
+            
+            _query_params.append(('sync', sync))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -1722,6 +2093,305 @@ class FunctionApi:
 
 
 
+    @validate_call
+    def search_functions(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for")],
+        limit: Annotated[Optional[Annotated[int, Field(le=100, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of functions to skip")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Function]:
+        """Search Functions
+
+        Full-text search over the names, descriptions and tags of the functions, for search-as-you-type.  Parameters:     q: Words to search for. Each must be the start of a word of the name,         description or tags of a function (case-insensitive)     limit: Maximum number of functions to return (default: 20)     offset: Number of functions to skip, for the next pages of results  Returns:     The matching functions, best match first: matches in names rank     above matches in tags, which rank above matches in descriptions
+
+        :param q: Words to search for (required)
+        :type q: str
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param offset: Number of functions to skip
+        :type offset: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._search_functions_serialize(
+            q=q,
+            limit=limit,
+            offset=offset,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Function]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def search_functions_with_http_info(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for")],
+        limit: Annotated[Optional[Annotated[int, Field(le=100, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of functions to skip")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Function]]:
+        """Search Functions
+
+        Full-text search over the names, descriptions and tags of the functions, for search-as-you-type.  Parameters:     q: Words to search for. Each must be the start of a word of the name,         description or tags of a function (case-insensitive)     limit: Maximum number of functions to return (default: 20)     offset: Number of functions to skip, for the next pages of results  Returns:     The matching functions, best match first: matches in names rank     above matches in tags, which rank above matches in descriptions
+
+        :param q: Words to search for (required)
+        :type q: str
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param offset: Number of functions to skip
+        :type offset: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._search_functions_serialize(
+            q=q,
+            limit=limit,
+            offset=offset,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Function]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def search_functions_without_preload_content(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for")],
+        limit: Annotated[Optional[Annotated[int, Field(le=100, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of functions to skip")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Search Functions
+
+        Full-text search over the names, descriptions and tags of the functions, for search-as-you-type.  Parameters:     q: Words to search for. Each must be the start of a word of the name,         description or tags of a function (case-insensitive)     limit: Maximum number of functions to return (default: 20)     offset: Number of functions to skip, for the next pages of results  Returns:     The matching functions, best match first: matches in names rank     above matches in tags, which rank above matches in descriptions
+
+        :param q: Words to search for (required)
+        :type q: str
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param offset: Number of functions to skip
+        :type offset: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._search_functions_serialize(
+            q=q,
+            limit=limit,
+            offset=offset,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Function]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _search_functions_serialize(
+        self,
+        q,
+        limit,
+        offset,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if q is not None:
+            
+            _query_params.append(('q', q))
+            
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if offset is not None:
+            
+            _query_params.append(('offset', offset))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/function/search',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
     @validate_call
     def search_functions_by_name(
         self,
@@ -1992,6 +2662,8 @@ class FunctionApi:
         self,
         tags: Annotated[List[StrictStr], Field(description="Tags to search for")],
         match_all: Annotated[Optional[StrictBool], Field(description="If True, functions must have all tags. If False, functions must have any of the tags.")] = None,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2007,12 +2679,16 @@ class FunctionApi:
     ) -> List[Function]:
         """Search Functions By Tags
 
-        Search for functions by tags.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.  Returns:     List of functions that match the tag criteria
+        Search for functions by tags, in id order.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of functions that match the tag criteria
 
         :param tags: Tags to search for (required)
         :type tags: List[str]
         :param match_all: If True, functions must have all tags. If False, functions must have any of the tags.
         :type match_all: bool
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2038,6 +2714,8 @@ class FunctionApi:
         _param = self._search_functions_by_tags_serialize(
             tags=tags,
             match_all=match_all,
+            limit=limit,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2064,6 +2742,8 @@ class FunctionApi:
         self,
         tags: Annotated[List[StrictStr], Field(description="Tags to search for")],
         match_all: Annotated[Optional[StrictBool], Field(description="If True, functions must have all tags. If False, functions must have any of the tags.")] = None,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2079,12 +2759,16 @@ class FunctionApi:
     ) -> ApiResponse[List[Function]]:
         """Search Functions By Tags
 
-        Search for functions by tags.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.  Returns:     List of functions that match the tag criteria
+        Search for functions by tags, in id order.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of functions that match the tag criteria
 
         :param tags: Tags to search for (required)
         :type tags: List[str]
         :param match_all: If True, functions must have all tags. If False, functions must have any of the tags.
         :type match_all: bool
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2110,6 +2794,8 @@ class FunctionApi:
         _param = self._search_functions_by_tags_serialize(
             tags=tags,
             match_all=match_all,
+            limit=limit,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2136,6 +2822,8 @@ class FunctionApi:
         self,
         tags: Annotated[List[StrictStr], Field(description="Tags to search for")],
         match_all: Annotated[Optional[StrictBool], Field(description="If True, functions must have all tags. If False, functions must have any of the tags.")] = None,
+        limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of functions to return")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2151,12 +2839,16 @@ class FunctionApi:
     ) -> RESTResponseType:
         """Search Functions By Tags
 
-        Search for functions by tags.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.  Returns:     List of functions that match the tag criteria
+        Search for functions by tags, in id order.  Parameters:     tags: List of tags to search for     match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.     limit: Maximum number of functions to return (default: all)     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.  Returns:     List of functions that match the tag criteria
 
         :param tags: Tags to search for (required)
         :type tags: List[str]
         :param match_all: If True, functions must have all tags. If False, functions must have any of the tags.
         :type match_all: bool
+        :param limit: Maximum number of functions to return
+        :type limit: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2182,6 +2874,8 @@ class FunctionApi:
         _param = self._search_functions_by_tags_serialize(
             tags=tags,
             match_all=match_all,
+            limit=limit,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2203,6 +2897,8 @@ class FunctionApi:
         self,
         tags,
         match_all,
+        limit,
+        cursor,
         _request_auth,
         _content_type,
         _headers,
@@ -2234,6 +2930,14 @@ class FunctionApi:
             
             _query_params.append(('match_all', match_all))
             
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -309,7 +309,8 @@ class FunctionJobApi:
         self,
         function_id: Annotated[StrictInt, Field(description="ID of the function to get jobs for")],
         limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of jobs to return")] = None,
-        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip (deprecated, use cursor)")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         status: Annotated[Optional[JobStatus], Field(description="Filter by job status")] = None,
         start_date: Annotated[Optional[datetime], Field(description="Filter jobs after this date")] = None,
         end_date: Annotated[Optional[datetime], Field(description="Filter jobs before this date")] = None,
@@ -328,14 +329,16 @@ class FunctionJobApi:
     ) -> List[FunctionJob]:
         """Get Function Jobs
 
-        Get all jobs for a specific function with optional filtering and pagination.
+        Get all jobs for a specific function with optional filtering and pagination, oldest first. The cursor of the next page is returned in the X-Next-Cursor header.
 
         :param function_id: ID of the function to get jobs for (required)
         :type function_id: int
         :param limit: Maximum number of jobs to return
         :type limit: int
-        :param offset: Number of jobs to skip
+        :param offset: Number of jobs to skip (deprecated, use cursor)
         :type offset: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param status: Filter by job status
         :type status: JobStatus
         :param start_date: Filter jobs after this date
@@ -368,6 +371,7 @@ class FunctionJobApi:
             function_id=function_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             status=status,
             start_date=start_date,
             end_date=end_date,
@@ -397,7 +401,8 @@ class FunctionJobApi:
         self,
         function_id: Annotated[StrictInt, Field(description="ID of the function to get jobs for")],
         limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of jobs to return")] = None,
-        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip (deprecated, use cursor)")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         status: Annotated[Optional[JobStatus], Field(description="Filter by job status")] = None,
         start_date: Annotated[Optional[datetime], Field(description="Filter jobs after this date")] = None,
         end_date: Annotated[Optional[datetime], Field(description="Filter jobs before this date")] = None,
@@ -416,14 +421,16 @@ class FunctionJobApi:
     ) -> ApiResponse[List[FunctionJob]]:
         """Get Function Jobs
 
-        Get all jobs for a specific function with optional filtering and pagination.
+        Get all jobs for a specific function with optional filtering and pagination, oldest first. The cursor of the next page is returned in the X-Next-Cursor header.
 
         :param function_id: ID of the function to get jobs for (required)
         :type function_id: int
         :param limit: Maximum number of jobs to return
         :type limit: int
-        :param offset: Number of jobs to skip
+        :param offset: Number of jobs to skip (deprecated, use cursor)
         :type offset: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param status: Filter by job status
         :type status: JobStatus
         :param start_date: Filter jobs after this date
@@ -456,6 +463,7 @@ class FunctionJobApi:
             function_id=function_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             status=status,
             start_date=start_date,
             end_date=end_date,
@@ -485,7 +493,8 @@ class FunctionJobApi:
         self,
         function_id: Annotated[StrictInt, Field(description="ID of the function to get jobs for")],
         limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of jobs to return")] = None,
-        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip (deprecated, use cursor)")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         status: Annotated[Optional[JobStatus], Field(description="Filter by job status")] = None,
         start_date: Annotated[Optional[datetime], Field(description="Filter jobs after this date")] = None,
         end_date: Annotated[Optional[datetime], Field(description="Filter jobs before this date")] = None,
@@ -504,14 +513,16 @@ class FunctionJobApi:
     ) -> RESTResponseType:
         """Get Function Jobs
 
-        Get all jobs for a specific function with optional filtering and pagination.
+        Get all jobs for a specific function with optional filtering and pagination, oldest first. The cursor of the next page is returned in the X-Next-Cursor header.
 
         :param function_id: ID of the function to get jobs for (required)
         :type function_id: int
         :param limit: Maximum number of jobs to return
         :type limit: int
-        :param offset: Number of jobs to skip
+        :param offset: Number of jobs to skip (deprecated, use cursor)
         :type offset: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param status: Filter by job status
         :type status: JobStatus
         :param start_date: Filter jobs after this date
@@ -544,6 +555,7 @@ class FunctionJobApi:
             function_id=function_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             status=status,
             start_date=start_date,
             end_date=end_date,
@@ -569,6 +581,7 @@ class FunctionJobApi:
         function_id,
         limit,
         offset,
+        cursor,
         status,
         start_date,
         end_date,
@@ -604,6 +617,10 @@ class FunctionJobApi:
             
             _query_params.append(('offset', offset))
             
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         if status is not None:
             
             _query_params.append(('status', status.value))
@@ -940,7 +957,8 @@ class FunctionJobApi:
     def list_function_jobs(
         self,
         limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of jobs to return")] = None,
-        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip (deprecated, use cursor)")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         status: Annotated[Optional[JobStatus], Field(description="Filter by job status")] = None,
         function_id: Annotated[Optional[StrictInt], Field(description="Filter by function ID")] = None,
         start_date: Annotated[Optional[datetime], Field(description="Filter jobs after this date")] = None,
@@ -960,12 +978,14 @@ class FunctionJobApi:
     ) -> List[FunctionJob]:
         """List all function jobs with optional filtering
 
-        List all function jobs with optional filtering and pagination.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0)     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
+        List all function jobs with optional filtering and pagination, most recent first.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0), deprecated         in favor of cursor     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
 
         :param limit: Maximum number of jobs to return
         :type limit: int
-        :param offset: Number of jobs to skip
+        :param offset: Number of jobs to skip (deprecated, use cursor)
         :type offset: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param status: Filter by job status
         :type status: JobStatus
         :param function_id: Filter by function ID
@@ -999,6 +1019,7 @@ class FunctionJobApi:
         _param = self._list_function_jobs_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             status=status,
             function_id=function_id,
             start_date=start_date,
@@ -1028,7 +1049,8 @@ class FunctionJobApi:
     def list_function_jobs_with_http_info(
         self,
         limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of jobs to return")] = None,
-        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip (deprecated, use cursor)")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         status: Annotated[Optional[JobStatus], Field(description="Filter by job status")] = None,
         function_id: Annotated[Optional[StrictInt], Field(description="Filter by function ID")] = None,
         start_date: Annotated[Optional[datetime], Field(description="Filter jobs after this date")] = None,
@@ -1048,12 +1070,14 @@ class FunctionJobApi:
     ) -> ApiResponse[List[FunctionJob]]:
         """List all function jobs with optional filtering
 
-        List all function jobs with optional filtering and pagination.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0)     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
+        List all function jobs with optional filtering and pagination, most recent first.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0), deprecated         in favor of cursor     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
 
         :param limit: Maximum number of jobs to return
         :type limit: int
-        :param offset: Number of jobs to skip
+        :param offset: Number of jobs to skip (deprecated, use cursor)
         :type offset: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param status: Filter by job status
         :type status: JobStatus
         :param function_id: Filter by function ID
@@ -1087,6 +1111,7 @@ class FunctionJobApi:
         _param = self._list_function_jobs_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             status=status,
             function_id=function_id,
             start_date=start_date,
@@ -1116,7 +1141,8 @@ class FunctionJobApi:
     def list_function_jobs_without_preload_content(
         self,
         limit: Annotated[Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]], Field(description="Maximum number of jobs to return")] = None,
-        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip")] = None,
+        offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of jobs to skip (deprecated, use cursor)")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor of the page, from the X-Next-Cursor header")] = None,
         status: Annotated[Optional[JobStatus], Field(description="Filter by job status")] = None,
         function_id: Annotated[Optional[StrictInt], Field(description="Filter by function ID")] = None,
         start_date: Annotated[Optional[datetime], Field(description="Filter jobs after this date")] = None,
@@ -1136,12 +1162,14 @@ class FunctionJobApi:
     ) -> RESTResponseType:
         """List all function jobs with optional filtering
 
-        List all function jobs with optional filtering and pagination.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0)     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
+        List all function jobs with optional filtering and pagination, most recent first.  Parameters:     limit: Maximum number of jobs to return (default: all)     offset: Number of jobs to skip for pagination (default: 0), deprecated         in favor of cursor     cursor: Cursor of the page to return, as returned in the X-Next-Cursor         header of the previous page. The header is absent on the last page.     status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)     function_id: Filter jobs for a specific function     start_date: Include jobs created after this date     end_date: Include jobs created before this date  Returns:     List[FunctionJob]: A filtered list of function jobs
 
         :param limit: Maximum number of jobs to return
         :type limit: int
-        :param offset: Number of jobs to skip
+        :param offset: Number of jobs to skip (deprecated, use cursor)
         :type offset: int
+        :param cursor: Cursor of the page, from the X-Next-Cursor header
+        :type cursor: str
         :param status: Filter by job status
         :type status: JobStatus
         :param function_id: Filter by function ID
@@ -1175,6 +1203,7 @@ class FunctionJobApi:
         _param = self._list_function_jobs_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             status=status,
             function_id=function_id,
             start_date=start_date,
@@ -1200,6 +1229,7 @@ class FunctionJobApi:
         self,
         limit,
         offset,
+        cursor,
         status,
         function_id,
         start_date,
@@ -1234,6 +1264,10 @@ class FunctionJobApi:
             
             _query_params.append(('offset', offset))
             
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         if status is not None:
             
             _query_params.append(('status', status.value))
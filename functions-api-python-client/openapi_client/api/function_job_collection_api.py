@@ -16,8 +16,9 @@ from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
-from pydantic import StrictInt
-from typing import List
+from pydantic import Field, StrictBool, StrictInt
+from typing import List, Optional
+from typing_extensions import Annotated
 from openapi_client.models.function_job_collection import FunctionJobCollection
 
 from openapi_client.api_client import ApiClient, RequestSerialized
@@ -318,6 +319,7 @@ class FunctionJobCollectionApi:
     def get_collection_status(
         self,
         collection_id: StrictInt,
+        include_job_ids: Annotated[Optional[StrictBool], Field(description="Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -333,10 +335,12 @@ class FunctionJobCollectionApi:
     ) -> FunctionJobCollection:
         """Get Collection Status
 
-        Get status of a function job collection.  Parameters:     collection_id: ID of the collection to check  Returns:     Collection details including current status of all jobs
+        Get status of a function job collection.  The number of jobs per status is maintained as jobs change status, so with include_job_ids=false this is a constant-time read of a single row however large the collection. By default the IDs of all jobs are read as well, which takes time proportional to the number of jobs.  Parameters:     collection_id: ID of the collection to check     include_job_ids: Whether to return the IDs of all jobs (default: true)  Returns:     Collection details including the number of jobs per status, the     fraction of finished jobs (progress) and when the first and last jobs     finished
 
         :param collection_id: (required)
         :type collection_id: int
+        :param include_job_ids: Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.
+        :type include_job_ids: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -361,6 +365,7 @@ class FunctionJobCollectionApi:
 
         _param = self._get_collection_status_serialize(
             collection_id=collection_id,
+            include_job_ids=include_job_ids,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -386,6 +391,7 @@ class FunctionJobCollectionApi:
     def get_collection_status_with_http_info(
         self,
         collection_id: StrictInt,
+        include_job_ids: Annotated[Optional[StrictBool], Field(description="Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -401,10 +407,12 @@ class FunctionJobCollectionApi:
     ) -> ApiResponse[FunctionJobCollection]:
         """Get Collection Status
 
-        Get status of a function job collection.  Parameters:     collection_id: ID of the collection to check  Returns:     Collection details including current status of all jobs
+        Get status of a function job collection.  The number of jobs per status is maintained as jobs change status, so with include_job_ids=false this is a constant-time read of a single row however large the collection. By default the IDs of all jobs are read as well, which takes time proportional to the number of jobs.  Parameters:     collection_id: ID of the collection to check     include_job_ids: Whether to return the IDs of all jobs (default: true)  Returns:     Collection details including the number of jobs per status, the     fraction of finished jobs (progress) and when the first and last jobs     finished
 
         :param collection_id: (required)
         :type collection_id: int
+        :param include_job_ids: Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.
+        :type include_job_ids: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -429,6 +437,7 @@ class FunctionJobCollectionApi:
 
         _param = self._get_collection_status_serialize(
             collection_id=collection_id,
+            include_job_ids=include_job_ids,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -454,6 +463,7 @@ class FunctionJobCollectionApi:
     def get_collection_status_without_preload_content(
         self,
         collection_id: StrictInt,
+        include_job_ids: Annotated[Optional[StrictBool], Field(description="Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -469,10 +479,12 @@ class FunctionJobCollectionApi:
     ) -> RESTResponseType:
         """Get Collection Status
 
-        Get status of a function job collection.  Parameters:     collection_id: ID of the collection to check  Returns:     Collection details including current status of all jobs
+        Get status of a function job collection.  The number of jobs per status is maintained as jobs change status, so with include_job_ids=false this is a constant-time read of a single row however large the collection. By default the IDs of all jobs are read as well, which takes time proportional to the number of jobs.  Parameters:     collection_id: ID of the collection to check     include_job_ids: Whether to return the IDs of all jobs (default: true)  Returns:     Collection details including the number of jobs per status, the     fraction of finished jobs (progress) and when the first and last jobs     finished
 
         :param collection_id: (required)
         :type collection_id: int
+        :param include_job_ids: Include the IDs of all jobs of the collection. Pollers should pass false: the status is then read from a single row.
+        :type include_job_ids: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -497,6 +509,7 @@ class FunctionJobCollectionApi:
 
         _param = self._get_collection_status_serialize(
             collection_id=collection_id,
+            include_job_ids=include_job_ids,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -517,6 +530,7 @@ class FunctionJobCollectionApi:
     def _get_collection_status_serialize(
         self,
         collection_id,
+        include_job_ids,
         _request_auth,
         _content_type,
         _headers,
@@ -541,6 +555,10 @@ class FunctionJobCollectionApi:
         if collection_id is not None:
             _path_params['collection_id'] = collection_id
         # process the query parameters
+        if include_job_ids is not None:
+            
+            _query_params.append(('include_job_ids', include_job_ids))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -0,0 +1,121 @@
+# coding: utf-8
+
+"""
+Submitting a parameter matrix as a batch, one job per row.
+
+The rows of a pandas DataFrame are sent as a single CSV or JSON columns
+payload instead of one JSON string per row, and fanned out into jobs by the
+server.
+
+    import pandas as pd
+    from openapi_client.columnar import batch_run_dataframe
+
+    design = pd.read_csv("results_Final_50LHS_TitrationProcessed.csv")
+    collection = batch_run_dataframe(function.id, design, "LHS sweep", api_client)
+
+The results of a collection are read back the same way, as one table with
+a row per job instead of one request per job:
+
+    results = collection_results_dataframe(collection.id, api_client)
+"""
+
+import io
+from typing import Any, Optional
+
+from openapi_client.api_client import ApiClient
+from openapi_client.exceptions import ApiException
+from openapi_client.models.function_job_collection import FunctionJobCollection
+
+FORMATS = {
+    "csv": "text/csv",
+    "json": "application/json",
+}
+
+
+def _serialize(frame: Any, format: str) -> Any:
+    if format == "csv":
+        return frame.to_csv(index=False)
+    # Columns are JSON-encoded by the REST client, missing values as null
+    return frame.astype(object).where(frame.notna(), None).to_dict("list")
+
+
+def batch_run_dataframe(
+    function_id: int,
+    frame: Any,
+    collection_name: str,
+    api_client: Optional[ApiClient] = None,
+    format: str = "csv",
+) -> FunctionJobCollection:
+    """
+    Run a function with each row of a DataFrame and create a job collection.
+
+    :param frame: pandas DataFrame with one column per input of the function
+    :param format: Payload sent to the server, "csv" or "json" (columns)
+    :return: The created collection, with the ids of the jobs in row order
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format {format}, expected one of {list(FORMATS)}")
+    api_client = api_client or ApiClient.get_default()
+    method, url, headers, body, post_params = api_client.param_serialize(
+        method="POST",
+        resource_path="/function/{function_id}/batch/columns",
+        path_params={"function_id": function_id},
+        query_params=[("collection_name", collection_name)],
+        header_params={"Content-Type": FORMATS[format], "Accept": "application/json"},
+        body=_serialize(frame, format),
+    )
+    response = api_client.call_api(method, url, headers, body, post_params)
+    response.read()
+    return api_client.response_deserialize(
+        response_data=response,
+        response_types_map={
+            "200": "FunctionJobCollection",
+            "422": "HTTPValidationError",
+        },
+    ).data
+
+
+def collection_results_dataframe(
+    collection_id: int,
+    api_client: Optional[ApiClient] = None,
+    format: str = "csv",
+) -> Any:
+    """
+    Get the results of a function job collection as a pandas DataFrame, with
+    one row per job: its id, status, inputs.<name> and outputs.<name>
+    columns, and the error of failed jobs.
+
+    :param format: Table format requested from the server: "csv" or
+        "ndjson", or "parquet" or "arrow" if pyarrow is installed on both
+        ends
+    """
+    import pandas as pd
+
+    api_client = api_client or ApiClient.get_default()
+    method, url, headers, body, post_params = api_client.param_serialize(
+        method="GET",
+        resource_path="/functionJobCollection/{collection_id}/results",
+        path_params={"collection_id": collection_id},
+        query_params=[("format", format)],
+    )
+    response = api_client.call_api(method, url, headers, body, post_params)
+    if not 200 <= response.status <= 299:
+        response.read()
+        raise ApiException.from_response(
+            http_resp=response, body=response.data.decode("utf-8"), data=None
+        )
+    # The table is parsed as it is streamed, except for the binary formats
+    stream = response.response
+    try:
+        if format == "csv":
+            return pd.read_csv(stream)
+        if format == "ndjson":
+            return pd.read_json(stream, lines=True)
+        data = io.BytesIO(stream.read())
+        if format == "parquet":
+            return pd.read_parquet(data)
+        import pyarrow.ipc
+
+        return pyarrow.ipc.open_stream(data).read_all().to_pandas()
+    finally:
+        stream.release_conn()
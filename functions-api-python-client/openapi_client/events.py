@@ -0,0 +1,235 @@
+# coding: utf-8
+
+"""
+Following the progress of function jobs and collections without polling.
+
+The server streams the status transitions of a job, and the progress and
+outputs of the jobs of a collection, as Server-Sent Events over a single
+connection, and offers long-poll endpoints which return once a job or a
+collection finished.
+
+    from openapi_client.events import iter_collection_events, wait_for_collection
+
+    for event in iter_collection_events(collection.id, api_client):
+        if event.event == "job":
+            print(event.data.id, event.data.outputs)
+
+    collection = wait_for_collection(collection.id, api_client, timeout=600)
+"""
+
+import json
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from openapi_client.api_client import ApiClient
+from openapi_client.exceptions import ApiException
+from openapi_client.models.function_job import FunctionJob
+from openapi_client.models.function_job_collection import FunctionJobCollection
+
+# Longest wait the server accepts per long-poll request
+MAX_WAIT_SECONDS = 300
+
+# Model of the data of each event type
+EVENT_MODELS = {
+    "status": FunctionJob,
+    "job": FunctionJob,
+    "progress": FunctionJobCollection,
+    "done": FunctionJobCollection,
+}
+
+
+class ServerSentEvent:
+    """An event of a stream; data is a model for the known event types"""
+
+    def __init__(self, event: str, data: Any, id: Optional[str] = None) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, id={self.id!r}, data={self.data!r})"
+
+
+def parse_events(lines: Iterator[bytes]) -> Iterator[ServerSentEvent]:
+    """Parse the lines of a text/event-stream body into events"""
+    event, event_id, data = "message", None, []
+    for raw in lines:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data:
+                payload = json.loads("\n".join(data))
+                model = EVENT_MODELS.get(event)
+                yield ServerSentEvent(
+                    event, model.from_dict(payload) if model else payload, event_id
+                )
+            event, data = "message", []
+            continue
+        if line.startswith(":"):
+            # Keepalive comment
+            continue
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+        elif field == "id":
+            event_id = value
+
+
+def _request(
+    api_client: ApiClient,
+    resource_path: str,
+    path_params: Dict[str, Any],
+    query_params: Optional[list] = None,
+    header_params: Optional[Dict[str, str]] = None,
+    accept: str = "application/json",
+    request_timeout: Any = None,
+):
+    headers = dict(header_params or {})
+    headers["Accept"] = accept
+    method, url, headers, body, post_params = api_client.param_serialize(
+        method="GET",
+        resource_path=resource_path,
+        path_params=path_params,
+        query_params=query_params or [],
+        header_params=headers,
+    )
+    return api_client.call_api(
+        method, url, headers, body, post_params, _request_timeout=request_timeout
+    )
+
+
+def _iter_events(
+    api_client: Optional[ApiClient],
+    resource_path: str,
+    path_params: Dict[str, Any],
+    header_params: Optional[Dict[str, str]] = None,
+) -> Iterator[ServerSentEvent]:
+    api_client = api_client or ApiClient.get_default()
+    response = _request(
+        api_client,
+        resource_path,
+        path_params,
+        header_params=header_params,
+        accept="text/event-stream",
+    )
+    if not 200 <= response.status <= 299:
+        response.read()
+        raise ApiException.from_response(
+            http_resp=response, body=response.data.decode("utf-8"), data=None
+        )
+    try:
+        yield from parse_events(response.response)
+    finally:
+        response.response.release_conn()
+
+
+def iter_job_events(
+    function_job_id: int, api_client: Optional[ApiClient] = None
+) -> Iterator[ServerSentEvent]:
+    """
+    Iterate over the status transitions of a function job, as "status"
+    events with the job. The iteration ends once the job completed or failed.
+    """
+    return _iter_events(
+        api_client,
+        "/functionJob/{function_job_id}/events",
+        {"function_job_id": function_job_id},
+    )
+
+
+def iter_collection_events(
+    collection_id: int,
+    api_client: Optional[ApiClient] = None,
+    last_event_id: Optional[str] = None,
+) -> Iterator[ServerSentEvent]:
+    """
+    Iterate over the progress of a function job collection: "progress"
+    events with the collection when its job counts change, "job" events with
+    each job that completed or failed, and a final "done" event.
+
+    :param last_event_id: id of the last "job" event received, to resume an
+        interrupted iteration without receiving the same jobs again
+    """
+    return _iter_events(
+        api_client,
+        "/functionJobCollection/{collection_id}/events",
+        {"collection_id": collection_id},
+        {"Last-Event-ID": last_event_id} if last_event_id else None,
+    )
+
+
+def _wait(
+    api_client: Optional[ApiClient],
+    resource_path: str,
+    path_params: Dict[str, Any],
+    response_type: str,
+    finished: Any,
+    timeout: Optional[float],
+) -> Any:
+    """Repeat long polls until finished(result) or the timeout expired"""
+    api_client = api_client or ApiClient.get_default()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        wait = MAX_WAIT_SECONDS
+        if deadline is not None:
+            wait = max(0.0, min(wait, deadline - time.monotonic()))
+        response = _request(
+            api_client,
+            resource_path,
+            path_params,
+            query_params=[("timeout", wait)],
+            # Leave the server time to answer before the request times out
+            request_timeout=wait + 30,
+        )
+        response.read()
+        result = api_client.response_deserialize(
+            response_data=response,
+            response_types_map={"200": response_type, "422": "HTTPValidationError"},
+        ).data
+        if finished(result) or (deadline is not None and time.monotonic() >= deadline):
+            return result
+
+
+def wait_for_job(
+    function_job_id: int,
+    api_client: Optional[ApiClient] = None,
+    timeout: Optional[float] = None,
+) -> FunctionJob:
+    """
+    Wait until a function job completed or failed.
+
+    :param timeout: Seconds to wait at most, None to wait as long as needed
+    :return: The job, still PENDING or RUNNING if the timeout expired
+    """
+    return _wait(
+        api_client,
+        "/functionJob/{function_job_id}/wait",
+        {"function_job_id": function_job_id},
+        "FunctionJob",
+        lambda job: job.status in ("COMPLETED", "FAILED"),
+        timeout,
+    )
+
+
+def wait_for_collection(
+    collection_id: int,
+    api_client: Optional[ApiClient] = None,
+    timeout: Optional[float] = None,
+) -> FunctionJobCollection:
+    """
+    Wait until all jobs of a function job collection completed or failed.
+
+    :param timeout: Seconds to wait at most, None to wait as long as needed
+    :return: The collection with its job counts and progress (without job
+        ids), not finished yet if the timeout expired
+    """
+    return _wait(
+        api_client,
+        "/functionJobCollection/{collection_id}/wait",
+        {"collection_id": collection_id},
+        "FunctionJobCollection",
+        lambda collection: (collection.progress or 0) >= 1.0,
+        timeout,
+    )
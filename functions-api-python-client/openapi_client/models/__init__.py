@@ -17,6 +17,7 @@
 from openapi_client.models.function import Function
 from openapi_client.models.function_job import FunctionJob
 from openapi_client.models.function_job_collection import FunctionJobCollection
+from openapi_client.models.function_summary import FunctionSummary
 from openapi_client.models.http_validation_error import HTTPValidationError
 from openapi_client.models.job_status import JobStatus
 from openapi_client.models.validation_error import ValidationError
@@ -17,8 +17,9 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
-from typing import Any, ClassVar, Dict, List, Optional
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional, Union
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -31,7 +32,11 @@ class FunctionJobCollection(BaseModel):
     description: Optional[StrictStr]
     job_ids: List[StrictInt]
     status: StrictStr
-    __properties: ClassVar[List[str]] = ["id", "name", "description", "job_ids", "status"]
+    job_counts: Optional[Dict[str, StrictInt]] = None
+    progress: Optional[Union[StrictFloat, StrictInt]] = None
+    first_finished_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    __properties: ClassVar[List[str]] = ["id", "name", "description", "job_ids", "status", "job_counts", "progress", "first_finished_at", "last_finished_at"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -82,6 +87,26 @@ class FunctionJobCollection(BaseModel):
         if self.description is None and "description" in self.model_fields_set:
             _dict['description'] = None
 
+        # set to None if job_counts (nullable) is None
+        # and model_fields_set contains the field
+        if self.job_counts is None and "job_counts" in self.model_fields_set:
+            _dict['job_counts'] = None
+
+        # set to None if progress (nullable) is None
+        # and model_fields_set contains the field
+        if self.progress is None and "progress" in self.model_fields_set:
+            _dict['progress'] = None
+
+        # set to None if first_finished_at (nullable) is None
+        # and model_fields_set contains the field
+        if self.first_finished_at is None and "first_finished_at" in self.model_fields_set:
+            _dict['first_finished_at'] = None
+
+        # set to None if last_finished_at (nullable) is None
+        # and model_fields_set contains the field
+        if self.last_finished_at is None and "last_finished_at" in self.model_fields_set:
+            _dict['last_finished_at'] = None
+
         return _dict
 
     @classmethod
@@ -98,7 +123,11 @@ class FunctionJobCollection(BaseModel):
             "name": obj.get("name"),
             "description": obj.get("description"),
             "job_ids": obj.get("job_ids"),
-            "status": obj.get("status")
+            "status": obj.get("status"),
+            "job_counts": obj.get("job_counts"),
+            "progress": obj.get("progress"),
+            "first_finished_at": obj.get("first_finished_at"),
+            "last_finished_at": obj.get("last_finished_at")
         })
         return _obj
 
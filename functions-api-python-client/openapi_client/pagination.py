@@ -0,0 +1,128 @@
+# coding: utf-8
+
+"""
+Lazy iteration over the cursor-paginated job listings and function searches.
+
+The listing endpoints return the cursor of the next page in the X-Next-Cursor
+response header. The iterators below follow it, requesting a page only once
+the previous one has been consumed.
+
+    from openapi_client.pagination import iter_function_jobs
+
+    for job in iter_function_jobs(api_client, status=JobStatus.FAILED):
+        print(job.id)
+"""
+
+from typing import Any, Callable, Iterator, List, Optional
+
+from openapi_client.api.function_api import FunctionApi
+from openapi_client.api.function_job_api import FunctionJobApi
+from openapi_client.api_client import ApiClient
+from openapi_client.models.function import Function
+from openapi_client.models.function_job import FunctionJob
+from openapi_client.models.function_summary import FunctionSummary
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100
+
+
+def next_cursor(headers: Optional[Any]) -> Optional[str]:
+    """Get the cursor of the next page from response headers, if any"""
+    if not headers:
+        return None
+    for name, value in headers.items():
+        if name.lower() == NEXT_CURSOR_HEADER.lower():
+            return value or None
+    return None
+
+
+def iter_pages(
+    fetch_page: Callable[..., Any], page_size: int = DEFAULT_PAGE_SIZE, **kwargs
+) -> Iterator[List[Any]]:
+    """
+    Iterate over the pages of a cursor-paginated listing.
+
+    :param fetch_page: The `*_with_http_info` method of the listing
+    :param page_size: Number of items requested per page
+    :param kwargs: Other parameters of the listing (filters)
+    """
+    cursor = None
+    while True:
+        response = fetch_page(limit=page_size, cursor=cursor, **kwargs)
+        yield response.data
+        cursor = next_cursor(response.headers)
+        if cursor is None:
+            return
+
+
+def iter_function_jobs(
+    api_client: Optional[ApiClient] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **filters,
+) -> Iterator[FunctionJob]:
+    """
+    Iterate over all function jobs, most recent first.
+
+    :param filters: Filters of list_function_jobs, e.g. status or function_id
+    """
+    api = FunctionJobApi(api_client)
+    for page in iter_pages(api.list_function_jobs_with_http_info, page_size, **filters):
+        yield from page
+
+
+def iter_jobs_of_function(
+    function_id: int,
+    api_client: Optional[ApiClient] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **filters,
+) -> Iterator[FunctionJob]:
+    """
+    Iterate over all jobs of a function, oldest first.
+
+    :param filters: Filters of get_function_jobs, e.g. status or start_date
+    """
+    api = FunctionJobApi(api_client)
+    for page in iter_pages(
+        api.get_function_jobs_with_http_info,
+        page_size,
+        function_id=function_id,
+        **filters,
+    ):
+        yield from page
+
+
+def iter_functions_by_tags(
+    tags: List[str],
+    match_all: bool = False,
+    api_client: Optional[ApiClient] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Function]:
+    """
+    Iterate over the functions with any, or all, of tags, in id order.
+    """
+    api = FunctionApi(api_client)
+    for page in iter_pages(
+        api.search_functions_by_tags_with_http_info,
+        page_size,
+        tags=tags,
+        match_all=match_all,
+    ):
+        yield from page
+
+
+def iter_function_summaries(
+    fields: Optional[str] = None,
+    api_client: Optional[ApiClient] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[FunctionSummary]:
+    """
+    Iterate over summaries of all functions, in id order.
+
+    :param fields: Comma-separated fields of the functions to return
+        (default: id,name,type,tags)
+    """
+    api = FunctionApi(api_client)
+    for page in iter_pages(
+        api.list_function_summaries_with_http_info, page_size, fields=fields
+    ):
+        yield from page
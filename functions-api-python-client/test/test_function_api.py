@@ -47,6 +47,13 @@ class TestFunctionApi(unittest.TestCase):
         """
         pass
 
+    def test_list_function_summaries(self) -> None:
+        """Test case for list_function_summaries
+
+        List Function Summaries
+        """
+        pass
+
     def test_list_functions(self) -> None:
         """Test case for list_functions
 
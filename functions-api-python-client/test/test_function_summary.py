@@ -0,0 +1,61 @@
+# coding: utf-8
+
+"""
+    Swagger Functions Store - OpenAPI 3.0
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+    The version of the OpenAPI document: 0.0.1
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import unittest
+
+from openapi_client.models.function_summary import FunctionSummary
+
+class TestFunctionSummary(unittest.TestCase):
+    """FunctionSummary unit test stubs"""
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def make_instance(self, include_optional) -> FunctionSummary:
+        """Test FunctionSummary
+            include_optional is a boolean, when False only required
+            params are included, when True both required and
+            optional params are included """
+        # uncomment below to create an instance of `FunctionSummary`
+        """
+        model = FunctionSummary()
+        if include_optional:
+            return FunctionSummary(
+                id = 56,
+                name = '',
+                type = '',
+                url = '',
+                description = '',
+                input_schema = None,
+                output_schema = None,
+                tags = [
+                    ''
+                    ]
+            )
+        else:
+            return FunctionSummary(
+                id = 56,
+        )
+        """
+
+    def testFunctionSummary(self):
+        """Test FunctionSummary"""
+        # inst_req_only = self.make_instance(include_optional=False)
+        # inst_req_and_optional = self.make_instance(include_optional=True)
+
+if __name__ == '__main__':
+    unittest.main()
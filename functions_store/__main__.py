@@ -0,0 +1,54 @@
+import argparse
+import logging
+
+from .job_queue import DEFAULT_LEASE_SECONDS
+from .worker import DEFAULT_CONCURRENCY, DEFAULT_POLL_INTERVAL, run_workers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="functions_store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    server = subparsers.add_parser("server", help="Run the API server")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8087)
+
+    worker = subparsers.add_parser("worker", help="Run job worker processes")
+    worker.add_argument(
+        "--processes", type=int, default=1, help="Number of worker processes"
+    )
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Jobs executed in parallel by each worker process",
+    )
+    worker.add_argument("--lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS)
+    worker.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL)
+
+    subparsers.add_parser("migrate", help="Apply pending database schema migrations")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "server":
+        import uvicorn
+
+        uvicorn.run("functions_store.main:app", host=args.host, port=args.port)
+    elif args.command == "worker":
+        run_workers(
+            processes=args.processes,
+            concurrency=args.concurrency,
+            lease_seconds=args.lease_seconds,
+            poll_interval=args.poll_interval,
+        )
+    elif args.command == "migrate":
+        from . import database
+        from .migrations import current_version, upgrade
+
+        applied = upgrade(database.engine, database.Base.metadata)
+        print(f"Applied migrations {applied}, schema version {current_version(database.engine)}")
+
+
+if __name__ == "__main__":
+    main()
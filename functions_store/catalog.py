@@ -0,0 +1,128 @@
+"""
+Version of the function catalog, for conditional requests of listings.
+
+Creating or deleting functions bumps the version, stored in the
+catalog_version table in the same transaction as the change. Listings of
+functions carry an ETag derived from it and from the request (path and query
+string), so a client revalidating an unchanged catalog with If-None-Match
+gets a 304 answer without any query of the functions.
+
+The version is read through a cache of refresh_seconds, like the limits of
+the scheduler: the process that changed the functions sees the new version
+right away, other API processes and nodes within refresh_seconds. The version
+is prefixed with a token drawn when the database was created, so ETags of
+another database never match.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from . import database
+
+REFRESH_SECONDS = float(os.environ.get("FUNCTIONS_STORE_CATALOG_CACHE_SECONDS", 1.0))
+
+# Browsers must revalidate listings before reusing them
+CACHE_CONTROL = "no-cache"
+
+ETAG_HEADERS = {
+    "ETag": {
+        "description": "Version of the listing, for If-None-Match",
+        "schema": {"type": "string"},
+    }
+}
+
+
+class CatalogVersion:
+    """Counter of the changes of the functions of the store"""
+
+    def __init__(self, refresh_seconds: float = REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._version: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+        # Incremented by invalidate(), so reads started before it are not kept
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """The version, re-read from the database every refresh_seconds"""
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._loaded_at is not None
+                and now - self._loaded_at <= self.refresh_seconds
+            ):
+                return self._version
+            generation = self._generation
+
+        db = database.SessionLocal()
+        try:
+            row = db.query(database.CatalogVersionDB).one()
+            version = f"{row.token}.{row.version}"
+        finally:
+            db.close()
+
+        with self._lock:
+            if generation == self._generation:
+                self._version, self._loaded_at = version, now
+        return version
+
+    @staticmethod
+    def bump(db: Session) -> None:
+        """
+        Record (without committing) a change of the functions, invalidating
+        all ETags once committed
+        """
+        catalog = database.CatalogVersionDB
+        db.query(catalog).update(
+            {catalog.version: catalog.version + 1}, synchronize_session=False
+        )
+
+    def invalidate(self) -> None:
+        """Make the next read re-read the version, after committing a bump"""
+        with self._lock:
+            self._loaded_at = None
+            self._generation += 1
+
+    def etag(self, request: Request) -> str:
+        """Strong ETag of the answer to a request at the current version"""
+        # Read before the database, so a tag is never newer than its body
+        version = self.version
+        target = f"{request.url.path}?{request.url.query}".encode("utf-8")
+        return f'"{version}.{hashlib.sha1(target).hexdigest()[:16]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(request: Request, response: Response) -> Optional[Response]:
+    """
+    Set the ETag of the listing answering a request, and check it against the
+    If-None-Match header of the request.
+
+    Returns:
+        A 304 response if the client has the current listing, None otherwise
+    """
+    etag = catalog_version.etag(request)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+catalog_version = CatalogVersion()
@@ -0,0 +1,347 @@
+"""
+Column-oriented batch inputs.
+
+Parameter sweeps are matrices with one column per input (e.g. LHS designs
+stored as CSV). They can be submitted as a whole instead of one JSON string
+per row, in one of the CONTENT_TYPES formats, and are fanned out into one
+input dict per row on the server.
+
+Column names are checked against the input schema once for the whole
+matrix, so a misnamed column rejects the batch instead of failing every job.
+
+The results of a collection are exported the other way around, as one table
+with a row per job, streamed in chunks.
+"""
+
+import io
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException
+
+from . import database, models
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+CSV = "text/csv"
+JSON = "application/json"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+ARROW_FILE = "application/vnd.apache.arrow.file"
+NPY = "application/x-npy"
+
+
+def _read_csv(body: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(body))
+
+
+def _read_json(body: bytes) -> pd.DataFrame:
+    columns = json.loads(body)
+    if not isinstance(columns, dict) or not all(
+        isinstance(values, list) for values in columns.values()
+    ):
+        raise ValueError("Expected an object mapping column names to lists of values")
+    return pd.DataFrame(columns)
+
+
+def _read_arrow(body: bytes) -> pd.DataFrame:
+    if pyarrow is None:
+        raise HTTPException(
+            status_code=415, detail="Arrow input requires pyarrow on the server"
+        )
+    try:
+        reader = pyarrow.ipc.open_stream(body)
+    except pyarrow.ArrowInvalid:
+        reader = pyarrow.ipc.open_file(body)
+    return reader.read_all().to_pandas()
+
+
+def _read_npy(body: bytes) -> pd.DataFrame:
+    # Column names come from the fields of a structured array
+    array = np.load(io.BytesIO(body), allow_pickle=False)
+    if array.dtype.names is None:
+        raise ValueError("Expected a structured array with named fields")
+    return pd.DataFrame.from_records(array)
+
+
+CONTENT_TYPES: Dict[str, Callable[[bytes], pd.DataFrame]] = {
+    CSV: _read_csv,
+    JSON: _read_json,
+    ARROW_STREAM: _read_arrow,
+    ARROW_FILE: _read_arrow,
+    NPY: _read_npy,
+}
+
+# Request body documentation of the endpoints accepting columns
+OPENAPI_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            CSV: {"schema": {"type": "string"}},
+            JSON: {
+                "schema": {
+                    "type": "object",
+                    "additionalProperties": {"type": "array", "items": {}},
+                }
+            },
+            ARROW_STREAM: {"schema": {"type": "string", "format": "binary"}},
+            ARROW_FILE: {"schema": {"type": "string", "format": "binary"}},
+            NPY: {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+def read_columns(content_type: Optional[str], body: bytes) -> pd.DataFrame:
+    """
+    Read a column-oriented payload, raising a 415 error for unsupported
+    content types and a 400 error for malformed payloads.
+    """
+    media_type = (content_type or JSON).split(";")[0].strip().lower()
+    reader = CONTENT_TYPES.get(media_type)
+    if reader is None:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported content type {media_type}, "
+            f"expected one of {', '.join(CONTENT_TYPES)}",
+        )
+    try:
+        return reader(body)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid {media_type} input: {e}")
+
+
+def check_columns(columns: List[str], schema: Optional[Dict[str, Any]]) -> None:
+    """
+    Check column names against the properties of an input schema, raising a
+    400 error if required properties are missing or, when the schema forbids
+    additional properties, if columns are unknown.
+    """
+    if not schema or schema.get("type", "object") != "object":
+        return
+    missing = [name for name in schema.get("required", []) if name not in columns]
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Missing columns required by the input schema: {', '.join(missing)}",
+        )
+    if schema.get("additionalProperties") is False:
+        known = schema.get("properties", {})
+        unknown = [name for name in columns if name not in known]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Columns not in the input schema: {', '.join(unknown)}",
+            )
+
+
+def to_inputs(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Fan out a matrix into one input dict per row, with missing values as None"""
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict("records")
+
+
+# Results export
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "arrow": ARROW_STREAM,
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Jobs read from the database, and written out, at a time
+EXPORT_CHUNK_SIZE = 1000
+
+
+def _job_chunks(collection_id: int, *columns: Any) -> Iterator[List[Any]]:
+    """Read columns of the jobs of a collection in chunks, by job id"""
+    jobs = database.FunctionJobDB
+    members = database.CollectionJobDB
+    last_id = 0
+    while True:
+        db = database.SessionLocal()
+        try:
+            chunk = (
+                db.query(jobs.id, *columns)
+                .join(members, members.job_id == jobs.id)
+                .filter(members.collection_id == collection_id, jobs.id > last_id)
+                .order_by(jobs.id)
+                .limit(EXPORT_CHUNK_SIZE)
+                .all()
+            )
+        finally:
+            db.close()
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+def _flatten_values(row: Dict[str, Any], prefix: str, values: Any) -> None:
+    """Add the values of a dict to a row, nested dicts as prefix.key.subkey"""
+    if not isinstance(values, dict):
+        return
+    for key, value in values.items():
+        if isinstance(value, dict) and value:
+            _flatten_values(row, f"{prefix}.{key}", value)
+        else:
+            row[f"{prefix}.{key}"] = value
+
+
+def _flatten(job_id, status, inputs, outputs, job_info) -> Dict[str, Any]:
+    row = {"id": job_id, "status": models.JobStatus(status).value}
+    _flatten_values(row, "inputs", inputs)
+    _flatten_values(row, "outputs", outputs)
+    row["error"] = (job_info or {}).get("error")
+    return row
+
+
+def _result_chunks(collection_id: int) -> Iterator[List[Dict[str, Any]]]:
+    """Read the jobs of a collection in chunks of flattened rows, by job id"""
+    jobs = database.FunctionJobDB
+    for chunk in _job_chunks(
+        collection_id, jobs.status, jobs.inputs, jobs.outputs, jobs.job_info
+    ):
+        yield [_flatten(*job) for job in chunk]
+
+
+def _kind(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    return "string"
+
+
+def _columns(collection_id: int) -> Dict[str, Optional[str]]:
+    """
+    Columns of the table of a collection, from a first pass over the inputs
+    and outputs of all of its jobs, with the kind of their values: "bool",
+    "number", "string" (also for mixed kinds) or None if always missing
+    """
+    jobs = database.FunctionJobDB
+    columns: Dict[str, Optional[str]] = {"id": "number", "status": "string"}
+    for chunk in _job_chunks(collection_id, jobs.inputs, jobs.outputs):
+        for _, inputs, outputs in chunk:
+            row: Dict[str, Any] = {}
+            _flatten_values(row, "inputs", inputs)
+            _flatten_values(row, "outputs", outputs)
+            for name, value in row.items():
+                kind = _kind(value)
+                known = columns.setdefault(name, kind)
+                if kind is not None and known != kind:
+                    columns[name] = kind if known is None else "string"
+    # Keep the error last
+    columns["error"] = "string"
+    return columns
+
+
+def _csv_rows(collection_id: int) -> Iterator[bytes]:
+    columns = list(_columns(collection_id))
+    header = True
+    for rows in _result_chunks(collection_id):
+        frame = pd.DataFrame(rows, columns=columns)
+        yield frame.to_csv(index=False, header=header).encode("utf-8")
+        header = False
+
+
+def _ndjson_rows(collection_id: int) -> Iterator[bytes]:
+    for rows in _result_chunks(collection_id):
+        yield "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+
+
+class _Sink(io.RawIOBase):
+    """Write-only buffer whose content is taken out after each chunk"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _arrow_schema(columns: Dict[str, Optional[str]]):
+    types = {"bool": pyarrow.bool_(), "number": pyarrow.float64()}
+    return pyarrow.schema(
+        [("id", pyarrow.int64())]
+        + [
+            (name, types.get(kind, pyarrow.string()))
+            for name, kind in columns.items()
+            if name != "id"
+        ]
+    )
+
+
+def _as_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _arrow_rows(collection_id: int, parquet: bool) -> Iterator[bytes]:
+    columns = _columns(collection_id)
+    schema = _arrow_schema(columns)
+    # Values of string columns of mixed kinds are written as JSON
+    text_columns = [name for name, kind in columns.items() if kind in ("string", None)]
+    sink = _Sink()
+    if parquet:
+        writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+    for rows in _result_chunks(collection_id):
+        for row in rows:
+            for name in text_columns:
+                if name in row:
+                    row[name] = _as_string(row[name])
+        writer.write_table(pyarrow.Table.from_pylist(rows, schema=schema))
+        yield sink.take()
+    writer.close()
+    yield sink.take()
+
+
+def export_results(collection_id: int, format: str) -> Iterator[bytes]:
+    """
+    Stream the jobs of a collection as a table in an EXPORT_FORMATS format,
+    with one row per job: its id, status, inputs.<name> and outputs.<name>
+    columns (outputs.<name>.<key> for nested objects), and the error of failed
+    jobs.
+
+    Jobs are read in chunks, so memory use does not grow with the size of the
+    collection: once for the columns of the table and their types, then for
+    its rows. Arrow and Parquet require pyarrow, a 415 error is raised
+    without it.
+    """
+    if format == "csv":
+        return _csv_rows(collection_id)
+    if format == "ndjson":
+        return _ndjson_rows(collection_id)
+    if pyarrow is None:
+        raise HTTPException(
+            status_code=415, detail=f"{format} output requires pyarrow on the server"
+        )
+    return _arrow_rows(collection_id, parquet=format == "parquet")
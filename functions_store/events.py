@@ -0,0 +1,234 @@
+"""
+Push notification of job progress: Server-Sent Events streams and long polls.
+
+Jobs may be executed by workers in other processes, so the database stays the
+source of truth and the streams re-read it. They do so when a job finishes in
+this process (the embedded worker and run_function notify job_changes), and
+otherwise every POLL_INTERVAL seconds. Each re-read is cheap: the job row by
+primary key, the collection row with its counters, and only when the counters
+show that jobs finished, the jobs that finished since the last event.
+
+Jobs of a collection are streamed in the order of their collection_job_events
+rows, which is the order their outcomes were committed. Their finish times
+are stamped before the outcomes are written, so with several workers a job
+may become visible after jobs that finished later than it.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from . import database, job_collections, models
+from .pagination import encode_id_cursor
+
+POLL_INTERVAL = float(os.environ.get("FUNCTIONS_STORE_EVENTS_POLL_INTERVAL", 1.0))
+# Comment lines sent on idle streams, so proxies do not close them
+KEEPALIVE_SECONDS = 15.0
+# Jobs sent per re-read of a collection
+MAX_JOBS_PER_READ = 500
+
+FINISHED_STATUSES = (models.JobStatus.COMPLETED, models.JobStatus.FAILED)
+
+
+class ChangeNotifier:
+    """
+    Wakes up coroutines waiting for job changes. notify() may be called from
+    any thread, e.g. the database thread of the embedded worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def notify(self) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The loop of the waiter was closed
+                pass
+
+    async def wait(self, timeout: float) -> None:
+        """Wait for the next notification, at most timeout seconds"""
+        event = asyncio.Event()
+        with self._lock:
+            self._waiters.append((asyncio.get_running_loop(), event))
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if (asyncio.get_running_loop(), event) in self._waiters:
+                    self._waiters.remove((asyncio.get_running_loop(), event))
+
+
+job_changes = ChangeNotifier()
+
+
+def _read(fn, *args) -> Any:
+    db = database.SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def _job_model(db: Session, job_id: int) -> Optional[models.FunctionJob]:
+    job = db.query(database.FunctionJobDB).get(job_id)
+    return models.FunctionJob.model_validate(job, from_attributes=True) if job else None
+
+
+def _collection_model(
+    db: Session, collection_id: int
+) -> Optional[models.FunctionJobCollection]:
+    collection = db.query(database.FunctionJobCollectionDB).get(collection_id)
+    if collection is None:
+        return None
+    return job_collections.to_model(db, collection, include_job_ids=False)
+
+
+def _finished_jobs(
+    db: Session, collection_id: int, after: Optional[int]
+) -> List[Tuple[int, database.FunctionJobDB]]:
+    """
+    Jobs of a collection that finished after an event, as tuples of (event
+    id, job) in commit order
+    """
+    jobs = database.FunctionJobDB
+    events = database.CollectionJobEventDB
+    query = (
+        db.query(events.id, jobs)
+        .join(jobs, jobs.id == events.job_id)
+        .filter(events.collection_id == collection_id)
+    )
+    if after is not None:
+        query = query.filter(events.id > after)
+    return query.order_by(events.id).limit(MAX_JOBS_PER_READ).all()
+
+
+def format_event(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    """Format a Server-Sent Event with JSON data"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(jsonable_encoder(data))}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def job_events(job_id: int) -> AsyncIterator[str]:
+    """
+    Stream a "status" event with the job each time its status changes, ending
+    once the job finished.
+    """
+    last_status = None
+    last_sent = time.monotonic()
+    while True:
+        job = await run_in_threadpool(_read, _job_model, job_id)
+        if job is None:
+            yield format_event("error", {"detail": "Function job not found"})
+            return
+        if job.status != last_status:
+            last_status = job.status
+            last_sent = time.monotonic()
+            yield format_event("status", job)
+        if job.status in FINISHED_STATUSES:
+            return
+        if time.monotonic() - last_sent > KEEPALIVE_SECONDS:
+            last_sent = time.monotonic()
+            yield ": keepalive\n\n"
+        await job_changes.wait(POLL_INTERVAL)
+
+
+async def collection_events(
+    collection_id: int, after: Optional[int] = None
+) -> AsyncIterator[str]:
+    """
+    Stream the progress of a collection: a "progress" event with the
+    collection (without job ids) whenever its counters change, a "job" event
+    with each job that finished, including its outputs, and a final "done"
+    event once all jobs finished.
+
+    Parameters:
+        after: Event id of the last job already received, to resume a
+            stream without receiving the same jobs again
+    """
+    last_counts = None
+    sent_finished = None
+    last_sent = time.monotonic()
+    while True:
+        collection = await run_in_threadpool(_read, _collection_model, collection_id)
+        if collection is None:
+            yield format_event("error", {"detail": "Function job collection not found"})
+            return
+
+        counts = collection.job_counts
+        finished = counts["COMPLETED"] + counts["FAILED"]
+        if counts != last_counts:
+            last_counts = counts
+            last_sent = time.monotonic()
+            yield format_event("progress", collection)
+
+        # Jobs only need to be read when more of them finished
+        while finished != sent_finished:
+            jobs = await run_in_threadpool(_read, _finished_jobs, collection_id, after)
+            for after, job in jobs:
+                yield format_event(
+                    "job",
+                    models.FunctionJob.model_validate(job, from_attributes=True),
+                    encode_id_cursor(after),
+                )
+            if len(jobs) < MAX_JOBS_PER_READ:
+                sent_finished = finished
+            last_sent = time.monotonic()
+
+        if collection.progress >= 1.0:
+            yield format_event("done", collection)
+            return
+        if time.monotonic() - last_sent > KEEPALIVE_SECONDS:
+            last_sent = time.monotonic()
+            yield ": keepalive\n\n"
+        await job_changes.wait(POLL_INTERVAL)
+
+
+async def wait_for_job(job_id: int, timeout: float) -> Optional[models.FunctionJob]:
+    """
+    Wait until a job finished, at most timeout seconds.
+
+    Returns:
+        The job, finished unless the timeout expired, or None if it does not
+        exist
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        job = await run_in_threadpool(_read, _job_model, job_id)
+        remaining = deadline - time.monotonic()
+        if job is None or job.status in FINISHED_STATUSES or remaining <= 0:
+            return job
+        await job_changes.wait(min(POLL_INTERVAL, remaining))
+
+
+async def wait_for_collection(
+    collection_id: int, timeout: float
+) -> Optional[models.FunctionJobCollection]:
+    """
+    Wait until all jobs of a collection finished, at most timeout seconds.
+
+    Returns:
+        The collection (without job ids), or None if it does not exist
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        collection = await run_in_threadpool(_read, _collection_model, collection_id)
+        remaining = deadline - time.monotonic()
+        if collection is None or collection.progress >= 1.0 or remaining <= 0:
+            return collection
+        await job_changes.wait(min(POLL_INTERVAL, remaining))
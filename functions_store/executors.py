@@ -0,0 +1,277 @@
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .loader import function_loader
+from .remote import remote_http
+from .tabulated import execute_tabulated, execute_tabulated_many
+
+logger = logging.getLogger(__name__)
+
+PROCESS_POOL_SIZE = int(
+    os.environ.get("FUNCTIONS_STORE_PROCESS_POOL_SIZE", os.cpu_count() or 1)
+)
+
+# Functions tagged VECTORIZED_TAG are called once per chunk of up to
+# VECTORIZED_CHUNK_SIZE jobs, with an array of values per input
+VECTORIZED_TAG = "vectorized"
+VECTORIZED_CHUNK_SIZE = int(os.environ.get("FUNCTIONS_STORE_VECTORIZED_CHUNK_SIZE", 1000))
+
+function_executors: Dict[str, Callable] = {}
+async_executors: Dict[str, Callable] = {}
+batch_executors: Dict[str, Callable] = {}
+# Types whose batch executor is used for all functions, tagged or not
+vectorized_types = set()
+
+
+def register_function_executor(type_name: str, executor: Callable):
+    """Register an executor for a specific function type"""
+    function_executors[type_name] = executor
+
+
+def register_async_executor(type_name: str, executor: Callable):
+    """
+    Register a coroutine executing a function of a specific type, awaited by
+    the workers instead of running the executor in a thread
+    """
+    async_executors[type_name] = executor
+
+
+def register_batch_executor(type_name: str, executor: Callable, always: bool = False):
+    """
+    Register an executor running a function of a specific type with a list
+    of inputs, returning the result of each input or the exception it failed
+    with. If always is set, it is used for all functions of the type instead
+    of only those tagged VECTORIZED_TAG.
+    """
+    batch_executors[type_name] = executor
+    if always:
+        vectorized_types.add(type_name)
+
+
+def is_vectorized(function) -> bool:
+    """Check whether the jobs of a function are executed in chunks"""
+    if function.type not in batch_executors:
+        return False
+    return function.type in vectorized_types or (
+        bool(function.tags) and VECTORIZED_TAG in function.tags
+    )
+
+
+def load_function_from_path(file_path: str, function_name: str):
+    """
+    Load a Python function from a file path.
+    Loaded functions are cached and reloaded when the file changes on disk.
+    """
+    try:
+        return function_loader.load(file_path, function_name)
+    except Exception as e:
+        raise Exception(f"Error loading function: {str(e)}")
+
+
+def execute_local_python(url: str, inputs: Dict[str, Any]) -> Any:
+    """Execute a local Python function"""
+    if ":" not in url:
+        raise ValueError("URL must be in format /path/to/file.py:function_name")
+
+    file_path, function_name = url.rsplit(":", 1)
+
+    func = load_function_from_path(file_path, function_name)
+
+    try:
+        return func(**inputs)
+    except Exception as e:
+        raise Exception(f"Error executing local Python function: {str(e)}")
+
+
+def to_columns(inputs: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Gather a list of inputs into an array of values per input name"""
+    names = dict.fromkeys(name for point in inputs for name in point)
+    return {name: np.array([point.get(name) for point in inputs]) for name in names}
+
+
+def _to_list(values: Any, size: int) -> List[Any]:
+    values = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    if len(values) != size:
+        raise ValueError(f"Expected {size} results, got {len(values)}")
+    return [value.item() if isinstance(value, np.generic) else value for value in values]
+
+
+def from_columns(results: Any, size: int) -> List[Any]:
+    """
+    Scatter the results of a vectorized call back to its inputs. Results are
+    either a sequence or array with one item per input, or a dict of them
+    (one output per key).
+    """
+    if isinstance(results, dict):
+        columns = {name: _to_list(values, size) for name, values in results.items()}
+        return [
+            {name: values[i] for name, values in columns.items()} for i in range(size)
+        ]
+    return _to_list(results, size)
+
+
+def execute_local_python_batch(url: str, inputs: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Execute a vectorized local Python function: call it once with an array
+    of values per input. If the call fails, the inputs are run one at a time
+    so only those that fail get the error.
+    """
+    if ":" not in url:
+        raise ValueError("URL must be in format /path/to/file.py:function_name")
+
+    file_path, function_name = url.rsplit(":", 1)
+
+    func = load_function_from_path(file_path, function_name)
+
+    try:
+        return from_columns(func(**to_columns(inputs)), len(inputs))
+    except Exception as e:
+        if len(inputs) == 1:
+            return [Exception(f"Error executing local Python function: {str(e)}")]
+    return [execute_local_python_batch(url, [point])[0] for point in inputs]
+
+
+def execute_remote_http(url: str, inputs: Dict[str, Any]) -> Any:
+    """Execute a remote function via HTTP"""
+    return remote_http.post(url, inputs)
+
+
+async def execute_remote_http_async(url: str, inputs: Dict[str, Any]) -> Any:
+    """Execute a remote function via HTTP, without blocking a thread"""
+    return await remote_http.apost(url, inputs)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+# Processes are spawned rather than forked, forking a threaded server is unsafe
+_process_context = multiprocessing.get_context("spawn")
+
+
+def _init_pool_process() -> None:
+    # Shutdown is driven by the parent process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _pool_process_pid() -> int:
+    return os.getpid()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the long-lived process pool for local.python.process functions.
+
+    The pool is created and warmed up (all processes started) on first use.
+    Each process keeps its own cache of loaded functions, so a function file
+    is imported once per process and not once per job.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_SIZE,
+                mp_context=_process_context,
+                initializer=_init_pool_process,
+            )
+            # One task per process makes the pool start all processes now
+            warm_up = [pool.submit(_pool_process_pid) for _ in range(PROCESS_POOL_SIZE)]
+            for future in warm_up:
+                future.result()
+            logger.info(f"Started process pool with {PROCESS_POOL_SIZE} processes")
+            _process_pool = pool
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_process_pool() -> None:
+    """Stop the processes of the process pool, if it was started"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _run_in_pool(fn: Callable, url: str, inputs: Any) -> Any:
+    pool = get_process_pool()
+    try:
+        return pool.submit(fn, url, inputs).result()
+    except BrokenProcessPool:
+        # A process died and took down the pool, with all the jobs running in
+        # it. Retry in a process of its own, so only the job that actually
+        # crashes the process fails.
+        _discard_process_pool(pool)
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=_process_context) as isolated:
+        try:
+            return isolated.submit(fn, url, inputs).result()
+        except BrokenProcessPool:
+            raise Exception(
+                "Error executing local Python function: worker process crashed"
+            )
+
+
+def execute_local_python_process(url: str, inputs: Dict[str, Any]) -> Any:
+    """
+    Execute a local Python function in the process pool, so CPU-bound
+    functions run in parallel instead of being serialized by the GIL.
+    """
+    return _run_in_pool(execute_local_python, url, inputs)
+
+
+def execute_local_python_process_batch(
+    url: str, inputs: List[Dict[str, Any]]
+) -> List[Any]:
+    """Execute a vectorized local Python function in the process pool"""
+    return _run_in_pool(execute_local_python_batch, url, inputs)
+
+
+# Register default executors
+register_function_executor("local.python", execute_local_python)
+register_function_executor("local.python.process", execute_local_python_process)
+register_function_executor("remote.http", execute_remote_http)
+register_function_executor("tabulated", execute_tabulated)
+register_async_executor("remote.http", execute_remote_http_async)
+register_batch_executor("local.python", execute_local_python_batch)
+register_batch_executor("local.python.process", execute_local_python_process_batch)
+# Lookups of many inputs at once return the same results as one at a time
+register_batch_executor("tabulated", execute_tabulated_many, always=True)
+
+
+def execute_function(function_type: str, url: str, inputs: Dict[str, Any]) -> Any:
+    """Execute a function based on its type"""
+    executor = function_executors.get(function_type)
+    if not executor:
+        raise ValueError(f"Unsupported function type: {function_type}")
+
+    return executor(url, inputs)
+
+
+def execute_function_batch(
+    function_type: str, url: str, inputs: List[Dict[str, Any]]
+) -> List[Any]:
+    """
+    Execute a function with a list of inputs at once.
+
+    Returns:
+        The result of each input, or the exception it failed with
+    """
+    executor = batch_executors.get(function_type)
+    if not executor:
+        raise ValueError(f"Unsupported vectorized function type: {function_type}")
+
+    return executor(url, inputs)
@@ -0,0 +1,140 @@
+"""
+In-process cache of function definitions.
+
+Functions cannot be modified, only created and deleted, so their definitions
+are read from the database once and kept, with what is derived from them:
+the compiled validators of their schemas and whether their jobs are cached
+and run in chunks. Submitting and running jobs then needs no query of the
+functions table.
+
+The API process drops definitions when functions are created or deleted.
+Other processes (standalone workers) cannot see those changes, so entries
+are also re-read every refresh_seconds, like the limits of the scheduler.
+Ids of deleted functions are never given to new functions, so an entry of a
+deleted function can only go missing, not describe another function.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import database
+from .executors import is_vectorized
+from .result_cache import is_cacheable
+from .schema_validation import CompiledValidator, schema_validators
+
+REFRESH_SECONDS = float(os.environ.get("FUNCTIONS_STORE_FUNCTION_CACHE_SECONDS", 5.0))
+
+# Chunk size of id lists in IN queries, below the SQLite parameter limit
+_QUERY_CHUNK = 500
+
+
+class FunctionDefinition:
+    """
+    The definition of a function, detached from any database session, with
+    what is derived from it
+    """
+
+    def __init__(self, function: database.FunctionDB):
+        self.id: int = function.id
+        self.name: str = function.name
+        self.type: str = function.type
+        self.url: str = function.url
+        self.description: str = function.description
+        self.input_schema: Optional[Dict[str, Any]] = function.input_schema
+        self.output_schema: Optional[Dict[str, Any]] = function.output_schema
+        self.tags: List[str] = list(function.tags or [])
+        self.input_validator: Optional[CompiledValidator] = (
+            schema_validators.input_validator(self)
+        )
+        self.output_validator: Optional[CompiledValidator] = (
+            schema_validators.output_validator(self)
+        )
+        self.cacheable = is_cacheable(self)
+        self.vectorized = is_vectorized(self)
+
+    def outputs(self, result: Any) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Get the outputs of a job from the result of the function: dicts as
+        they are, other values as {"result": value}, with the error of the
+        outputs against the output schema (None if valid or without schema).
+        Jobs run by the workers and in requests store the same outputs.
+        """
+        outputs = result if isinstance(result, dict) else {"result": result}
+        validator = self.output_validator
+        return outputs, validator.error(outputs) if validator else None
+
+
+class FunctionDefinitionCache:
+    """Thread-safe read-through cache of function definitions, keyed on id"""
+
+    def __init__(self, refresh_seconds: float = REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._definitions: Dict[int, Tuple[FunctionDefinition, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, db: Session, function_id: int) -> Optional[FunctionDefinition]:
+        """Get the definition of a function, None if it does not exist"""
+        return self.get_many(db, [function_id]).get(function_id)
+
+    def get_many(
+        self, db: Session, function_ids: Iterable[int]
+    ) -> Dict[int, FunctionDefinition]:
+        """
+        Get the definitions of functions, reading those not cached in one
+        query. Functions that do not exist are missing from the result (and
+        not cached, they may be created by another process).
+        """
+        now = time.monotonic()
+        found: Dict[int, FunctionDefinition] = {}
+        missing = []
+        with self._lock:
+            for function_id in set(function_ids):
+                entry = self._definitions.get(function_id)
+                if entry is not None and now - entry[1] <= self.refresh_seconds:
+                    found[function_id] = entry[0]
+                    self.hits += 1
+                else:
+                    missing.append(function_id)
+                    self.misses += 1
+        if not missing:
+            return found
+
+        loaded = {}
+        for start in range(0, len(missing), _QUERY_CHUNK):
+            for function in db.query(database.FunctionDB).filter(
+                database.FunctionDB.id.in_(missing[start : start + _QUERY_CHUNK])
+            ):
+                loaded[function.id] = FunctionDefinition(function)
+        with self._lock:
+            for function_id in missing:
+                if function_id in loaded:
+                    self._definitions[function_id] = (loaded[function_id], now)
+                else:
+                    self._definitions.pop(function_id, None)
+        found.update(loaded)
+        return found
+
+    def invalidate(self, function_id: Optional[int] = None) -> None:
+        """Drop the definition of a function, or of all functions"""
+        with self._lock:
+            if function_id is None:
+                self._definitions.clear()
+            else:
+                self._definitions.pop(function_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached_functions": len(self._definitions),
+            }
+
+
+function_definitions = FunctionDefinitionCache()
@@ -0,0 +1,132 @@
+"""
+Full-text search over the names, descriptions and tags of the functions.
+
+The search index is kept next to the functions table and updated with it:
+
+- SQLite: an FTS5 table, whose rowid is the function id, ranked with bm25
+- PostgreSQL: a function_search table with a tsvector per function and a
+  GIN index on it, ranked with ts_rank
+
+Matches in names rank above matches in tags, which rank above matches in
+descriptions. Every word of a query must match, as the prefix of a word of
+the function, so results narrow down as a query is typed.
+"""
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from . import database
+
+FTS_TABLE = "functions_fts"
+PG_TABLE = "function_search"
+
+# Weights of the name, description and tags columns in the bm25 rank
+_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Words as split by the FTS5 unicode61 tokenizer, which also splits on "_"
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _is_postgresql(bind) -> bool:
+    return bind.dialect.name == "postgresql"
+
+
+def _document(function: database.FunctionDB) -> dict:
+    return {
+        "function_id": function.id,
+        "name": function.name or "",
+        "description": function.description or "",
+        "tags": " ".join(function.tags or []),
+    }
+
+
+def create_search_index(connection: Connection) -> None:
+    """Create the search index, unless it exists"""
+    if _is_postgresql(connection):
+        connection.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {PG_TABLE} ("
+            "function_id INTEGER PRIMARY KEY REFERENCES functions (id), "
+            "document TSVECTOR NOT NULL)"
+        )
+        connection.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS ix_{PG_TABLE}_document "
+            f"ON {PG_TABLE} USING GIN (document)"
+        )
+    else:
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            "USING fts5(name, description, tags)"
+        )
+
+
+def _insert_statement(bind):
+    if _is_postgresql(bind):
+        return text(
+            f"INSERT INTO {PG_TABLE} (function_id, document) VALUES (:function_id, "
+            "setweight(to_tsvector('simple', :name), 'A') || "
+            "setweight(to_tsvector('simple', :tags), 'B') || "
+            "setweight(to_tsvector('simple', :description), 'C'))"
+        )
+    return text(
+        f"INSERT INTO {FTS_TABLE} (rowid, name, description, tags) "
+        "VALUES (:function_id, :name, :description, :tags)"
+    )
+
+
+def index_functions(
+    connection: Connection, functions: List[database.FunctionDB]
+) -> None:
+    """Add functions to the search index (without committing)"""
+    if functions:
+        connection.execute(
+            _insert_statement(connection), [_document(f) for f in functions]
+        )
+
+
+def index_function(db: Session, function: database.FunctionDB) -> None:
+    """Add a new function to the search index (without committing)"""
+    db.execute(_insert_statement(db.get_bind()), [_document(function)])
+
+
+def clear_search_index(db: Session) -> None:
+    """Remove (without committing) all functions from the search index"""
+    table = PG_TABLE if _is_postgresql(db.get_bind()) else FTS_TABLE
+    db.execute(text(f"DELETE FROM {table}"))
+
+
+def search_function_ids(
+    db: Session, query: str, limit: int, offset: Optional[int] = None
+) -> List[int]:
+    """
+    Get the ids of the functions matching a query, best match first.
+
+    Every word of the query must be the prefix of a word of the name,
+    description or tags of a function. Queries without words match nothing.
+    """
+    words = _WORD.findall(query.lower())
+    if not words:
+        return []
+    parameters = {"limit": limit, "offset": offset or 0}
+    if _is_postgresql(db.get_bind()):
+        parameters["query"] = " & ".join(f"{word}:*" for word in words)
+        statement = text(
+            f"SELECT function_id FROM {PG_TABLE}, "
+            "to_tsquery('simple', :query) AS query "
+            "WHERE document @@ query "
+            "ORDER BY ts_rank(document, query) DESC, function_id "
+            "LIMIT :limit OFFSET :offset"
+        )
+    else:
+        # Words are quoted, so no word is taken for FTS5 query syntax
+        parameters["query"] = " ".join(f'"{word}"*' for word in words)
+        weights = ", ".join(str(weight) for weight in _BM25_WEIGHTS)
+        statement = text(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :query "
+            f"ORDER BY bm25({FTS_TABLE}, {weights}), rowid "
+            "LIMIT :limit OFFSET :offset"
+        )
+    return list(db.execute(statement, parameters).scalars())
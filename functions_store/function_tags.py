@@ -0,0 +1,55 @@
+"""
+Tag index of the functions.
+
+The tags of a function are kept in the tags JSON column of the functions
+table, returned with the function, and copied to the function_tags table,
+one row per tag, so tag searches are answered from its (tag, function_id)
+index instead of reading and filtering every function:
+
+- match any: the ids of the rows with one of the tags
+- match all: the same rows grouped by function, keeping the functions with
+  as many rows as tags searched for
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from . import database
+
+
+def tag_rows(function_id: int, tags: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Rows of the function_tags table for the tags of a function"""
+    return [{"function_id": function_id, "tag": tag} for tag in dict.fromkeys(tags or [])]
+
+
+def index_tags(db: Session, function_id: int, tags: Optional[List[str]]) -> None:
+    """Index (without committing) the tags of a new function"""
+    rows = tag_rows(function_id, tags)
+    if rows:
+        db.execute(database.FunctionTagDB.__table__.insert(), rows)
+
+
+def clear_tags(db: Session) -> None:
+    """Remove (without committing) the tags of all functions"""
+    db.query(database.FunctionTagDB).delete(synchronize_session=False)
+
+
+def tagged_function_ids(tags: List[str], match_all: bool = False):
+    """
+    Select the ids of the functions with any, or all, of tags.
+
+    Returns:
+        A select of the function ids, to filter functions with
+        FunctionDB.id.in_()
+    """
+    function_tags = database.FunctionTagDB
+    tags = list(dict.fromkeys(tags))
+    query = select(function_tags.function_id).where(function_tags.tag.in_(tags))
+    if match_all:
+        query = query.group_by(function_tags.function_id).having(
+            # Tags are unique per function
+            func.count() == len(tags)
+        )
+    return query
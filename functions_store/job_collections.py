@@ -0,0 +1,354 @@
+"""
+Membership of jobs in function job collections.
+
+Memberships are rows of the collection_jobs table, keyed on
+(collection_id, job_id), so adding jobs to a collection inserts only the new
+rows instead of rewriting a JSON list of all job ids.
+
+Each collection keeps counters of its jobs per status, and the times its
+first and last job finished. They are updated whenever a job changes status
+(record_status_changes), so reading the status of a collection is a single
+row lookup however many jobs it has.
+
+Jobs that finish also get a row in collection_job_events, written in the
+transaction storing their outcome, so progress streams can follow the jobs of
+a collection in commit order.
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, func, insert, text
+from sqlalchemy.orm import Session
+
+from . import database, models
+
+# Job ids per statement when adding many jobs at once, below the limit of
+# bound parameters of SQLite
+INSERT_CHUNK_SIZE = 1000
+
+FINISHED_STATUSES = (models.JobStatus.COMPLETED, models.JobStatus.FAILED)
+
+
+def _counter_column(status: models.JobStatus):
+    collections = database.FunctionJobCollectionDB
+    return {
+        models.JobStatus.PENDING: collections.pending_count,
+        models.JobStatus.RUNNING: collections.running_count,
+        models.JobStatus.COMPLETED: collections.completed_count,
+        models.JobStatus.FAILED: collections.failed_count,
+    }[models.JobStatus(status)]
+
+
+def _chunks(ids: List[int]) -> Iterable[List[int]]:
+    for start in range(0, len(ids), INSERT_CHUNK_SIZE):
+        yield ids[start : start + INSERT_CHUNK_SIZE]
+
+
+def _update_counters(
+    db: Session,
+    collection_id: int,
+    deltas: Dict[models.JobStatus, int],
+    first_finished_at: Optional[datetime] = None,
+    last_finished_at: Optional[datetime] = None,
+) -> None:
+    """Add deltas to the counters of a collection, and widen its finish times"""
+    collections = database.FunctionJobCollectionDB
+    values = {
+        _counter_column(status): _counter_column(status) + delta
+        for status, delta in deltas.items()
+        if delta
+    }
+    if first_finished_at is not None:
+        first = collections.first_finished_at
+        values[first] = case(
+            (first.is_(None) | (first > first_finished_at), first_finished_at),
+            else_=first,
+        )
+    if last_finished_at is not None:
+        last = collections.last_finished_at
+        values[last] = case(
+            (last.is_(None) | (last < last_finished_at), last_finished_at),
+            else_=last,
+        )
+    if values:
+        db.query(collections).filter(collections.id == collection_id).update(
+            values, synchronize_session=False
+        )
+
+
+def _record_finished(db: Session, events: List[Tuple[int, int]]) -> None:
+    """
+    Add (without committing) the events of jobs that finished, as tuples of
+    (collection id, job id)
+    """
+    if not events:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        # Sequence values are drawn in statement order, not commit order:
+        # writers of events take turns, readers are not blocked
+        db.execute(text("LOCK TABLE collection_job_events IN SHARE ROW EXCLUSIVE MODE"))
+    db.execute(
+        insert(database.CollectionJobEventDB),
+        [
+            {"collection_id": collection_id, "job_id": job_id}
+            for collection_id, job_id in events
+        ],
+    )
+
+
+def record_status_changes(
+    db: Session,
+    changes: Iterable[Tuple[int, models.JobStatus, models.JobStatus]],
+    finished_at: Optional[datetime] = None,
+) -> None:
+    """
+    Update (without committing) the counters of the collections of jobs whose
+    status changed.
+
+    Parameters:
+        changes: Tuples of (job id, previous status, new status)
+        finished_at: When the jobs moving to COMPLETED or FAILED finished
+            (default: now)
+    """
+    changed = {
+        job_id: (models.JobStatus(old), models.JobStatus(new))
+        for job_id, old, new in changes
+        if old != new
+    }
+    if not changed:
+        return
+
+    members = database.CollectionJobDB
+    deltas: Dict[int, Counter] = {}
+    finished = set()
+    events = []
+    for chunk in _chunks(list(changed)):
+        rows = db.query(members.collection_id, members.job_id).filter(
+            members.job_id.in_(chunk)
+        )
+        for collection_id, job_id in rows:
+            old, new = changed[job_id]
+            delta = deltas.setdefault(collection_id, Counter())
+            delta[old] -= 1
+            delta[new] += 1
+            if new in FINISHED_STATUSES:
+                finished.add(collection_id)
+                events.append((collection_id, job_id))
+
+    finished_at = finished_at or datetime.utcnow()
+    for collection_id, delta in deltas.items():
+        if collection_id in finished:
+            _update_counters(db, collection_id, delta, finished_at, finished_at)
+        else:
+            _update_counters(db, collection_id, delta)
+    _record_finished(db, events)
+
+
+def create_collection(
+    db: Session,
+    name: str,
+    description: Optional[str],
+    job_ids: Iterable[int],
+    status: str = "RUNNING",
+) -> database.FunctionJobCollectionDB:
+    """Create (without committing) a collection of jobs"""
+    collection = database.FunctionJobCollectionDB(
+        name=name,
+        description=description,
+        status=status,
+        pending_count=0,
+        running_count=0,
+        completed_count=0,
+        failed_count=0,
+    )
+    db.add(collection)
+    db.flush()
+    add_jobs(db, collection.id, job_ids)
+    return collection
+
+
+def add_jobs(db: Session, collection_id: int, job_ids: Iterable[int]) -> int:
+    """
+    Add jobs to a collection (without committing), skipping jobs that are
+    already members, and count them in the counters of the collection.
+
+    Returns:
+        Number of added jobs
+    """
+    members = database.CollectionJobDB
+    jobs = database.FunctionJobDB
+    added = 0
+    deltas: Counter = Counter()
+    first_finished_at = last_finished_at = None
+    for chunk in _chunks(list(dict.fromkeys(job_ids))):
+        existing = {
+            job_id
+            for (job_id,) in db.query(members.job_id).filter(
+                members.collection_id == collection_id, members.job_id.in_(chunk)
+            )
+        }
+        chunk = [job_id for job_id in chunk if job_id not in existing]
+        if not chunk:
+            continue
+        db.execute(
+            insert(members),
+            [{"collection_id": collection_id, "job_id": job_id} for job_id in chunk],
+        )
+        added += len(chunk)
+
+        rows = (
+            db.query(
+                jobs.status,
+                func.count(),
+                func.min(jobs.finished_at),
+                func.max(jobs.finished_at),
+            )
+            .filter(jobs.id.in_(chunk))
+            .group_by(jobs.status)
+        )
+        chunk_finished = False
+        for status, count, first, last in rows:
+            deltas[models.JobStatus(status)] += count
+            if models.JobStatus(status) in FINISHED_STATUSES:
+                chunk_finished = True
+            if first is not None:
+                first_finished_at = min(first, first_finished_at or first)
+                last_finished_at = max(last, last_finished_at or last)
+
+        if chunk_finished:
+            # Jobs finished before finish times were stored have none
+            finished = func.coalesce(jobs.finished_at, jobs.created_at)
+            finished_ids = (
+                db.query(jobs.id)
+                .filter(jobs.id.in_(chunk), jobs.status.in_(FINISHED_STATUSES))
+                .order_by(finished, jobs.id)
+            )
+            _record_finished(db, [(collection_id, job_id) for (job_id,) in finished_ids])
+
+    _update_counters(db, collection_id, deltas, first_finished_at, last_finished_at)
+    return added
+
+
+def recount(db: Session, collection_id: int) -> None:
+    """Recompute (without committing) the counters of a collection from its jobs"""
+    jobs = database.FunctionJobDB
+    members = database.CollectionJobDB
+    rows = (
+        db.query(
+            jobs.status,
+            func.count(),
+            func.min(jobs.finished_at),
+            func.max(jobs.finished_at),
+        )
+        .join(members, members.job_id == jobs.id)
+        .filter(members.collection_id == collection_id)
+        .group_by(jobs.status)
+        .all()
+    )
+    collection = db.query(database.FunctionJobCollectionDB).get(collection_id)
+    counts = {status: 0 for status in models.JobStatus}
+    collection.first_finished_at = collection.last_finished_at = None
+    for status, count, first, last in rows:
+        counts[models.JobStatus(status)] = count
+        if first is not None:
+            collection.first_finished_at = min(first, collection.first_finished_at or first)
+            collection.last_finished_at = max(last, collection.last_finished_at or last)
+    collection.pending_count = counts[models.JobStatus.PENDING]
+    collection.running_count = counts[models.JobStatus.RUNNING]
+    collection.completed_count = counts[models.JobStatus.COMPLETED]
+    collection.failed_count = counts[models.JobStatus.FAILED]
+
+
+def missing_jobs(db: Session, job_ids: Iterable[int]) -> List[int]:
+    """Get the ids, among job_ids, of jobs that do not exist"""
+    jobs = database.FunctionJobDB
+    missing = []
+    for chunk in _chunks(list(dict.fromkeys(job_ids))):
+        found = {job_id for (job_id,) in db.query(jobs.id).filter(jobs.id.in_(chunk))}
+        missing.extend(job_id for job_id in chunk if job_id not in found)
+    return missing
+
+
+def collection_job_ids(db: Session, collection_id: int) -> List[int]:
+    """Get the ids of the jobs of a collection, in the order they were created"""
+    table = database.CollectionJobDB
+    return [
+        job_id
+        for (job_id,) in db.query(table.job_id)
+        .filter(table.collection_id == collection_id)
+        .order_by(table.job_id)
+    ]
+
+
+def job_status_counts(collection: database.FunctionJobCollectionDB) -> Dict[str, int]:
+    """Get the number of jobs of a collection per status, from its counters"""
+    return {
+        models.JobStatus.PENDING.value: collection.pending_count or 0,
+        models.JobStatus.RUNNING.value: collection.running_count or 0,
+        models.JobStatus.COMPLETED.value: collection.completed_count or 0,
+        models.JobStatus.FAILED.value: collection.failed_count or 0,
+    }
+
+
+def collection_status(counts: Dict[str, int]) -> str:
+    """Derive the status of a collection from the status counts of its jobs"""
+    if counts[models.JobStatus.FAILED.value]:
+        return "FAILED"
+    if sum(counts.values()) == counts[models.JobStatus.COMPLETED.value]:
+        return "COMPLETED"
+    return "RUNNING"
+
+
+def to_model(
+    db: Session,
+    collection: database.FunctionJobCollectionDB,
+    job_ids: Optional[List[int]] = None,
+    include_job_ids: bool = True,
+) -> models.FunctionJobCollection:
+    """
+    Build the API model of a collection.
+
+    Parameters:
+        job_ids: The ids of the jobs of the collection, if already known
+        include_job_ids: Read the ids of the jobs of the collection. Without
+            them the model is built from the collection row alone.
+    """
+    if job_ids is None and include_job_ids:
+        job_ids = collection_job_ids(db, collection.id)
+    counts = job_status_counts(collection)
+    total = sum(counts.values())
+    finished = (
+        counts[models.JobStatus.COMPLETED.value] + counts[models.JobStatus.FAILED.value]
+    )
+    return models.FunctionJobCollection(
+        id=collection.id,
+        name=collection.name,
+        description=collection.description,
+        job_ids=job_ids or [],
+        status=collection_status(counts),
+        job_counts=counts,
+        progress=finished / total if total else 1.0,
+        first_finished_at=collection.first_finished_at,
+        last_finished_at=collection.last_finished_at,
+    )
+
+
+def to_models(
+    db: Session, collections: List[database.FunctionJobCollectionDB]
+) -> List[models.FunctionJobCollection]:
+    """Build the API models of several collections, reading their jobs at once"""
+    table = database.CollectionJobDB
+    job_ids: Dict[int, List[int]] = {collection.id: [] for collection in collections}
+    if collections:
+        rows = (
+            db.query(table.collection_id, table.job_id)
+            .filter(table.collection_id.in_(list(job_ids)))
+            .order_by(table.collection_id, table.job_id)
+        )
+        for collection_id, job_id in rows:
+            job_ids[collection_id].append(job_id)
+    return [
+        to_model(db, collection, job_ids[collection.id]) for collection in collections
+    ]
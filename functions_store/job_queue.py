@@ -0,0 +1,480 @@
+"""
+Durable job queue on top of the function_jobs table.
+
+A job is claimed by moving it from PENDING to RUNNING and recording a lease
+for the claiming worker. Workers keep their leases alive with heartbeats; jobs
+whose lease expired (e.g. because the worker process died) are put back to
+PENDING so another worker picks them up.
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from . import database, models
+from .function_cache import FunctionDefinition, function_definitions
+from .job_collections import record_status_changes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = float(os.environ.get("FUNCTIONS_STORE_LEASE_SECONDS", 60))
+
+# A job whose worker died this many times is failed instead of requeued
+MAX_REQUEUES = int(os.environ.get("FUNCTIONS_STORE_MAX_REQUEUES", 3))
+
+# Jobs per statement when enqueuing or claiming many jobs at once
+ENQUEUE_CHUNK_SIZE = 5000
+
+JOB_COLUMNS = ("functionID", "status", "inputs", "outputs", "job_info", "finished_at")
+
+
+def new_owner_id(kind: str = "worker") -> str:
+    """Build a unique id for a lease owner (a worker or an API process)"""
+    return f"{kind}:{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def create_lease(
+    db: Session,
+    job_id: int,
+    owner: str,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+) -> None:
+    """Add (without committing) a lease of a job for an owner"""
+    now = datetime.utcnow()
+    db.merge(
+        database.FunctionJobLeaseDB(
+            job_id=job_id,
+            worker_id=owner,
+            heartbeat_at=now,
+            expires_at=now + timedelta(seconds=lease_seconds),
+        )
+    )
+
+
+def release_lease(db: Session, job_id: int) -> None:
+    """Remove (without committing) the lease of a job"""
+    db.query(database.FunctionJobLeaseDB).filter(
+        database.FunctionJobLeaseDB.job_id == job_id
+    ).delete(synchronize_session=False)
+
+
+def enqueue(db: Session, rows: List[Dict[str, Any]]) -> List[models.FunctionJob]:
+    """
+    Insert (without committing) many jobs with multi-row INSERT statements,
+    returning their ids, instead of adding and refreshing ORM objects one by
+    one.
+
+    Parameters:
+        rows: The functionID, status and inputs of each job, optionally its
+            outputs, job_info and finished_at
+
+    Returns:
+        The created jobs, in the order of rows
+    """
+    table = database.FunctionJobDB.__table__
+    returning = db.get_bind().dialect.insert_returning
+    created_at = datetime.utcnow()
+    jobs = []
+    for start in range(0, len(rows), ENQUEUE_CHUNK_SIZE):
+        chunk = [
+            {**{column: row.get(column) for column in JOB_COLUMNS}, "created_at": created_at}
+            for row in rows[start : start + ENQUEUE_CHUNK_SIZE]
+        ]
+        if returning:
+            ids = db.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True), chunk
+            ).scalars()
+        else:
+            # SQLite before 3.35 has no RETURNING, insert the rows one by one
+            ids = [
+                db.execute(insert(table).values(row)).inserted_primary_key[0]
+                for row in chunk
+            ]
+        jobs.extend(
+            models.FunctionJob(id=job_id, **row)
+            for job_id, row in zip(ids, chunk)
+        )
+    return jobs
+
+
+def claim_pending(
+    db: Session,
+    job_id: int,
+    owner: str,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    conditions: Sequence[Any] = (),
+) -> bool:
+    """
+    Claim a PENDING job within the current transaction (without committing),
+    so several jobs can be claimed with a single commit.
+
+    The PENDING -> RUNNING transition is a conditional update, so when several
+    workers race for the same job exactly one of them wins it. Additional
+    conditions (e.g. concurrency limits) are checked in the same statement.
+
+    Returns:
+        Whether the job was claimed
+    """
+    jobs = database.FunctionJobDB
+    claimed = (
+        db.query(jobs)
+        .filter(jobs.id == job_id, jobs.status == models.JobStatus.PENDING, *conditions)
+        .update({jobs.status: models.JobStatus.RUNNING}, synchronize_session=False)
+    )
+    if not claimed:
+        return False
+    create_lease(db, job_id, owner, lease_seconds)
+    return True
+
+
+def claim_pending_many(
+    db: Session,
+    job_ids: List[int],
+    owner: str,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+) -> List[int]:
+    """
+    Claim many PENDING jobs within the current transaction (without
+    committing), with one UPDATE ... RETURNING and one INSERT of the leases
+    per chunk instead of two statements per job. Only for claims without
+    additional conditions, which claim_pending re-checks job by job.
+
+    Returns:
+        The ids of the jobs claimed, those that were still PENDING
+    """
+    table = database.FunctionJobDB.__table__
+    leases = database.FunctionJobLeaseDB.__table__
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=lease_seconds)
+    claimed: List[int] = []
+    for start in range(0, len(job_ids), ENQUEUE_CHUNK_SIZE):
+        chunk = job_ids[start : start + ENQUEUE_CHUNK_SIZE]
+        ids = db.execute(
+            update(table)
+            .where(table.c.id.in_(chunk), table.c.status == models.JobStatus.PENDING)
+            .values(status=models.JobStatus.RUNNING)
+            .returning(table.c.id)
+        ).scalars().all()
+        if not ids:
+            continue
+        # Leases left behind by a requeue are replaced
+        db.execute(leases.delete().where(leases.c.job_id.in_(ids)))
+        db.execute(
+            insert(leases),
+            [
+                {
+                    "job_id": job_id,
+                    "worker_id": owner,
+                    "heartbeat_at": now,
+                    "expires_at": expires_at,
+                }
+                for job_id in ids
+            ],
+        )
+        claimed += ids
+    # In the order of job_ids, which RETURNING does not guarantee
+    claimed_set = set(claimed)
+    return [job_id for job_id in job_ids if job_id in claimed_set]
+
+
+def load_claimed_jobs(
+    db: Session, job_ids: List[int], owner: str
+) -> List[Tuple[database.FunctionJobDB, FunctionDefinition]]:
+    """
+    Load claimed jobs and the definitions of their functions, failing the
+    jobs whose function does not exist anymore.
+
+    Returns:
+        The jobs (detached from the session once it is closed) with the
+        definition of their function, in the order of job_ids
+    """
+    if not job_ids:
+        return []
+    jobs = {
+        job.id: job
+        for job in db.query(database.FunctionJobDB).filter(
+            database.FunctionJobDB.id.in_(job_ids)
+        )
+    }
+    functions = function_definitions.get_many(
+        db, {job.functionID for job in jobs.values()}
+    )
+
+    claimed = []
+    orphans = []
+    for job_id in job_ids:
+        job = jobs[job_id]
+        function = functions.get(job.functionID)
+        if function is None:
+            orphans.append(
+                {
+                    "job_id": job_id,
+                    "status": models.JobStatus.FAILED,
+                    "job_info": {"error": "Function not found"},
+                }
+            )
+        else:
+            claimed.append((job, function))
+    if orphans:
+        finish_jobs(db, owner, orphans)
+    return claimed
+
+
+def finish_jobs(db: Session, owner: str, outcomes: List[Dict[str, Any]]) -> List[int]:
+    """
+    Store the outcomes of claimed jobs and release their leases, all in one
+    transaction.
+
+    Parameters:
+        outcomes: Dicts with the "job_id", the final "status" and optionally
+            the "outputs" and "job_info" of each job
+
+    Returns:
+        Ids of the jobs whose outcome was stored. Jobs whose lease the owner
+        lost meanwhile (they were requeued and possibly claimed by another
+        worker) are skipped.
+    """
+    jobs = database.FunctionJobDB
+    leases = database.FunctionJobLeaseDB
+    job_ids = [outcome["job_id"] for outcome in outcomes]
+
+    owned = {
+        job_id
+        for (job_id,) in db.query(leases.job_id).filter(
+            leases.job_id.in_(job_ids), leases.worker_id == owner
+        )
+    }
+    lost = set(job_ids) - owned
+    if lost:
+        logger.warning(f"Leases of jobs {sorted(lost)} were lost, discarding results")
+    if not owned:
+        db.rollback()
+        return []
+
+    # Keep what was recorded while queued, e.g. the requeue count
+    previous_info = dict(
+        db.query(jobs.id, jobs.job_info).filter(
+            jobs.id.in_(owned), jobs.job_info.isnot(None)
+        )
+    )
+    finished_at = datetime.utcnow()
+    mappings = []
+    for outcome in outcomes:
+        job_id = outcome["job_id"]
+        if job_id not in owned:
+            continue
+        job_info = outcome.get("job_info")
+        if previous_info.get(job_id):
+            job_info = {**previous_info[job_id], **(job_info or {})}
+        mappings.append(
+            {
+                "id": job_id,
+                "status": outcome["status"],
+                "outputs": outcome.get("outputs"),
+                "job_info": job_info,
+                "finished_at": finished_at,
+            }
+        )
+    db.bulk_update_mappings(jobs, mappings)
+    # Jobs with a lease are RUNNING
+    record_status_changes(
+        db,
+        [
+            (mapping["id"], models.JobStatus.RUNNING, mapping["status"])
+            for mapping in mappings
+        ],
+        finished_at,
+    )
+    db.query(leases).filter(leases.job_id.in_(owned)).delete(
+        synchronize_session=False
+    )
+    db.commit()
+    return [job_id for job_id in job_ids if job_id in owned]
+
+
+def finish_job(
+    db: Session,
+    job_id: int,
+    owner: str,
+    status: models.JobStatus,
+    outputs: Optional[Dict[str, Any]] = None,
+    job_info: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Store the outcome of a claimed job and release its lease.
+
+    Returns:
+        False if the owner lost the lease meanwhile, in which case nothing is
+        stored
+    """
+    outcome = {
+        "job_id": job_id,
+        "status": status,
+        "outputs": outputs,
+        "job_info": job_info,
+    }
+    return bool(finish_jobs(db, owner, [outcome]))
+
+
+def heartbeat(
+    db: Session, owner: str, lease_seconds: float = DEFAULT_LEASE_SECONDS
+) -> int:
+    """
+    Extend all leases held by an owner.
+
+    Returns:
+        Number of extended leases
+    """
+    now = datetime.utcnow()
+    count = (
+        db.query(database.FunctionJobLeaseDB)
+        .filter(database.FunctionJobLeaseDB.worker_id == owner)
+        .update(
+            {
+                database.FunctionJobLeaseDB.heartbeat_at: now,
+                database.FunctionJobLeaseDB.expires_at: now
+                + timedelta(seconds=lease_seconds),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return count
+
+
+def _requeue(db: Session, job: database.FunctionJobDB, reason: str) -> None:
+    job_info = dict(job.job_info or {})
+    requeues = job_info.get("requeues", 0) + 1
+    if requeues > MAX_REQUEUES:
+        job.status = models.JobStatus.FAILED
+        job.finished_at = datetime.utcnow()
+        job_info["error"] = f"Job was requeued too many times ({reason})"
+    else:
+        job.status = models.JobStatus.PENDING
+    job_info["requeues"] = requeues
+    job.job_info = job_info
+    record_status_changes(db, [(job.id, models.JobStatus.RUNNING, job.status)])
+
+
+def requeue_stale_jobs(db: Session, include_orphans: bool = False) -> int:
+    """
+    Put RUNNING jobs whose lease expired back to PENDING.
+
+    Parameters:
+        include_orphans: Also requeue RUNNING jobs without any lease, e.g. jobs
+            left behind by a server that ran them in-process before it stopped
+
+    Returns:
+        Number of requeued (or, after too many attempts, failed) jobs
+    """
+    jobs = database.FunctionJobDB
+    leases = database.FunctionJobLeaseDB
+    now = datetime.utcnow()
+
+    expired = db.query(leases).filter(leases.expires_at < now).all()
+    count = 0
+    for lease in expired:
+        job = db.query(jobs).get(lease.job_id)
+        if job is not None and job.status == models.JobStatus.RUNNING:
+            _requeue(db, job, f"lease of {lease.worker_id} expired")
+            count += 1
+        db.delete(lease)
+
+    if include_orphans:
+        orphans = (
+            db.query(jobs)
+            .filter(
+                jobs.status == models.JobStatus.RUNNING,
+                ~jobs.id.in_(db.query(leases.job_id).scalar_subquery()),
+            )
+            .all()
+        )
+        for job in orphans:
+            _requeue(db, job, "no worker owned it")
+            count += 1
+
+    db.commit()
+    if count:
+        logger.info(f"Requeued {count} stale jobs")
+    return count
+
+
+def release_owner_jobs(db: Session, owner: str) -> int:
+    """
+    Give up all jobs claimed by an owner (e.g. on shutdown) so other workers
+    can pick them up right away instead of waiting for the leases to expire.
+
+    Returns:
+        Number of released jobs
+    """
+    jobs = database.FunctionJobDB
+    leases = database.FunctionJobLeaseDB
+    job_ids = [
+        job_id
+        for (job_id,) in db.query(leases.job_id).filter(leases.worker_id == owner)
+    ]
+    if job_ids:
+        running = [
+            job_id
+            for (job_id,) in db.query(jobs.id).filter(
+                jobs.id.in_(job_ids), jobs.status == models.JobStatus.RUNNING
+            )
+        ]
+        db.query(jobs).filter(jobs.id.in_(running)).update(
+            {jobs.status: models.JobStatus.PENDING}, synchronize_session=False
+        )
+        record_status_changes(
+            db,
+            [
+                (job_id, models.JobStatus.RUNNING, models.JobStatus.PENDING)
+                for job_id in running
+            ],
+        )
+        db.query(leases).filter(leases.worker_id == owner).delete(
+            synchronize_session=False
+        )
+    db.commit()
+    return len(job_ids)
+
+
+class LeaseKeeper:
+    """Background thread that periodically extends the leases of an owner"""
+
+    def __init__(self, owner: str, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-keeper-{self.owner}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            db = database.SessionLocal()
+            try:
+                heartbeat(db, self.owner, self.lease_seconds)
+            except Exception as e:
+                logger.error(f"Heartbeat of {self.owner} failed: {str(e)}")
+                db.rollback()
+            finally:
+                db.close()
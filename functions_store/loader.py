@@ -0,0 +1,162 @@
+import hashlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _LoadedModule:
+    """A module loaded from a file, along with the file version it came from"""
+
+    def __init__(self, name: str, module: Any, signature: Tuple[int, int], digest: str):
+        self.name = name
+        self.module = module
+        self.signature = signature  # (mtime_ns, size) of the file
+        self.digest = digest  # sha256 of the file contents
+
+
+class FunctionLoader:
+    """
+    Thread-safe cache of functions loaded from Python files.
+
+    Each file is imported once under a unique module name and reused until
+    the file changes on disk (detected through its mtime and size, confirmed
+    with a content hash), at which point it is reloaded automatically.
+    """
+
+    def __init__(self):
+        self._modules: Dict[str, _LoadedModule] = {}
+        self._handles: Dict[Tuple[str, str, str], Callable] = {}
+        self._lock = threading.Lock()
+        self._path_locks: Dict[str, threading.Lock] = {}
+        # Digests of files hashed without being imported, keyed on path
+        self._digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def _path_lock(self, abs_path: str) -> threading.Lock:
+        with self._lock:
+            return self._path_locks.setdefault(abs_path, threading.Lock())
+
+    @staticmethod
+    def _module_name(abs_path: str, digest: str) -> str:
+        path_hash = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:12]
+        return f"_functions_store_{path_hash}_{digest[:12]}"
+
+    def _import(self, abs_path: str, signature: Tuple[int, int]) -> _LoadedModule:
+        with open(abs_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+
+        current = self._modules.get(abs_path)
+        if current is not None and current.digest == digest:
+            # Touched but unchanged, keep the loaded module
+            current.signature = signature
+            return current
+
+        name = self._module_name(abs_path, digest)
+        spec = importlib.util.spec_from_file_location(name, abs_path)
+        if spec is None:
+            raise ImportError(f"Could not load spec for {abs_path}")
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+
+        loaded = _LoadedModule(name, module, signature, digest)
+        with self._lock:
+            if current is not None:
+                sys.modules.pop(current.name, None)
+                self.reloads += 1
+                logger.info(f"Reloaded {abs_path} after it changed on disk")
+            self._modules[abs_path] = loaded
+        return loaded
+
+    def load(self, file_path: str, function_name: str) -> Callable:
+        """
+        Get a function from a Python file, importing the file only if it was
+        not loaded yet or changed since it was loaded.
+        """
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            loaded = self._modules.get(abs_path)
+            if loaded is not None and loaded.signature == signature:
+                handle = self._handles.get((abs_path, function_name, loaded.digest))
+                if handle is not None:
+                    self.hits += 1
+                    return handle
+
+        with self._path_lock(abs_path):
+            # Another thread may have loaded the file while we were waiting
+            loaded = self._modules.get(abs_path)
+            if loaded is None or loaded.signature != signature:
+                loaded = self._import(abs_path, signature)
+
+            if not hasattr(loaded.module, function_name):
+                raise AttributeError(f"Function {function_name} not found in {abs_path}")
+            handle = getattr(loaded.module, function_name)
+
+            with self._lock:
+                self.misses += 1
+                # Drop handles of previous versions of the file
+                for key in [k for k in self._handles if k[0] == abs_path]:
+                    if key[2] != loaded.digest:
+                        del self._handles[key]
+                self._handles[(abs_path, function_name, loaded.digest)] = handle
+            return handle
+
+    def file_digest(self, file_path: str) -> str:
+        """
+        Get the sha256 of the current contents of a file, the version of the
+        code loaded from it. Files are hashed again only when they change.
+        """
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            loaded = self._modules.get(abs_path)
+            if loaded is not None and loaded.signature == signature:
+                return loaded.digest
+            hashed = self._digests.get(abs_path)
+            if hashed is not None and hashed[0] == signature:
+                return hashed[1]
+
+        with open(abs_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with self._lock:
+            self._digests[abs_path] = (signature, digest)
+        return digest
+
+    def clear(self) -> None:
+        """Forget all loaded modules"""
+        with self._lock:
+            for loaded in self._modules.values():
+                sys.modules.pop(loaded.name, None)
+            self._modules.clear()
+            self._handles.clear()
+            self._digests.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "loaded_modules": len(self._modules),
+                "loaded_functions": len(self._handles),
+            }
+
+
+function_loader = FunctionLoader()
@@ -1,23 +1,61 @@
 import asyncio
-import importlib
 import json
 import logging
 import os
-import sys
 import urllib
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
-
-import requests
-from fastapi import Body, Depends, FastAPI, HTTPException, Path, Query
+from typing import Any, Dict, List, Optional, Union
+
+from fastapi import (
+    Body,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from jsonschema import ValidationError as JSONSchemaValidationError
-from jsonschema import validate
-from jsonschema.validators import validator_for
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from . import database, models
+from . import columnar, database, job_collections, job_queue, models
+from .catalog import ETAG_HEADERS, catalog_version, not_modified
+from .job_collections import record_status_changes
+from .events import (
+    collection_events,
+    job_changes,
+    job_events,
+    wait_for_collection,
+    wait_for_job,
+)
+from .executors import (
+    execute_function,
+    function_executors,
+    load_function_from_path,
+    register_function_executor,
+)
+from .function_cache import function_definitions
+from .function_search import clear_search_index, index_function, search_function_ids
+from .function_tags import clear_tags, index_tags, tagged_function_ids
+from .job_queue import LeaseKeeper, create_lease, new_owner_id, release_lease
+from .loader import function_loader
+from .pagination import (
+    NEXT_CURSOR_HEADER,
+    NEXT_CURSOR_RESPONSES,
+    decode_id_cursor,
+    id_page,
+    keyset_page,
+)
+from .remote import remote_http
+from .result_cache import cache_hit_job_info, make_cache_key, result_cache
+from .scheduler import scheduler, set_execution_limit
+from .tabulated import result_tables
+from .schema_validation import check_schema, schema_validators
+from .worker import JobWorker, with_session
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -36,53 +74,43 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
-function_executors: Dict[str, Callable] = {}
-
-
-def register_function_executor(type_name: str, executor: Callable):
-    """Register an executor for a specific function type"""
-    function_executors[type_name] = executor
-
-
-def execute_local_python(url: str, inputs: Dict[str, Any]) -> Any:
-    """Execute a local Python function"""
-    if ":" not in url:
-        raise ValueError("URL must be in format /path/to/file.py:function_name")
-
-    file_path, function_name = url.rsplit(":", 1)
-
-    func = load_function_from_path(file_path, function_name)
-
-    try:
-        return func(**inputs)
-    except Exception as e:
-        raise Exception(f"Error executing local Python function: {str(e)}")
+# Jobs are executed by workers claiming them from the durable job queue. By
+# default a worker runs embedded in the API process; set
+# FUNCTIONS_STORE_EMBEDDED_WORKER=0 when running `python -m functions_store worker`.
+EMBEDDED_WORKER = os.environ.get("FUNCTIONS_STORE_EMBEDDED_WORKER", "1") != "0"
 
+# Keeps alive the leases of jobs run synchronously by run_function
+api_lease_owner = new_owner_id("api")
+api_lease_keeper = LeaseKeeper(api_lease_owner)
 
-def execute_remote_http(url: str, inputs: Dict[str, Any]) -> Any:
-    """Execute a remote function via HTTP"""
-    try:
-        response = requests.post(url, json=inputs)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Error executing remote HTTP function: {str(e)}")
 
+@app.on_event("startup")
+async def start_workers():
+    api_lease_keeper.start()
+    if EMBEDDED_WORKER:
+        app.state.worker = JobWorker()
+        app.state.worker_task = asyncio.create_task(app.state.worker.run())
 
-# Register default executors
-register_function_executor("local.python", execute_local_python)
-register_function_executor("remote.http", execute_remote_http)
 
+@app.on_event("shutdown")
+async def stop_workers():
+    worker = getattr(app.state, "worker", None)
+    if worker is not None:
+        worker.stop()
+        await app.state.worker_task
+    api_lease_keeper.stop()
+    remote_http.close()
 
-def execute_function(function_type: str, url: str, inputs: Dict[str, Any]) -> Any:
-    """Execute a function based on its type"""
-    executor = function_executors.get(function_type)
-    if not executor:
-        raise ValueError(f"Unsupported function type: {function_type}")
 
-    return executor(url, inputs)
+def notify_workers() -> None:
+    """Wake up the embedded worker after jobs were enqueued"""
+    scheduler.invalidate_queue()
+    worker = getattr(app.state, "worker", None)
+    if worker is not None:
+        worker.notify()
 
 
 @app.get("/generate-openapi")
@@ -93,31 +121,23 @@ async def generate_openapi():
     return openapi_schema
 
 
-def load_function_from_path(file_path: str, function_name: str):
-    """Load a Python function from a file path"""
-    try:
-        # Get absolute path
-        abs_path = os.path.abspath(file_path)
-
-        # Load module spec
-        spec = importlib.util.spec_from_file_location("dynamic_module", abs_path)
-        if spec is None:
-            raise ImportError(f"Could not load spec for {abs_path}")
-
-        # Create module
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["dynamic_module"] = module
-
-        # Execute module
-        spec.loader.exec_module(module)
-
-        # Get function
-        if not hasattr(module, function_name):
-            raise AttributeError(f"Function {function_name} not found in {abs_path}")
+@app.get("/function/loader/stats", operation_id="get_loader_stats", tags=["function"])
+def get_loader_stats():
+    """
+    Get statistics of the cache of loaded local.python functions, of the
+    cache of tables of tabulated functions and of the cache of function
+    definitions.
 
-        return getattr(module, function_name)
-    except Exception as e:
-        raise Exception(f"Error loading function: {str(e)}")
+    Returns:
+        Hit, miss and reload counters and the number of loaded modules, with
+        the counters of the tables under "tables" and of the definitions
+        under "definitions"
+    """
+    return {
+        **function_loader.stats(),
+        "tables": result_tables.stats(),
+        "definitions": function_definitions.stats(),
+    }
 
 
 def get_db():
@@ -128,20 +148,121 @@ def get_db():
         db.close()
 
 
+# Fields of the summaries listed by default
+SUMMARY_FIELDS = ("id", "name", "type", "tags")
+
+# Responses of the paginated listings of functions, with an ETag
+LISTING_RESPONSES = {
+    200: {"headers": {**NEXT_CURSOR_RESPONSES[200]["headers"], **ETAG_HEADERS}},
+    304: {"description": "Not Modified"},
+}
+
+
+def function_page(
+    db: Session,
+    columns: List[Any],
+    response: Response,
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> List[Any]:
+    """
+    Get a page of functions, or of some of their columns, in id order.
+
+    The listings only open a database session when they are not answered
+    with a 304, hence this function instead of a get_db dependency.
+    """
+    return id_page(db.query(*columns), database.FunctionDB, response, limit, cursor)
+
+
 @app.get(
     "/function/list",
     response_model=List[models.Function],
     operation_id="list_functions",
     tags=["function"],
+    responses=LISTING_RESPONSES,
 )
-def list_functions(db: Session = Depends(get_db)):
+def list_functions(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of functions to return"),
+    cursor: Optional[str] = Query(None, description="Cursor of the page, from the X-Next-Cursor header"),
+):
     """
-    List all functions in the store.
+    List all functions in the store, in id order.
+
+    Listings carry an ETag: when sent back in If-None-Match, the answer is a
+    304 while no function was created or deleted.
+
+    Parameters:
+        limit: Maximum number of functions to return (default: all)
+        cursor: Cursor of the page to return, as returned in the X-Next-Cursor
+            header of the previous page. The header is absent on the last page.
 
     Returns:
         List of all registered functions
     """
-    return db.query(database.FunctionDB).all()
+    unchanged = not_modified(request, response)
+    if unchanged is not None:
+        return unchanged
+    return with_session(
+        function_page, [database.FunctionDB], response, limit, cursor
+    )
+
+
+@app.get(
+    "/function/summary",
+    response_model=List[models.FunctionSummary],
+    response_model_exclude_unset=True,
+    operation_id="list_function_summaries",
+    tags=["function"],
+    responses=LISTING_RESPONSES,
+)
+def list_function_summaries(
+    request: Request,
+    response: Response,
+    fields: str = Query(",".join(SUMMARY_FIELDS), description="Comma-separated fields of the functions to return"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of functions to return"),
+    cursor: Optional[str] = Query(None, description="Cursor of the page, from the X-Next-Cursor header"),
+):
+    """
+    List summaries of the functions in the store, in id order, with only the
+    selected fields read from the database (by default, not the schemas).
+
+    Listings carry an ETag: when sent back in If-None-Match, the answer is a
+    304 while no function was created or deleted.
+
+    Parameters:
+        fields: Comma-separated fields of the functions to return, among the
+            fields of a function (default: id,name,type,tags). The id is
+            always returned.
+        limit: Maximum number of functions to return (default: 100)
+        cursor: Cursor of the page to return, as returned in the X-Next-Cursor
+            header of the previous page. The header is absent on the last page.
+
+    Returns:
+        List of the functions with the selected fields
+
+    Raises:
+        HTTPException: If a field is not a field of functions
+    """
+    selected = ["id"]
+    for field in fields.split(","):
+        field = field.strip()
+        if field and field not in selected:
+            selected.append(field)
+    unknown = [field for field in selected if field not in models.Function.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields {unknown}, expected some of {list(models.Function.model_fields)}",
+        )
+
+    unchanged = not_modified(request, response)
+    if unchanged is not None:
+        return unchanged
+    columns = [getattr(database.FunctionDB, field) for field in selected]
+    rows = with_session(function_page, columns, response, limit, cursor)
+    return [row._asdict() for row in rows]
 
 
 @app.delete("/function/all", operation_id="delete_all_functions", tags=["function"])
@@ -153,11 +274,61 @@ def delete_all_functions(db: Session = Depends(get_db)):
         Message confirming deletion with count of deleted functions
     """
     count = db.query(database.FunctionDB).count()
+    clear_tags(db)
+    clear_search_index(db)
     db.query(database.FunctionDB).delete()
+    catalog_version.bump(db)
     db.commit()
+    catalog_version.invalidate()
+    # Drop results memoized for the deleted functions
+    result_cache.invalidate(db)
+    schema_validators.invalidate()
+    function_definitions.invalidate()
     return {"message": f"Deleted {count} functions"}
 
 
+@app.get("/function/cache/stats", operation_id="get_result_cache_stats", tags=["function"])
+def get_result_cache_stats():
+    """
+    Get statistics of the result cache of cacheable functions.
+
+    Returns:
+        Hit and miss counters and the cache configuration
+    """
+    return result_cache.stats()
+
+
+@app.delete("/function/cache", operation_id="invalidate_result_cache", tags=["function"])
+def invalidate_result_cache(db: Session = Depends(get_db)):
+    """
+    Invalidate the cached results of all functions.
+
+    Returns:
+        Message confirming invalidation with count of removed results
+    """
+    count = result_cache.invalidate(db)
+    return {"message": f"Invalidated {count} cached results"}
+
+
+@app.delete(
+    "/function/{function_id}/cache",
+    operation_id="invalidate_function_cache",
+    tags=["function"],
+)
+def invalidate_function_cache(function_id: int, db: Session = Depends(get_db)):
+    """
+    Invalidate the cached results of a function.
+
+    Parameters:
+        function_id: ID of the function whose cached results are dropped
+
+    Returns:
+        Message confirming invalidation with count of removed results
+    """
+    count = result_cache.invalidate(db, function_id)
+    return {"message": f"Invalidated {count} cached results"}
+
+
 @app.get(
     "/function/searchByName",
     response_model=List[models.Function],
@@ -181,6 +352,44 @@ def search_functions_by_name(name: str, db: Session = Depends(get_db)):
     )
 
 
+@app.get(
+    "/function/search",
+    response_model=List[models.Function],
+    operation_id="search_functions",
+    tags=["function"],
+)
+def search_functions(
+    q: str = Query(..., description="Words to search for"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of functions to return"),
+    offset: Optional[int] = Query(None, ge=0, description="Number of functions to skip"),
+    db: Session = Depends(get_db),
+):
+    """
+    Full-text search over the names, descriptions and tags of the functions,
+    for search-as-you-type.
+
+    Parameters:
+        q: Words to search for. Each must be the start of a word of the name,
+            description or tags of a function (case-insensitive)
+        limit: Maximum number of functions to return (default: 20)
+        offset: Number of functions to skip, for the next pages of results
+
+    Returns:
+        The matching functions, best match first: matches in names rank
+        above matches in tags, which rank above matches in descriptions
+    """
+    function_ids = search_function_ids(db, q, limit, offset)
+    if not function_ids:
+        return []
+    functions = {
+        function.id: function
+        for function in db.query(database.FunctionDB).filter(
+            database.FunctionDB.id.in_(function_ids)
+        )
+    }
+    return [functions[function_id] for function_id in function_ids if function_id in functions]
+
+
 # FunctionJob endpoints
 @app.get(
     "/functionJob/{function_job_id}",
@@ -211,6 +420,69 @@ def get_function_job(function_job_id: int, db: Session = Depends(get_db)):
     return job
 
 
+# Longest wait of the long-poll endpoints, below common proxy timeouts
+MAX_WAIT_SECONDS = 300
+
+EVENT_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@app.get(
+    "/functionJob/{function_job_id}/events",
+    operation_id="stream_function_job_events",
+    tags=["function_job"],
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+def stream_function_job_events(function_job_id: int, db: Session = Depends(get_db)):
+    """
+    Stream the status transitions of a function job as Server-Sent Events.
+
+    A "status" event with the job is sent each time its status changes; the
+    stream ends after the job completed or failed.
+
+    Raises:
+        HTTPException: If job is not found (404)
+    """
+    if not db.query(database.FunctionJobDB.id).filter_by(id=function_job_id).first():
+        raise HTTPException(status_code=404, detail="Function job not found")
+    return StreamingResponse(
+        job_events(function_job_id),
+        media_type="text/event-stream",
+        headers=EVENT_STREAM_HEADERS,
+    )
+
+
+@app.get(
+    "/functionJob/{function_job_id}/wait",
+    response_model=models.FunctionJob,
+    operation_id="wait_for_function_job",
+    tags=["function_job"],
+)
+async def wait_for_function_job(
+    function_job_id: int,
+    timeout: float = Query(
+        30, ge=0, le=MAX_WAIT_SECONDS, description="Seconds to wait at most"
+    ),
+):
+    """
+    Wait until a function job completed or failed (long poll).
+
+    Parameters:
+        function_job_id: ID of the function job to wait for
+        timeout: Seconds to wait at most
+
+    Returns:
+        The function job, still PENDING or RUNNING if the timeout expired
+
+    Raises:
+        HTTPException: If job is not found (404)
+    """
+    job = await wait_for_job(function_job_id, timeout)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Function job not found")
+    return job
+
+
 def process_single_input(
     function: database.FunctionDB, inputs: str, db: Session
 ) -> database.FunctionJobDB:
@@ -298,129 +570,49 @@ async def get_jobs_status(
 
 # Add configuration endpoint to update parallel processing settings
 @app.post("/function/config", tags=["function"])
-async def update_function_config(
-    max_parallel_jobs: int = 10, db: Session = Depends(get_db)
+def update_function_config(
+    max_parallel_jobs: int = 10,
+    function_id: Optional[int] = None,
+    weight: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
 ):
     """
     Update function execution configuration settings.
+    Limits are stored in the database and honored by all workers.
 
     Parameters:
         max_parallel_jobs: Maximum number of parallel jobs allowed (default: 10)
+        function_id: Optional function to set the limit for, instead of the
+            server-wide limit
+        weight: Optional share of the function when several functions have
+            jobs waiting (default: 1). The share of a function is split
+            evenly between its collections with jobs waiting.
 
     Returns:
         Updated configuration settings
     """
-    # In a production environment, you might want to store these in a database
-    # or configuration service instead of using global variables
-    app.state.max_parallel_jobs = max_parallel_jobs
-
-    return {"max_parallel_jobs": max_parallel_jobs}
+    limit = set_execution_limit(db, max_parallel_jobs, function_id, weight)
+    scheduler.invalidate()
 
+    if function_id is None:
+        return {"max_parallel_jobs": limit.max_parallel_jobs}
+    return {
+        "function_id": function_id,
+        "max_parallel_jobs": limit.max_parallel_jobs,
+        "weight": limit.weight,
+    }
 
-async def process_single_job(
-    function: database.FunctionDB,
-    job: database.FunctionJobDB,
-    task_db: Session,
-    executor: ThreadPoolExecutor,
-    loop: asyncio.AbstractEventLoop,
-):
-    """Process a single job and update its status."""
-    job_id = job.id
-    logger.info(f"Starting processing of job {job_id}")
-
-    try:
-        # Update to RUNNING
-        job.status = models.JobStatus.RUNNING
-        task_db.commit()
-        logger.info(f"Job {job_id} marked as RUNNING")
-
-        # Execute the function in the thread pool
-        logger.info(f"Executing job {job_id} with inputs {job.inputs}")
-        result = await loop.run_in_executor(
-            executor,
-            lambda: execute_function(function.type, function.url, job.inputs),
-        )
-        logger.info(f"Job {job_id} execution completed with result: {result}")
 
-        # Update job status to COMPLETED
-        job = task_db.query(database.FunctionJobDB).get(job_id)  # Refresh job from DB
-        job.outputs = {"result": result}
-        job.status = models.JobStatus.COMPLETED
-        task_db.commit()
-        logger.info(f"Job {job_id} marked as COMPLETED")
-
-    except Exception as e:
-        logger.error(f"Error processing job {job_id}: {str(e)}", exc_info=True)
-        # Update job with error
-        job = task_db.query(database.FunctionJobDB).get(job_id)  # Refresh job from DB
-        job.status = models.JobStatus.FAILED
-        job.job_info = {"error": str(e)}
-        task_db.commit()
-
-    return job_id
-
-
-async def process_inputs_async(
-    function: database.FunctionDB,
-    jobs: List[database.FunctionJobDB],
-    db: Session,
-    max_workers: Optional[int] = None,
-):
+@app.get("/function/scheduler", operation_id="get_scheduler_stats", tags=["function"])
+def get_scheduler_stats(db: Session = Depends(get_db)):
     """
-    Process inputs asynchronously in the background.
-    """
-    logger.info(f"Starting background processing for {len(jobs)} jobs")
-
-    # Create a new database session for background task
-    task_db = database.SessionLocal()
-
-    try:
-        # Get the event loop
-        loop = asyncio.get_running_loop()
-
-        # Use default max_workers if none provided
-        workers = max_workers if max_workers is not None else 10
-        logger.info(f"Using {workers} workers for processing")
-
-        # Create a thread pool executor for running the functions
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Process jobs concurrently using the executor
-            tasks = []
-            for job in jobs:
-                task = asyncio.create_task(
-                    process_single_job(
-                        function=function,
-                        job=job,
-                        task_db=task_db,
-                        executor=executor,
-                        loop=loop,
-                    )
-                )
-                tasks.append(task)
+    Get the state of the job scheduler.
 
-            # Wait for all tasks to complete
-            logger.info("Waiting for all tasks to complete")
-            completed_job_ids = await asyncio.gather(*tasks)
-            logger.info(f"All tasks completed. Job IDs: {completed_job_ids}")
-
-    except Exception as e:
-        logger.error(f"Error in background processing: {str(e)}", exc_info=True)
-        # Update all remaining jobs as failed
-        for job in jobs:
-            if job.status in [
-                models.JobStatus.PENDING,
-                models.JobStatus.RUNNING,
-            ]:
-                job = task_db.query(database.FunctionJobDB).get(
-                    job.id
-                )  # Refresh from DB
-                job.status = models.JobStatus.FAILED
-                job.job_info = {"error": f"Background task error: {str(e)}"}
-                task_db.add(job)
-        task_db.commit()
-
-    finally:
-        task_db.close()
+    Returns:
+        Number of pending (queue depth) and running jobs with the configured
+        limits, overall and per function
+    """
+    return scheduler.stats(db)
 
 
 @app.post(
@@ -441,16 +633,56 @@ def create_function_job_collection(
     Returns:
         Created function job collection
     """
-    db_collection = database.FunctionJobCollectionDB(
+    missing = job_collections.missing_jobs(db, collection.job_ids)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Jobs not found: {missing}")
+
+    db_collection = job_collections.create_collection(
+        db,
         name=collection.name,
         description=collection.description,
         job_ids=collection.job_ids,
         status=collection.status,
     )
-    db.add(db_collection)
     db.commit()
     db.refresh(db_collection)
-    return db_collection
+    return job_collections.to_model(db, db_collection)
+
+
+@app.post(
+    "/functionJobCollection/{collection_id}/jobs",
+    response_model=models.FunctionJobCollection,
+    operation_id="add_jobs_to_collection",
+    tags=["function_job_collection"],
+)
+def add_jobs_to_collection(
+    collection_id: int,
+    job_ids: List[int] = Body(..., embed=False),
+    db: Session = Depends(get_db),
+):
+    """
+    Add jobs to a function job collection. Jobs already in the collection are
+    skipped.
+
+    Parameters:
+        collection_id: ID of the collection
+        job_ids: IDs of the jobs to add
+
+    Returns:
+        The updated function job collection
+    """
+    collection = db.query(database.FunctionJobCollectionDB).get(collection_id)
+    if not collection:
+        raise HTTPException(status_code=404, detail="Function job collection not found")
+
+    missing = job_collections.missing_jobs(db, job_ids)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Jobs not found: {missing}")
+
+    job_collections.add_jobs(db, collection_id, job_ids)
+    db.commit()
+    db.refresh(collection)
+    return job_collections.to_model(db, collection)
 
 
 @app.get(
@@ -466,7 +698,9 @@ def list_function_job_collections(db: Session = Depends(get_db)):
     Returns:
         List of all function job collections
     """
-    return db.query(database.FunctionJobCollectionDB).all()
+    return job_collections.to_models(
+        db, db.query(database.FunctionJobCollectionDB).all()
+    )
 
 
 @app.post(
@@ -475,10 +709,10 @@ def list_function_job_collections(db: Session = Depends(get_db)):
     operation_id="batch_run_function",
     tags=["function"],
 )
-async def batch_run_function(
+def batch_run_function(
     function_id: int,
     collection_name: str,
-    request_body: List[str] = Body(..., embed=False),
+    request_body: List[Union[Dict[str, Any], str]] = Body(..., embed=False),
     max_workers: Optional[int] = None,
     db: Session = Depends(get_db),
 ):
@@ -488,28 +722,97 @@ async def batch_run_function(
     Parameters:
         function_id: ID of the function to run
         collection_name: Name for the job collection
-        request_body: List of JSON strings containing input parameters
-        max_workers: Optional maximum number of parallel workers
+        request_body: List of input parameters, as JSON objects or JSON strings
+        max_workers: Deprecated, concurrency is configured on the workers
 
     Returns:
         Created function job collection containing all job IDs
     """
-    # First create jobs using existing map_function
-    jobs = await map_function(function_id, request_body, max_workers, db)
+    return create_batch(db, function_id, collection_name, request_body)
+
+
+@app.post(
+    "/function/{function_id}/batch/columns",
+    response_model=models.FunctionJobCollection,
+    operation_id="batch_run_function_columns",
+    tags=["function"],
+    openapi_extra=columnar.OPENAPI_REQUEST_BODY,
+)
+async def batch_run_function_columns(
+    request: Request,
+    function_id: int,
+    collection_name: str,
+    db: Session = Depends(get_db),
+):
+    """
+    Run a function with the rows of a column-oriented input matrix and create
+    a job collection.
+
+    The matrix has one column per input and one row per job, as CSV with a
+    header line (text/csv), a JSON object mapping column names to lists of
+    values (application/json), an Arrow IPC stream or file (if pyarrow is
+    installed on the server) or a structured NumPy array (application/x-npy).
+
+    Parameters:
+        function_id: ID of the function to run
+        collection_name: Name for the job collection
+
+    Returns:
+        Created function job collection containing all job IDs
+
+    Raises:
+        HTTPException: If the function is not found (404), the matrix is
+            malformed or its columns do not match the input schema (400), or
+            the content type is not supported (415)
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type")
+    return await run_in_threadpool(
+        create_column_batch, db, function_id, collection_name, content_type, body
+    )
+
+
+def create_column_batch(
+    db: Session,
+    function_id: int,
+    collection_name: str,
+    content_type: Optional[str],
+    body: bytes,
+) -> models.FunctionJobCollection:
+    function = function_definitions.get(db, function_id)
+    if not function:
+        raise HTTPException(status_code=404, detail="Function not found")
+    frame = columnar.read_columns(content_type, body)
+    columnar.check_columns(list(frame.columns), function.input_schema)
+    return create_batch(db, function_id, collection_name, columnar.to_inputs(frame))
 
-    # Create a job collection
-    db_collection = database.FunctionJobCollectionDB(
+
+def create_batch(
+    db: Session,
+    function_id: int,
+    collection_name: str,
+    inputs: List[Union[Dict[str, Any], str]],
+) -> models.FunctionJobCollection:
+    """Enqueue the jobs of a batch and create their collection"""
+    # Create the jobs and their collection in one transaction, so the
+    # collection counts every job transition
+    jobs = enqueue_jobs(db, function_id, inputs)
+    job_ids = [job.id for job in jobs]
+    db_collection = job_collections.create_collection(
+        db,
         name=collection_name,
         description=f"Batch execution of function {function_id}",
-        job_ids=[job.id for job in jobs],
+        job_ids=job_ids,
         status="RUNNING",
     )
-    db.add(db_collection)
     db.commit()
     db.refresh(db_collection)
 
+    if any(job.status == models.JobStatus.PENDING for job in jobs):
+        notify_workers()
+
     # Convert to Pydantic model
-    return models.FunctionJobCollection.model_validate(db_collection)
+    return job_collections.to_model(db, db_collection, job_ids)
 
 
 @app.get(
@@ -518,72 +821,183 @@ async def batch_run_function(
     operation_id="get_collection_status",
     tags=["function_job_collection"],
 )
-async def get_collection_status(collection_id: int, db: Session = Depends(get_db)):
+def get_collection_status(
+    collection_id: int,
+    include_job_ids: bool = Query(
+        True,
+        description="Include the IDs of all jobs of the collection. Pollers "
+        "should pass false: the status is then read from a single row.",
+    ),
+    db: Session = Depends(get_db),
+):
     """
     Get status of a function job collection.
 
+    The number of jobs per status is maintained as jobs change status, so with
+    include_job_ids=false this is a constant-time read of a single row however
+    large the collection. By default the IDs of all jobs are read as well,
+    which takes time proportional to the number of jobs.
+
     Parameters:
         collection_id: ID of the collection to check
+        include_job_ids: Whether to return the IDs of all jobs (default: true)
 
     Returns:
-        Collection details including current status of all jobs
+        Collection details including the number of jobs per status, the
+        fraction of finished jobs (progress) and when the first and last jobs
+        finished
     """
-    # Get collection
-    collection = (
-        db.query(database.FunctionJobCollectionDB)
-        .filter(database.FunctionJobCollectionDB.id == collection_id)
-        .first()
-    )
+    collection = db.query(database.FunctionJobCollectionDB).get(collection_id)
     if not collection:
         raise HTTPException(status_code=404, detail="Function job collection not found")
 
-    # Get status of all jobs in collection
-    jobs = (
-        db.query(database.FunctionJobDB)
-        .filter(database.FunctionJobDB.id.in_(collection.job_ids))
-        .all()
+    return job_collections.to_model(db, collection, include_job_ids=include_job_ids)
+
+
+@app.get(
+    "/functionJobCollection/{collection_id}/results",
+    operation_id="export_collection_results",
+    tags=["function_job_collection"],
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {
+                media_type: {} for media_type in columnar.EXPORT_FORMATS.values()
+            }
+        }
+    },
+)
+def export_collection_results(
+    collection_id: int,
+    format: str = Query(
+        "csv",
+        pattern="^(" + "|".join(columnar.EXPORT_FORMATS) + ")$",
+        description="Format of the table: " + ", ".join(columnar.EXPORT_FORMATS),
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Export the results of a function job collection as a single table.
+
+    The table has one row per job, in the order the jobs were created, with
+    the job id and status, an inputs.<name> and an outputs.<name> column per
+    input and output, and the error of failed jobs. It is streamed as it is
+    read from the database.
+
+    Parameters:
+        collection_id: ID of the collection
+        format: csv, ndjson (one JSON object per line), arrow (IPC stream) or
+            parquet; arrow and parquet require pyarrow on the server
+
+    Raises:
+        HTTPException: If collection is not found (404), or the format is
+            not available (415)
+    """
+    if not db.query(database.FunctionJobCollectionDB.id).filter_by(id=collection_id).first():
+        raise HTTPException(status_code=404, detail="Function job collection not found")
+    return StreamingResponse(
+        columnar.export_results(collection_id, format),
+        media_type=columnar.EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="collection_{collection_id}.{format}"'
+        },
     )
 
-    # Update collection status based on job statuses
-    if all(job.status == models.JobStatus.COMPLETED for job in jobs):
-        collection.status = "COMPLETED"
-    elif any(job.status == models.JobStatus.FAILED for job in jobs):
-        collection.status = "FAILED"
-    else:
-        collection.status = "RUNNING"
 
-    db.commit()
+@app.get(
+    "/functionJobCollection/{collection_id}/events",
+    operation_id="stream_collection_events",
+    tags=["function_job_collection"],
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+def stream_collection_events(
+    collection_id: int,
+    last_event_id: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream the progress of a function job collection as Server-Sent Events.
 
-    # Convert to Pydantic model
-    return models.FunctionJobCollection.model_validate(collection)
+    Events:
+        progress: The collection with its job counts and progress, sent when
+            the counts change
+        job: A job that completed or failed, with its outputs
+        done: The collection, once all of its jobs finished; the stream ends
+
+    A client reconnecting with the Last-Event-ID header of the last "job"
+    event only receives the jobs whose outcome was stored after it.
+
+    Raises:
+        HTTPException: If collection is not found (404)
+    """
+    if not db.query(database.FunctionJobCollectionDB.id).filter_by(id=collection_id).first():
+        raise HTTPException(status_code=404, detail="Function job collection not found")
+    after = decode_id_cursor(last_event_id) if last_event_id else None
+    return StreamingResponse(
+        collection_events(collection_id, after),
+        media_type="text/event-stream",
+        headers=EVENT_STREAM_HEADERS,
+    )
+
+
+@app.get(
+    "/functionJobCollection/{collection_id}/wait",
+    response_model=models.FunctionJobCollection,
+    operation_id="wait_for_collection",
+    tags=["function_job_collection"],
+)
+async def wait_for_function_job_collection(
+    collection_id: int,
+    timeout: float = Query(
+        30, ge=0, le=MAX_WAIT_SECONDS, description="Seconds to wait at most"
+    ),
+):
+    """
+    Wait until all jobs of a function job collection finished (long poll).
+
+    Parameters:
+        collection_id: ID of the collection to wait for
+        timeout: Seconds to wait at most
+
+    Returns:
+        The collection with its job counts and progress (without job IDs),
+        not finished yet if the timeout expired
+
+    Raises:
+        HTTPException: If collection is not found (404)
+    """
+    collection = await wait_for_collection(collection_id, timeout)
+    if collection is None:
+        raise HTTPException(status_code=404, detail="Function job collection not found")
+    return collection
 
 
 def validate_schema(schema: Dict[str, Any]) -> None:
     """
     Validate that a schema is a valid JSON Schema.
-    Raises ValidationError if the schema is invalid.
+    Raises SchemaError if the schema is invalid.
     """
-    # Get the appropriate validator
-    validator_cls = validator_for(schema)
-    # Check schema itself is valid
-    validator_cls.check_schema(schema)
+    check_schema(schema)
 
 
-def validate_against_json_schema(
-    data: Dict[str, Any], schema: Dict[str, Any], context: str = "data"
-) -> None:
+def parse_inputs(request_body: List[Union[Dict[str, Any], str]]) -> List[Any]:
     """
-    Validate data against a JSON Schema.
-    Raises HTTPException with detailed error message if validation fails.
+    Parse the inputs of a batch, given as objects or JSON strings, raising a
+    400 error on invalid JSON
     """
-    try:
-        validate(instance=data, schema=schema)
-    except JSONSchemaValidationError as e:
-        path = " -> ".join(str(p) for p in e.path) if e.path else "root"
-        raise HTTPException(
-            status_code=400,
-            detail=f"{context} validation failed at {path}: {e.message}",
-        )
+    inputs = []
+    for input_str in request_body:
+        if not isinstance(input_str, str):
+            inputs.append(input_str)
+            continue
+        try:
+            inputs.append(json.loads(input_str))
+        except json.JSONDecodeError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid JSON in inputs: {input_str}"
+            )
+    return inputs
 
 
 @app.post(
@@ -618,27 +1032,117 @@ def create_function(function: models.Function, db: Session = Depends(get_db)):
     # Create database model from pydantic model
     db_function = database.FunctionDB(**function.dict(exclude={"id"}))
     db.add(db_function)
+    db.flush()
+    index_tags(db, db_function.id, db_function.tags)
+    index_function(db, db_function)
+    catalog_version.bump(db)
     db.commit()
     db.refresh(db_function)
+    schema_validators.invalidate(db_function.id)
+    function_definitions.invalidate(db_function.id)
+    catalog_version.invalidate()
     return db_function
 
 
+def finish_running_job(
+    db: Session,
+    job: database.FunctionJobDB,
+    status: models.JobStatus,
+    outputs: Optional[Dict[str, Any]] = None,
+    job_info: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Store the outcome of a job run by the API and release its lease"""
+    job.status = status
+    job.finished_at = datetime.utcnow()
+    if outputs is not None:
+        job.outputs = outputs
+    if job_info is not None:
+        job.job_info = job_info
+    release_lease(db, job.id)
+    record_status_changes(
+        db, [(job.id, models.JobStatus.RUNNING, status)], job.finished_at
+    )
+    db.commit()
+    job_changes.notify()
+
+
 @app.post(
     "/function/{function_id}/run",
     response_model=models.FunctionJob,
     operation_id="run_function",
     tags=["function"],
 )
-def run_function(function_id: int, inputs: str, db: Session = Depends(get_db)):
+async def run_function(
+    function_id: int,
+    inputs: str,
+    wait: Optional[float] = Query(
+        None,
+        ge=0,
+        le=MAX_WAIT_SECONDS,
+        description="Seconds to wait for the job to finish at most",
+    ),
+    sync: bool = Query(
+        False, description="Run the function in the request and return when it finished"
+    ),
+):
     """
     Run a function with the given inputs.
+
+    The job is enqueued and returned right away as PENDING, to be executed by
+    the workers like the jobs of map_function; poll it with get_function_job
+    or wait_for_function_job. With wait, the job is returned as soon as it
+    finished, or still PENDING or RUNNING when the wait timed out.
+
+    With sync, the function is run in the request as before, occupying a
+    server thread until it finished. Either way, dict results are the outputs
+    of the job, other results are stored as {"result": value}, and outputs
+    that do not match the output schema fail the job.
+
+    Parameters:
+        function_id: ID of the function
+        inputs: JSON-encoded inputs
+        wait: Seconds to wait for the job to finish at most
+        sync: Run the function in the request
+
+    Returns:
+        The function job, FAILED if the inputs do not match the input schema
+
+    Raises:
+        HTTPException: If function is not found (404) or inputs are invalid
+            JSON (400)
+    """
+    if sync:
+        return await run_in_threadpool(
+            with_session, run_function_inline, function_id, inputs
+        )
+
+    job = await run_in_threadpool(with_session, enqueue_run, function_id, inputs)
+    if job.status == models.JobStatus.PENDING:
+        notify_workers()
+        if wait:
+            job = await wait_for_job(job.id, wait) or job
+    return job
+
+
+def enqueue_run(db: Session, function_id: int, inputs: str) -> models.FunctionJob:
+    """Enqueue the job of a function run, for the workers"""
+    job = enqueue_jobs(db, function_id, [inputs])[0]
+    db.commit()
+    return job
+
+
+def run_function_inline(db: Session, function_id: int, inputs: str) -> models.FunctionJob:
+    """Run a function in the current thread, for sync runs"""
+    job = execute_run(db, function_id, inputs)
+    return models.FunctionJob.model_validate(job, from_attributes=True)
+
+
+def execute_run(db: Session, function_id: int, inputs: str) -> database.FunctionJobDB:
+    """
+    Create the job of a function run and execute it.
     Validates inputs and outputs against JSON Schema if defined.
     """
-    function = (
-        db.query(database.FunctionDB)
-        .filter(database.FunctionDB.id == function_id)
-        .first()
-    )
+    function = function_definitions.get(db, function_id)
     if not function:
         raise HTTPException(status_code=404, detail="Function not found")
 
@@ -648,29 +1152,50 @@ def run_function(function_id: int, inputs: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Invalid JSON in inputs")
 
     # Validate inputs against schema if defined
-    if function.input_schema:
-        try:
-            validate_against_json_schema(inputs_dict, function.input_schema, "Input")
-        except HTTPException as e:
-            # Create failed job with validation error
+    input_validator = function.input_validator
+    error = input_validator.error(inputs_dict) if input_validator else None
+    if error:
+        # Create failed job with validation error
+        job = database.FunctionJobDB(
+            functionID=function_id,
+            status=models.JobStatus.FAILED,
+            inputs=inputs_dict,
+            job_info={"error": error},
+            finished_at=datetime.utcnow(),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    # Answer from the result cache if this call was already computed
+    cache_key = None
+    if function.cacheable:
+        cache_key = make_cache_key(function, inputs_dict)
+        cached = result_cache.get(db, cache_key)
+        if cached is not None:
             job = database.FunctionJobDB(
                 functionID=function_id,
-                status=models.JobStatus.FAILED,
+                status=models.JobStatus.COMPLETED,
                 inputs=inputs_dict,
-                job_info={"error": str(e.detail)},
+                outputs=cached["outputs"],
+                job_info=cache_hit_job_info(cached),
+                finished_at=datetime.utcnow(),
             )
             db.add(job)
             db.commit()
             db.refresh(job)
             return job
 
-    # Create and start job
+    # Create and start job, leased so that workers do not requeue it
     job = database.FunctionJobDB(
         functionID=function_id,
         status=models.JobStatus.RUNNING,
         inputs=inputs_dict,
     )
     db.add(job)
+    db.flush()
+    create_lease(db, job.id, api_lease_owner)
     db.commit()
     db.refresh(job)
 
@@ -678,37 +1203,67 @@ def run_function(function_id: int, inputs: str, db: Session = Depends(get_db)):
         result = execute_function(function.type, function.url, inputs_dict)
 
         # Validate output against schema if defined
-        if function.output_schema:
-            try:
-                if isinstance(result, dict):
-                    output_dict = result
-                else:
-                    output_dict = {"result": result}
-                validate_against_json_schema(
-                    output_dict, function.output_schema, "Output"
-                )
-            except HTTPException as e:
-                job.status = models.JobStatus.FAILED
-                job.job_info = {"error": str(e.detail)}
-                db.commit()
-                return job
-
-        if isinstance(result, dict):
-            job.outputs = result
-        else:
-            job.outputs = {"result": result}
-        job.status = models.JobStatus.COMPLETED
-        db.commit()
+        outputs, error = function.outputs(result)
+        if error:
+            finish_running_job(
+                db, job, models.JobStatus.FAILED, job_info={"error": error}
+            )
+            return job
+
+        finish_running_job(db, job, models.JobStatus.COMPLETED, outputs=outputs)
+
+        if cache_key:
+            result_cache.put(db, cache_key, function_id, job.outputs, job.id)
 
     except Exception as e:
-        job.status = models.JobStatus.FAILED
-        job.job_info = {"error": str(e)}
-        db.commit()
+        finish_running_job(db, job, models.JobStatus.FAILED, job_info={"error": str(e)})
         print(f"Error executing function: {str(e)}")
 
     return job
 
 
+@app.post(
+    "/function/{function_id}/validate",
+    response_model=List[models.InputValidationResult],
+    operation_id="validate_function_inputs",
+    tags=["function"],
+)
+def validate_function_inputs(
+    function_id: int,
+    request_body: List[Union[Dict[str, Any], str]] = Body(..., embed=False),
+    db: Session = Depends(get_db),
+):
+    """
+    Validate a batch of inputs against the input schema of a function, without
+    running it.
+
+    Parameters:
+        function_id: ID of the function
+        request_body: List of inputs, as for map_function
+
+    Returns:
+        The result of each input, in order, with the validation error of the
+        invalid ones. All inputs are valid for functions without input schema.
+    """
+    function = function_definitions.get(db, function_id)
+    if not function:
+        raise HTTPException(status_code=404, detail="Function not found")
+
+    input_validator = function.input_validator
+    results = []
+    for index, input_str in enumerate(request_body):
+        try:
+            inputs_dict = parse_inputs([input_str])[0]
+        except HTTPException:
+            error = "Invalid JSON in inputs"
+        else:
+            error = input_validator.error(inputs_dict) if input_validator else None
+        results.append(
+            models.InputValidationResult(index=index, valid=error is None, error=error)
+        )
+    return results
+
+
 # Modify map_function to include schema validation
 @app.post(
     "/function/{function_id}/map",
@@ -716,79 +1271,82 @@ def run_function(function_id: int, inputs: str, db: Session = Depends(get_db)):
     operation_id="map_function",
     tags=["function"],
 )
-async def map_function(
+def map_function(
     function_id: int,
-    request_body: List[str] = Body(..., embed=False),
+    request_body: List[Union[Dict[str, Any], str]] = Body(..., embed=False),
     max_workers: Optional[int] = None,
     db: Session = Depends(get_db),
 ):
     """
     Start asynchronous processing of multiple inputs with schema validation.
+
+    Inputs are given either as JSON objects or, as before, as JSON-encoded
+    strings. Jobs are enqueued as PENDING and executed by the workers.
+    max_workers is kept for compatibility, concurrency is configured on the
+    workers.
     """
-    function = (
-        db.query(database.FunctionDB)
-        .filter(database.FunctionDB.id == function_id)
-        .first()
-    )
+    jobs = enqueue_jobs(db, function_id, request_body)
+    db.commit()
+
+    # Jobs that passed validation are picked up by the workers
+    if any(job.status == models.JobStatus.PENDING for job in jobs):
+        notify_workers()
+
+    return jobs
+
+
+def enqueue_jobs(
+    db: Session, function_id: int, request_body: List[Union[Dict[str, Any], str]]
+) -> List[models.FunctionJob]:
+    """
+    Create (without committing) the jobs of a function for multiple inputs.
+
+    Inputs failing validation get a FAILED job, inputs whose result is cached
+    a COMPLETED job and all others a PENDING job.
+    """
+    function = function_definitions.get(db, function_id)
     if not function:
         raise HTTPException(status_code=404, detail="Function not found")
 
-    # Create jobs for all inputs
-    jobs = []
-    for input_str in request_body:
-        try:
-            inputs_dict = json.loads(input_str)
-
-            # Validate input against schema if defined
-            if function.input_schema:
-                try:
-                    validate_against_json_schema(
-                        inputs_dict, function.input_schema, "Input"
-                    )
-                except HTTPException as e:
-                    # Create failed job with validation error
-                    job = database.FunctionJobDB(
-                        functionID=function_id,
-                        status=models.JobStatus.FAILED,
-                        inputs=inputs_dict,
-                        job_info={"error": str(e.detail)},
-                    )
-                    db.add(job)
-                    jobs.append(job)
-                    continue
-
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=400, detail=f"Invalid JSON in inputs: {input_str}"
-            )
+    inputs = parse_inputs(request_body)
 
-        # Create job in PENDING state
-        job = database.FunctionJobDB(
-            functionID=function_id,
-            status=models.JobStatus.PENDING,
-            inputs=inputs_dict,
-        )
-        db.add(job)
-        jobs.append(job)
+    # Validate all inputs against the schema, if defined, in one pass
+    input_validator = function.input_validator
+    errors = input_validator.errors(inputs) if input_validator else [None] * len(inputs)
 
-    # Commit all jobs to get their IDs
-    db.commit()
-    for job in jobs:
-        db.refresh(job)
+    # Inputs computed before are completed right away from the result cache
+    cache_keys: List[Optional[str]] = [None] * len(inputs)
+    cached: Dict[str, Dict[str, Any]] = {}
+    if function.cacheable:
+        cache_keys = [
+            make_cache_key(function, inputs_dict) if error is None else None
+            for inputs_dict, error in zip(inputs, errors)
+        ]
+        cached = result_cache.get_many(db, [key for key in cache_keys if key])
 
-    # Start background processing only for jobs that passed validation
-    pending_jobs = [job for job in jobs if job.status == models.JobStatus.PENDING]
-    if pending_jobs:
-        background_task = asyncio.create_task(
-            process_inputs_async(function, pending_jobs, db, max_workers)
-        )
-        app.state.background_tasks = getattr(app.state, "background_tasks", set())
-        app.state.background_tasks.add(background_task)
-        background_task.add_done_callback(
-            lambda t: app.state.background_tasks.remove(t)
-        )
+    now = datetime.utcnow()
+    rows = []
+    for inputs_dict, error, cache_key in zip(inputs, errors, cache_keys):
+        row = {"functionID": function_id, "inputs": inputs_dict}
+        if error:
+            # Create failed job with validation error
+            row.update(
+                status=models.JobStatus.FAILED,
+                job_info={"error": error},
+                finished_at=now,
+            )
+        elif cache_key in cached:
+            row.update(
+                status=models.JobStatus.COMPLETED,
+                outputs=cached[cache_key]["outputs"],
+                job_info=cache_hit_job_info(cached[cache_key]),
+                finished_at=now,
+            )
+        else:
+            row.update(status=models.JobStatus.PENDING)
+        rows.append(row)
 
-    return jobs
+    return job_queue.enqueue(db, rows)
 
 
 @app.get(
@@ -797,12 +1355,21 @@ async def map_function(
     operation_id="list_function_jobs",
     tags=["function_job"],
     summary="List all function jobs with optional filtering",
+    responses=NEXT_CURSOR_RESPONSES,
 )
 def list_function_jobs(
+    response: Response,
     limit: Optional[int] = Query(
         None, ge=1, le=1000, description="Maximum number of jobs to return"
     ),
-    offset: Optional[int] = Query(None, ge=0, description="Number of jobs to skip"),
+    offset: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Number of jobs to skip (deprecated, use cursor)",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor of the page, from the X-Next-Cursor header"
+    ),
     status: Optional[models.JobStatus] = Query(
         None, description="Filter by job status"
     ),
@@ -816,11 +1383,15 @@ def list_function_jobs(
     db: Session = Depends(get_db),
 ) -> List[models.FunctionJob]:
     """
-    List all function jobs with optional filtering and pagination.
+    List all function jobs with optional filtering and pagination, most recent
+    first.
 
     Parameters:
         limit: Maximum number of jobs to return (default: all)
-        offset: Number of jobs to skip for pagination (default: 0)
+        offset: Number of jobs to skip for pagination (default: 0), deprecated
+            in favor of cursor
+        cursor: Cursor of the page to return, as returned in the X-Next-Cursor
+            header of the previous page. The header is absent on the last page.
         status: Filter by job status (e.g., PENDING, RUNNING, COMPLETED, FAILED)
         function_id: Filter jobs for a specific function
         start_date: Include jobs created after this date
@@ -844,16 +1415,9 @@ def list_function_jobs(
     if end_date:
         query = query.filter(database.FunctionJobDB.created_at <= end_date)
 
-    # Apply pagination
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-
-    # Order by most recent first
-    query = query.order_by(database.FunctionJobDB.created_at.desc())
-
-    return query.all()
+    return keyset_page(
+        query, database.FunctionJobDB, response, limit, cursor, offset=offset
+    )
 
 
 @app.get(
@@ -861,13 +1425,20 @@ def list_function_jobs(
     response_model=List[models.FunctionJob],
     operation_id="get_function_jobs",
     tags=["function_job"],
+    responses=NEXT_CURSOR_RESPONSES,
 )
 async def get_function_jobs(
+    response: Response,
     function_id: int = Path(..., description="ID of the function to get jobs for"),
     limit: Optional[int] = Query(
         100, ge=1, le=1000, description="Maximum number of jobs to return"
     ),
-    offset: Optional[int] = Query(0, ge=0, description="Number of jobs to skip"),
+    offset: Optional[int] = Query(
+        0, ge=0, description="Number of jobs to skip (deprecated, use cursor)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor of the page, from the X-Next-Cursor header"
+    ),
     status: Optional[models.JobStatus] = Query(
         None, description="Filter by job status"
     ),
@@ -880,14 +1451,12 @@ async def get_function_jobs(
     db: Session = Depends(get_db),
 ) -> List[models.FunctionJob]:
     """
-    Get all jobs for a specific function with optional filtering and pagination.
+    Get all jobs for a specific function with optional filtering and pagination,
+    oldest first. The cursor of the next page is returned in the X-Next-Cursor
+    header.
     """
     # First check if function exists
-    function = (
-        db.query(database.FunctionDB)
-        .filter(database.FunctionDB.id == function_id)
-        .first()
-    )
+    function = function_definitions.get(db, function_id)
     if not function:
         raise HTTPException(status_code=404, detail="Function not found")
 
@@ -906,13 +1475,15 @@ async def get_function_jobs(
     if end_date:
         query = query.filter(database.FunctionJobDB.created_at <= end_date)
 
-    # Apply pagination
-    if offset is not None:
-        query = query.offset(offset)
-    if limit is not None:
-        query = query.limit(limit)
-
-    return query.all()
+    return keyset_page(
+        query,
+        database.FunctionJobDB,
+        response,
+        limit,
+        cursor,
+        descending=False,
+        offset=offset,
+    )
 
 
 @app.get(
@@ -920,42 +1491,37 @@ async def get_function_jobs(
     response_model=List[models.Function],
     operation_id="search_functions_by_tags",
     tags=["function"],
+    responses=NEXT_CURSOR_RESPONSES,
 )
 def search_functions_by_tags(
+    response: Response,
     tags: List[str] = Query(..., description="Tags to search for"),
     match_all: bool = Query(
         False,
         description="If True, functions must have all tags. If False, functions must have any of the tags.",
     ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Maximum number of functions to return"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor of the page, from the X-Next-Cursor header"
+    ),
     db: Session = Depends(get_db),
 ):
     """
-    Search for functions by tags.
+    Search for functions by tags, in id order.
 
     Parameters:
         tags: List of tags to search for
         match_all: If True, functions must have all specified tags. If False, functions must have any of the specified tags.
+        limit: Maximum number of functions to return (default: all)
+        cursor: Cursor of the page to return, as returned in the X-Next-Cursor
+            header of the previous page. The header is absent on the last page.
 
     Returns:
         List of functions that match the tag criteria
     """
-    # Get all functions
-    query = db.query(database.FunctionDB)
-
-    # Filter functions based on tags
-    if match_all:
-        # Function must have all specified tags
-        functions = [
-            func
-            for func in query.all()
-            if func.tags and all(tag in func.tags for tag in tags)
-        ]
-    else:
-        # Function must have any of the specified tags
-        functions = [
-            func
-            for func in query.all()
-            if func.tags and any(tag in func.tags for tag in tags)
-        ]
-
-    return functions
+    query = db.query(database.FunctionDB).filter(
+        database.FunctionDB.id.in_(tagged_function_ids(tags, match_all))
+    )
+    return id_page(query, database.FunctionDB, response, limit, cursor)
@@ -0,0 +1,347 @@
+"""
+Schema migrations.
+
+`Base.metadata.create_all` only creates missing tables, it never changes a
+table that already exists. Changes to existing tables (new columns, indexes)
+are therefore applied by numbered migrations, recorded in the schema_version
+table so each runs once per database.
+
+Migrations must be idempotent: a new database gets the current schema from the
+baseline migration, and the later migrations then find their changes already
+in place.
+
+Migrations run on import of the database module unless
+FUNCTIONS_STORE_AUTO_MIGRATE=0, e.g. for deployments that run
+`python -m functions_store migrate` as a separate step.
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .models import JobStatus
+
+logger = logging.getLogger(__name__)
+
+schema_version_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    schema_version_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String),
+    Column("applied_at", DateTime, default=datetime.utcnow),
+)
+
+
+def create_index_if_missing(connection: Connection, index: Index) -> None:
+    """Create an index unless an index of that name exists on its table"""
+    existing = {
+        existing_index["name"]
+        for existing_index in inspect(connection).get_indexes(index.table.name)
+    }
+    if index.name not in existing:
+        index.create(connection)
+
+
+def add_column_if_missing(connection: Connection, table: Table, column_name: str) -> None:
+    """Add a column, as declared on the model, to an existing table"""
+    existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    if column_name in existing:
+        return
+    column = table.c[column_name]
+    preparer = connection.dialect.identifier_preparer
+    definition = column.type.compile(dialect=connection.dialect)
+    if column.server_default is not None:
+        definition += f" DEFAULT {column.server_default.arg}"
+        if not column.nullable:
+            definition += " NOT NULL"
+    connection.exec_driver_sql(
+        f"ALTER TABLE {preparer.format_table(table)} "
+        f"ADD COLUMN {preparer.format_column(column)} {definition}"
+    )
+
+
+def create_table_if_missing(connection: Connection, table: Table) -> None:
+    table.create(bind=connection, checkfirst=True)
+
+
+def _baseline(connection: Connection, metadata: MetaData) -> None:
+    metadata.create_all(bind=connection)
+
+
+def _indexes(table_name: str, *index_names: str) -> Callable[[Connection, MetaData], None]:
+    """Build a migration creating indexes declared on the model of a table"""
+
+    def migration(connection: Connection, metadata: MetaData) -> None:
+        indexes = {index.name: index for index in metadata.tables[table_name].indexes}
+        for name in index_names:
+            create_index_if_missing(connection, indexes[name])
+
+    return migration
+
+
+def _collection_jobs(connection: Connection, metadata: MetaData) -> None:
+    members = metadata.tables["collection_jobs"]
+    create_table_if_missing(connection, members)
+
+    # Move the memberships out of the former job_ids JSON column
+    columns = {
+        column["name"] for column in inspect(connection).get_columns("function_job_collections")
+    }
+    if "job_ids" not in columns:
+        return
+    collections = Table("function_job_collections", MetaData(), autoload_with=connection)
+    rows = connection.execute(select(collections.c.id, collections.c.job_ids))
+    for collection_id, job_ids in rows.all():
+        if isinstance(job_ids, str):
+            job_ids = json.loads(job_ids)
+        memberships = [
+            {"collection_id": collection_id, "job_id": job_id}
+            for job_id in dict.fromkeys(job_ids or [])
+        ]
+        if memberships:
+            connection.execute(members.insert(), memberships)
+
+
+def _collection_counters(connection: Connection, metadata: MetaData) -> None:
+    add_column_if_missing(connection, metadata.tables["function_jobs"], "finished_at")
+    collections = metadata.tables["function_job_collections"]
+    for column_name in (
+        "pending_count",
+        "running_count",
+        "completed_count",
+        "failed_count",
+        "first_finished_at",
+        "last_finished_at",
+    ):
+        add_column_if_missing(connection, collections, column_name)
+
+    # Count the jobs of the existing collections
+    from .job_collections import recount
+
+    db = Session(bind=connection)
+    for (collection_id,) in connection.execute(select(collections.c.id)).all():
+        recount(db, collection_id)
+    db.flush()
+
+
+def _function_tags(connection: Connection, metadata: MetaData) -> None:
+    create_table_if_missing(connection, metadata.tables["function_tags"])
+
+    # Index the tags of the existing functions
+    from .function_tags import tag_rows
+
+    functions = metadata.tables["functions"]
+    rows = []
+    for function_id, tags in connection.execute(select(functions.c.id, functions.c.tags)):
+        if isinstance(tags, str):
+            tags = json.loads(tags)
+        rows += tag_rows(function_id, tags)
+    if rows:
+        connection.execute(metadata.tables["function_tags"].insert(), rows)
+
+
+def _function_search(connection: Connection, metadata: MetaData) -> None:
+    from .function_search import create_search_index, index_functions
+
+    create_search_index(connection)
+    functions = metadata.tables["functions"]
+    index_functions(
+        connection,
+        connection.execute(
+            select(
+                functions.c.id,
+                functions.c.name,
+                functions.c.description,
+                functions.c.tags,
+            )
+        ).all(),
+    )
+
+
+def _collection_job_events(connection: Connection, metadata: MetaData) -> None:
+    events = metadata.tables["collection_job_events"]
+    create_table_if_missing(connection, events)
+
+    _record_finished_jobs(connection, metadata)
+
+
+def _record_finished_jobs(connection: Connection, metadata: MetaData) -> None:
+    """
+    Record the events of the jobs of collections that finished without one,
+    in the order they finished. Jobs that finished before finish times were
+    stored (migration 4) have none and are taken in the order they were
+    created.
+    """
+    events = metadata.tables["collection_job_events"]
+    jobs = metadata.tables["function_jobs"]
+    members = metadata.tables["collection_jobs"]
+    recorded = select(events.c.id).where(
+        events.c.collection_id == members.c.collection_id,
+        events.c.job_id == members.c.job_id,
+    )
+    connection.execute(
+        events.insert().from_select(
+            ["collection_id", "job_id"],
+            select(members.c.collection_id, members.c.job_id)
+            .join(jobs, jobs.c.id == members.c.job_id)
+            .where(
+                jobs.c.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+                ~recorded.exists(),
+            )
+            .order_by(func.coalesce(jobs.c.finished_at, jobs.c.created_at), jobs.c.id),
+        )
+    )
+
+
+def _catalog_version(connection: Connection, metadata: MetaData) -> None:
+    catalog = metadata.tables["catalog_version"]
+    create_table_if_missing(connection, catalog)
+    if connection.execute(select(catalog.c.id)).first() is None:
+        connection.execute(
+            catalog.insert().values(id=1, token=uuid.uuid4().hex[:12], version=0)
+        )
+
+
+def _function_ids_autoincrement(connection: Connection, metadata: MetaData) -> None:
+    """Rebuild the functions table of SQLite databases with AUTOINCREMENT ids"""
+    if connection.dialect.name != "sqlite":
+        return
+    (definition,) = connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'functions'"
+    ).one()
+    if "AUTOINCREMENT" in definition.upper():
+        return
+
+    functions = metadata.tables["functions"]
+    rebuilt = functions.to_metadata(MetaData(), name="functions_rebuilt")
+    rebuilt.create(bind=connection)
+    columns = ", ".join(column.name for column in functions.columns)
+    connection.exec_driver_sql(
+        f"INSERT INTO functions_rebuilt ({columns}) SELECT {columns} FROM functions"
+    )
+    connection.exec_driver_sql("DROP TABLE functions")
+    connection.exec_driver_sql("ALTER TABLE functions_rebuilt RENAME TO functions")
+    for index in rebuilt.indexes:
+        connection.exec_driver_sql(f"DROP INDEX {index.name}")
+    for index in functions.indexes:
+        create_index_if_missing(connection, index)
+
+    # Deleted functions may still be referred to by jobs, results and limits
+    largest = max(
+        connection.execute(select(func.max(table.c.functionID))).scalar() or 0
+        for table in (
+            metadata.tables["function_jobs"],
+            metadata.tables["function_result_cache"],
+            metadata.tables["execution_limits"],
+        )
+    )
+    connection.exec_driver_sql(
+        "UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = 'functions'",
+        (largest,),
+    )
+    connection.exec_driver_sql(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'functions', ? "
+        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'functions')",
+        (largest,),
+    )
+
+
+# (version, description, migration called with a connection and the metadata)
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection, MetaData], None]]] = [
+    (1, "Create missing tables", _baseline),
+    (
+        2,
+        "Index function_jobs on functionID, status and created_at",
+        _indexes(
+            "function_jobs",
+            "ix_function_jobs_function_status_created",
+            "ix_function_jobs_status_created",
+        ),
+    ),
+    (3, "Move collection membership to the collection_jobs table", _collection_jobs),
+    (4, "Add job status counters to function_job_collections", _collection_counters),
+    (
+        5,
+        "Index function_jobs on finished_at",
+        _indexes("function_jobs", "ix_function_jobs_finished_at"),
+    ),
+    (6, "Index function tags in the function_tags table", _function_tags),
+    (7, "Create the full-text search index of the functions", _function_search),
+    (
+        8,
+        "Record the finished jobs of collections in collection_job_events",
+        _collection_job_events,
+    ),
+    (9, "Store the version of the function catalog", _catalog_version),
+    (10, "Never reuse the ids of deleted functions", _function_ids_autoincrement),
+    (
+        11,
+        "Record the events of jobs that finished without a finish time",
+        _record_finished_jobs,
+    ),
+]
+
+
+def current_version(engine: Engine) -> int:
+    """Get the version of the schema, 0 for a database never migrated"""
+    schema_version_metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        versions = connection.execute(select(schema_version.c.version)).scalars().all()
+    return max(versions, default=0)
+
+
+def upgrade(engine: Engine, metadata: MetaData) -> List[int]:
+    """
+    Apply the migrations the database has not seen yet, each in its own
+    transaction.
+
+    Returns:
+        Versions of the applied migrations
+    """
+    schema_version_metadata.create_all(bind=engine)
+    applied = []
+    for version, description, migration in MIGRATIONS:
+        with engine.connect() as connection:
+            done = connection.execute(
+                select(schema_version.c.version).where(
+                    schema_version.c.version == version
+                )
+            ).first()
+        if done:
+            continue
+
+        logger.info(f"Applying schema migration {version}: {description}")
+        try:
+            with engine.begin() as connection:
+                migration(connection, metadata)
+                connection.execute(
+                    schema_version.insert().values(
+                        version=version,
+                        description=description,
+                        applied_at=datetime.utcnow(),
+                    )
+                )
+        except IntegrityError:
+            # Another process applied it concurrently
+            continue
+        applied.append(version)
+    return applied
@@ -15,6 +15,18 @@ class Function(BaseModel):
     output_schema: Optional[Dict[str, Any]] = None  # JSON Schema
     tags: Optional[List[str]] = None  # Added tags field
 
+
+class FunctionSummary(BaseModel):
+    """Projection of a function on the fields selected in a listing"""
+    id: int
+    name: Optional[str] = None
+    type: Optional[str] = None
+    url: Optional[str] = None
+    description: Optional[str] = None
+    input_schema: Optional[Dict[str, Any]] = None
+    output_schema: Optional[Dict[str, Any]] = None
+    tags: Optional[List[str]] = None
+
 class JobStatus(str, Enum):
     PENDING = "PENDING"
     RUNNING = "RUNNING"
@@ -40,6 +52,18 @@ class FunctionJobCollection(BaseModel):
     description: Optional[str]
     job_ids: List[int]
     status: str
+    job_counts: Optional[Dict[str, int]] = None  # Number of jobs per status
+    progress: Optional[float] = None  # Fraction of the jobs that finished
+    first_finished_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+
+
+class InputValidationResult(BaseModel):
+    """Result of validating one input of a batch against an input schema"""
+
+    index: int  # Position of the input in the batch
+    valid: bool
+    error: Optional[str] = None
@@ -0,0 +1,140 @@
+"""
+Nearest-neighbour search and scattered-data interpolation over the input
+columns of a results table.
+
+Columns are normalized to [0, 1] by their range in the table, so distances
+weigh all inputs alike whatever their units. The search uses a KD-tree when
+scipy is installed, and vectorized brute force otherwise, which is fast
+enough for the tables of a few thousand rows that sweeps produce.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # pragma: no cover - optional dependency
+    cKDTree = None
+
+# Distances computed at once by the brute-force search
+_BRUTE_FORCE_BLOCK = 1 << 22
+
+# Exponent of inverse distance weighting
+IDW_POWER = 2.0
+
+
+class NeighbourIndex:
+    """Nearest-neighbour search over the rows of a matrix of input values"""
+
+    def __init__(self, values: np.ndarray):
+        # Rows with missing inputs cannot be neighbours
+        complete = ~np.isnan(values).any(axis=1)
+        self.rows = np.flatnonzero(complete)
+        values = values[complete]
+        if not len(values):
+            raise ValueError("No rows with values for all inputs")
+        self.low = values.min(axis=0)
+        span = values.max(axis=0) - self.low
+        self.span = np.where(span > 0, span, 1.0)
+        self.points = self.normalize(values)
+        self._tree = cKDTree(self.points) if cKDTree is not None else None
+
+    def normalize(self, values: np.ndarray) -> np.ndarray:
+        return (values - self.low) / self.span
+
+    def query(self, values: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest rows of each point.
+
+        Returns:
+            Normalized distances and positions of the neighbours in points
+            (rows gives their row numbers in the table), both of shape
+            (points, k), nearest first
+        """
+        queries = self.normalize(values)
+        k = min(k, len(self.points))
+        if self._tree is not None:
+            distances, neighbours = self._tree.query(queries, k=k)
+            distances = distances.reshape(len(queries), k)
+            neighbours = neighbours.reshape(len(queries), k)
+        else:
+            distances, neighbours = self._brute_force(queries, k)
+        return distances, neighbours
+
+    def _brute_force(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        squared_norms = (self.points**2).sum(axis=1)
+        block = max(1, _BRUTE_FORCE_BLOCK // len(self.points))
+        distances = np.empty((len(queries), k))
+        neighbours = np.empty((len(queries), k), dtype=int)
+        for start in range(0, len(queries), block):
+            chunk = queries[start : start + block]
+            squared = (
+                (chunk**2).sum(axis=1)[:, None]
+                + squared_norms[None, :]
+                - 2 * chunk @ self.points.T
+            )
+            nearest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+            nearest_squared = np.take_along_axis(squared, nearest, axis=1)
+            order = np.argsort(nearest_squared, axis=1)
+            neighbours[start : start + block] = np.take_along_axis(nearest, order, axis=1)
+            distances[start : start + block] = np.sqrt(
+                np.maximum(np.take_along_axis(nearest_squared, order, axis=1), 0)
+            )
+        return distances, neighbours
+
+
+def inverse_distance(distances: np.ndarray, outputs: np.ndarray) -> np.ndarray:
+    """
+    Inverse distance weighting of the outputs of the neighbours of points.
+
+    Parameters:
+        distances: Distances to the neighbours, shape (points, k)
+        outputs: Outputs of the neighbours, shape (points, k, outputs)
+    """
+    with np.errstate(divide="ignore"):
+        weights = 1.0 / distances**IDW_POWER
+    # Points on a row take its outputs
+    exact = distances == 0
+    weights = np.where(exact.any(axis=1)[:, None], exact.astype(float), weights)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return np.einsum("pk,pko->po", weights, outputs)
+
+
+def local_linear(
+    queries: np.ndarray, inputs: np.ndarray, outputs: np.ndarray
+) -> np.ndarray:
+    """
+    Linear interpolation of scattered data: the outputs of each point from an
+    affine least-squares fit over its neighbours.
+
+    Parameters:
+        queries: Normalized points, shape (points, inputs)
+        inputs: Normalized inputs of the neighbours, shape (points, k, inputs)
+        outputs: Outputs of the neighbours, shape (points, k, outputs)
+    """
+    ones = np.ones(inputs.shape[:2] + (1,))
+    design = np.concatenate([ones, inputs - queries[:, None, :]], axis=2)
+    # The intercept of the fit centered on the point is its value
+    coefficients = np.linalg.pinv(design) @ outputs
+    values = coefficients[:, 0, :]
+    # Points on a row take its outputs, as the fit need not go through it
+    exact = (inputs[:, 0, :] == queries).all(axis=1)
+    values[exact] = outputs[exact, 0, :]
+    return values
+
+
+def default_neighbours(mode: str, dimensions: int) -> int:
+    """Number of neighbours used by a lookup mode when not given"""
+    if mode == "idw":
+        return dimensions + 1
+    if mode == "linear":
+        return 2 * (dimensions + 1)
+    return 1
+
+
+def within_tolerance(distances: np.ndarray, tolerance: Optional[float]) -> np.ndarray:
+    """Whether the nearest neighbour of each point is close enough"""
+    if tolerance is None:
+        return np.ones(len(distances), dtype=bool)
+    return distances[:, 0] <= tolerance
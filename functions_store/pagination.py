@@ -0,0 +1,154 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are read with `WHERE (created_at, id) < (:created_at, :id) ORDER BY
+created_at DESC, id DESC LIMIT :limit`, which the (..., created_at) indexes
+answer directly no matter how deep the page is, unlike OFFSET which scans all
+skipped rows.
+
+The cursor of the next page is returned in the X-Next-Cursor response header
+and is opaque to clients: the key of the last row of the page, base64-encoded.
+Rows without created_at (functions) are paged by id alone.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+NEXT_CURSOR_RESPONSES = {
+    200: {
+        "headers": {
+            NEXT_CURSOR_HEADER: {
+                "description": "Cursor of the next page, absent on the last page",
+                "schema": {"type": "string"},
+            }
+        }
+    }
+}
+
+
+def _encode(key: Any) -> str:
+    payload = json.dumps(key, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode(cursor: str) -> Any:
+    return json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    return _encode([created_at.isoformat(), row_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor, raising a 400 error if it is malformed"""
+    try:
+        created_at, row_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError, UnicodeEncodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_id_cursor(row_id: int) -> str:
+    return _encode([row_id])
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """Decode a cursor of id_page, raising a 400 error if it is malformed"""
+    try:
+        (row_id,) = _decode(cursor)
+        return int(row_id)
+    except (ValueError, TypeError, UnicodeEncodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def id_page(
+    query: Query,
+    model: Any,
+    response: Response,
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+) -> List[Any]:
+    """
+    Get a page of rows of a model in id order, setting the X-Next-Cursor
+    header if there are more rows.
+
+    Parameters:
+        query: Query with the filters applied, but no ordering
+        limit: Page size, None for all remaining rows
+        cursor: Cursor returned with the previous page, None for the first page
+
+    Returns:
+        The rows of the page
+    """
+    if cursor is not None:
+        query = query.filter(model.id > decode_id_cursor(cursor))
+    query = query.order_by(model.id)
+
+    if limit is None:
+        return query.all()
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_id_cursor(rows[-1].id)
+    return rows
+
+
+def keyset_page(
+    query: Query,
+    model: Any,
+    response: Response,
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+    descending: bool = True,
+    offset: Optional[int] = None,
+) -> List[Any]:
+    """
+    Get a page of rows of a model with created_at and id columns, setting the
+    X-Next-Cursor header if there are more rows.
+
+    Parameters:
+        query: Query with the filters applied, but no ordering
+        limit: Page size, None for all remaining rows
+        cursor: Cursor returned with the previous page, None for the first page
+        descending: Most recent rows first
+        offset: Rows to skip, kept for clients paging with offsets
+
+    Returns:
+        The rows of the page
+    """
+    key = tuple_(model.created_at, model.id)
+    if cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        after = tuple_(
+            literal(created_at, model.created_at.type), literal(row_id, model.id.type)
+        )
+        query = query.filter(key < after if descending else key > after)
+
+    if descending:
+        query = query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        query = query.order_by(model.created_at, model.id)
+    if offset:
+        query = query.offset(offset)
+
+    if limit is None:
+        return query.all()
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            rows[-1].created_at, rows[-1].id
+        )
+    return rows
@@ -0,0 +1,175 @@
+"""
+HTTP client of remote.http functions.
+
+Calls go through shared clients with a pool of keep-alive connections (and
+HTTP/2 when the h2 package is installed), instead of a new connection per
+job. The worker awaits calls on its event loop, so many remote calls can be
+in flight without a thread each; synchronous callers use a blocking client
+with the same settings.
+
+Calls that fail before reaching the function (connection errors) or that
+are answered with one of RETRY_STATUSES are retried with exponential
+backoff. Timeouts of calls that reached the function are not retried, the
+function may have run.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = float(os.environ.get("FUNCTIONS_STORE_HTTP_CONNECT_TIMEOUT", 10))
+# Seconds to wait for the response of a function (None: no limit)
+READ_TIMEOUT = float(os.environ.get("FUNCTIONS_STORE_HTTP_TIMEOUT", 300)) or None
+MAX_CONNECTIONS = int(os.environ.get("FUNCTIONS_STORE_HTTP_MAX_CONNECTIONS", 100))
+MAX_RETRIES = int(os.environ.get("FUNCTIONS_STORE_HTTP_RETRIES", 3))
+# Delay before the first retry, doubled for each further retry
+RETRY_BACKOFF = float(os.environ.get("FUNCTIONS_STORE_HTTP_BACKOFF", 0.5))
+MAX_RETRY_DELAY = 30.0
+
+RETRY_STATUSES = {429, 502, 503, 504}
+_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _client_options() -> Dict[str, Any]:
+    return {
+        "timeout": httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+        ),
+        "http2": h2 is not None,
+    }
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """Seconds to wait before a retry, as asked by the server if it did"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    return min(RETRY_BACKOFF * 2**attempt, MAX_RETRY_DELAY)
+
+
+def _should_retry(attempt: int, response: Optional[httpx.Response]) -> bool:
+    return attempt < MAX_RETRIES and (
+        response is None or response.status_code in RETRY_STATUSES
+    )
+
+
+def _result(response: httpx.Response) -> Any:
+    response.raise_for_status()
+    return response.json()
+
+
+def _error(e: Exception) -> Exception:
+    return Exception(f"Error executing remote HTTP function: {str(e)}")
+
+
+class RemoteHttpClient:
+    """
+    Shared pooled HTTP clients: one blocking client, and one asynchronous
+    client per event loop (connections cannot be shared between loops).
+    """
+
+    def __init__(self, **options: Any):
+        # Options of httpx.Client/AsyncClient, e.g. a transport for tests
+        self.options = {**_client_options(), **options}
+        self._client: Optional[httpx.Client] = None
+        # Event loop -> its client
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(**self.options)
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(**self.options)
+                self._async_clients[loop] = client
+            return client
+
+    def post(self, url: str, inputs: Dict[str, Any]) -> Any:
+        """Call a remote function, blocking until it answers"""
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.client.post(url, json=inputs)
+            except _RETRY_ERRORS as e:
+                if not _should_retry(attempt, None):
+                    raise _error(e)
+            except httpx.HTTPError as e:
+                raise _error(e)
+            if response is not None and not _should_retry(attempt, response):
+                try:
+                    return _result(response)
+                except (httpx.HTTPError, ValueError) as e:
+                    raise _error(e)
+            delay = _retry_delay(attempt, response)
+            logger.warning(f"Retrying call of {url} in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    async def apost(self, url: str, inputs: Dict[str, Any]) -> Any:
+        """Call a remote function without blocking the event loop"""
+        client = self.async_client
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = await client.post(url, json=inputs)
+            except _RETRY_ERRORS as e:
+                if not _should_retry(attempt, None):
+                    raise _error(e)
+            except httpx.HTTPError as e:
+                raise _error(e)
+            if response is not None and not _should_retry(attempt, response):
+                try:
+                    return _result(response)
+                except (httpx.HTTPError, ValueError) as e:
+                    raise _error(e)
+            delay = _retry_delay(attempt, response)
+            logger.warning(f"Retrying call of {url} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close the blocking client, reopened on next use"""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the asynchronous client of the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+remote_http = RemoteHttpClient()
@@ -0,0 +1,365 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import database
+from .loader import function_loader
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_TAG = "cacheable"
+
+# Extract the path of the file holding the code (or table) of a function from
+# its url, for the types whose results depend on a local file
+_CODE_PATHS = {
+    "local.python": lambda url: url.rsplit(":", 1)[0],
+    "local.python.process": lambda url: url.rsplit(":", 1)[0],
+    "tabulated": lambda url: url.partition("?")[0],
+}
+
+
+def is_cacheable(function: database.FunctionDB) -> bool:
+    """Check whether results of a function may be memoized"""
+    return bool(function.tags) and CACHEABLE_TAG in function.tags
+
+
+def code_version(function: database.FunctionDB) -> Optional[str]:
+    """
+    Version of the code of a function: the digest of its file for local
+    functions, as used by the loader to reload them, None for other types
+    """
+    code_path = _CODE_PATHS.get(function.type)
+    if code_path is None:
+        return None
+    try:
+        return function_loader.file_digest(code_path(function.url))
+    except OSError:
+        # Running the function fails as well, and failures are not cached
+        return None
+
+
+def make_cache_key(function: database.FunctionDB, inputs: Dict[str, Any]) -> str:
+    """
+    Build a content-addressed cache key for a function call.
+
+    The key covers the function id, its type and url and the version of its
+    code (which identify the code that produces the result, so editing the
+    file of a function stops serving results of the previous code) and the
+    canonicalized inputs JSON.
+    """
+    payload = json.dumps(
+        {
+            "function_id": function.id,
+            "type": function.type,
+            "url": function.url,
+            "code_version": code_version(function),
+            "inputs": inputs,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_hit_job_info(cached: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the job_info of a job answered from the result cache"""
+    return {"cache_hit": True, "cached_from_job_id": cached["job_id"]}
+
+
+class ResultCache:
+    """
+    Memoization cache for results of functions tagged "cacheable".
+
+    Entries are persisted in the function_result_cache table and fronted by
+    an in-process LRU so repeated lookups do not hit the database.
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 1024,
+        max_entries: int = 100000,
+        ttl_seconds: Optional[float] = None,
+        eviction_interval: int = 100,
+    ):
+        self.max_memory_entries = max_memory_entries
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.eviction_interval = eviction_interval
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts_since_eviction = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _is_expired(self, created_at: datetime) -> bool:
+        if not self.ttl_seconds:
+            return False
+        return created_at < datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(
+        self, db: Session, key: str, use_memory: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Parameters:
+            use_memory: Answer from the in-process LRU if possible. Processes
+                that do not serve the invalidation endpoints (e.g. standalone
+                workers) should read the table to see invalidations.
+
+        Returns:
+            Dict with the cached "outputs" and the "job_id" that produced them,
+            or None on a miss
+        """
+        with self._lock:
+            entry = self._memory.get(key) if use_memory else None
+            if entry is not None:
+                if self._is_expired(entry["created_at"]):
+                    del self._memory[key]
+                    entry = None
+                else:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry
+
+        row = (
+            db.query(database.FunctionResultCacheDB)
+            .filter(database.FunctionResultCacheDB.cache_key == key)
+            .first()
+        )
+        if row is None or self._is_expired(row.created_at):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        entry = {
+            "outputs": row.outputs,
+            "job_id": row.job_id,
+            "created_at": row.created_at,
+        }
+        self._remember(key, entry)
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def get_many(
+        self, db: Session, keys: List[str], use_memory: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several cached results with a single query.
+
+        Returns:
+            Mapping of the keys that hit to their cached entry
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        if use_memory:
+            for key in keys:
+                with self._lock:
+                    entry = self._memory.get(key)
+                if entry is not None and not self._is_expired(entry["created_at"]):
+                    found[key] = entry
+
+        table = database.FunctionResultCacheDB
+        missing = [key for key in set(keys) if key not in found]
+        if missing:
+            for row in db.query(table).filter(table.cache_key.in_(missing)):
+                if self._is_expired(row.created_at):
+                    continue
+                entry = {
+                    "outputs": row.outputs,
+                    "job_id": row.job_id,
+                    "created_at": row.created_at,
+                }
+                self._remember(row.cache_key, entry)
+                found[row.cache_key] = entry
+
+        with self._lock:
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put(
+        self,
+        db: Session,
+        key: str,
+        function_id: int,
+        outputs: Dict[str, Any],
+        job_id: Optional[int] = None,
+    ) -> None:
+        """Store the outputs of a successful function call"""
+        created_at = datetime.utcnow()
+        db.add(
+            database.FunctionResultCacheDB(
+                cache_key=key,
+                functionID=function_id,
+                outputs=outputs,
+                job_id=job_id,
+                created_at=created_at,
+            )
+        )
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another job stored the same result concurrently
+            db.rollback()
+            return
+
+        self._remember(
+            key, {"outputs": outputs, "job_id": job_id, "created_at": created_at}
+        )
+
+        with self._lock:
+            self._puts_since_eviction += 1
+            evict = self._puts_since_eviction >= self.eviction_interval
+            if evict:
+                self._puts_since_eviction = 0
+        if evict:
+            self.evict(db)
+
+    def put_many(
+        self, db: Session, entries: List[Tuple[str, int, Dict[str, Any], Optional[int]]]
+    ) -> None:
+        """
+        Store the outputs of several successful function calls in one
+        transaction.
+
+        Parameters:
+            entries: Tuples of (key, function_id, outputs, job_id)
+        """
+        table = database.FunctionResultCacheDB
+        unique = {entry[0]: entry for entry in entries}
+        existing = {
+            key
+            for (key,) in db.query(table.cache_key).filter(
+                table.cache_key.in_(list(unique))
+            )
+        }
+        created_at = datetime.utcnow()
+        new_entries = [entry for key, entry in unique.items() if key not in existing]
+        if not new_entries:
+            return
+        db.add_all(
+            [
+                table(
+                    cache_key=key,
+                    functionID=function_id,
+                    outputs=outputs,
+                    job_id=job_id,
+                    created_at=created_at,
+                )
+                for key, function_id, outputs, job_id in new_entries
+            ]
+        )
+        try:
+            db.commit()
+        except IntegrityError:
+            # Some results were stored concurrently, store the others one by one
+            db.rollback()
+            for key, function_id, outputs, job_id in new_entries:
+                self.put(db, key, function_id, outputs, job_id)
+            return
+
+        for key, function_id, outputs, job_id in new_entries:
+            self._remember(
+                key, {"outputs": outputs, "job_id": job_id, "created_at": created_at}
+            )
+        with self._lock:
+            self._puts_since_eviction += len(new_entries)
+            evict = self._puts_since_eviction >= self.eviction_interval
+            if evict:
+                self._puts_since_eviction = 0
+        if evict:
+            self.evict(db)
+
+    def evict(self, db: Session) -> int:
+        """
+        Remove expired entries and trim the table down to max_entries,
+        dropping the oldest entries first.
+
+        Returns:
+            Number of evicted entries
+        """
+        table = database.FunctionResultCacheDB
+        evicted = 0
+        if self.ttl_seconds:
+            cutoff = datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+            evicted += (
+                db.query(table)
+                .filter(table.created_at < cutoff)
+                .delete(synchronize_session=False)
+            )
+
+        excess = db.query(table).count() - self.max_entries
+        if excess > 0:
+            oldest_ids = (
+                db.query(table.id).order_by(table.created_at, table.id).limit(excess)
+            )
+            evicted += (
+                db.query(table)
+                .filter(table.id.in_(oldest_ids.scalar_subquery()))
+                .delete(synchronize_session=False)
+            )
+        db.commit()
+
+        if evicted:
+            logger.info(f"Evicted {evicted} result cache entries")
+            # Memory entries may point at evicted rows, start over
+            with self._lock:
+                self._memory.clear()
+        return evicted
+
+    def invalidate(self, db: Session, function_id: Optional[int] = None) -> int:
+        """
+        Drop cached results, either for one function or for all functions.
+
+        Returns:
+            Number of removed entries
+        """
+        query = db.query(database.FunctionResultCacheDB)
+        if function_id is not None:
+            query = query.filter(
+                database.FunctionResultCacheDB.functionID == function_id
+            )
+        count = query.delete(synchronize_session=False)
+        db.commit()
+
+        with self._lock:
+            self._memory.clear()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_memory_entries,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value else None
+
+
+result_cache = ResultCache(
+    max_memory_entries=int(os.environ.get("FUNCTIONS_STORE_CACHE_MEMORY_ENTRIES", 1024)),
+    max_entries=int(os.environ.get("FUNCTIONS_STORE_CACHE_MAX_ENTRIES", 100000)),
+    ttl_seconds=_optional_float(os.environ.get("FUNCTIONS_STORE_CACHE_TTL_SECONDS")),
+)
@@ -0,0 +1,424 @@
+"""
+Server-wide scheduling of queued jobs.
+
+Concurrency limits are stored in the database, so they apply to all workers
+whether they are embedded in the API process or running as separate processes:
+
+- a global limit on the number of RUNNING jobs (max_parallel_jobs of the
+  /function/config endpoint),
+- optional per-function limits.
+
+Limits count jobs: each job of a chunk of a vectorized function counts, so a
+chunk never holds more jobs than the limit of its function allows.
+
+When several functions have jobs waiting, the next job is taken from the
+function with the fewest running jobs relative to its weight, and among the
+collections of that function (jobs submitted on their own count as one more
+group) from the one with the fewest running jobs. Concurrent batches thus
+share the workers fairly instead of first-come-first-served, whether they
+run different functions or the same one. A job belonging to several
+collections counts towards each of them.
+
+Running jobs are counted on every claim, which is cheap as there are only as
+many as the workers run. Counting the pending jobs means reading the whole
+queue, so those counts are cached for queue_refresh_seconds and decremented
+by the claims of this process meanwhile. Jobs enqueued by another process may
+thus wait up to queue_refresh_seconds longer before they are claimed.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, aliased
+
+from . import database, models
+from .function_cache import FunctionDefinition
+from .job_collections import record_status_changes
+from .job_queue import (
+    DEFAULT_LEASE_SECONDS,
+    claim_pending,
+    claim_pending_many,
+    load_claimed_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUE_REFRESH_SECONDS = float(
+    os.environ.get("FUNCTIONS_STORE_QUEUE_REFRESH_SECONDS", 1.0)
+)
+
+
+def set_execution_limit(
+    db: Session,
+    max_parallel_jobs: Optional[int],
+    function_id: Optional[int] = None,
+    weight: Optional[int] = None,
+) -> database.ExecutionLimitDB:
+    """Set the global limit, or the limit of a function if function_id is given"""
+    limit = (
+        db.query(database.ExecutionLimitDB)
+        .filter(database.ExecutionLimitDB.functionID == function_id)
+        .first()
+    )
+    if limit is None:
+        limit = database.ExecutionLimitDB(functionID=function_id, weight=1)
+        db.add(limit)
+    limit.max_parallel_jobs = max_parallel_jobs
+    if weight is not None:
+        limit.weight = weight
+    db.commit()
+    db.refresh(limit)
+    return limit
+
+
+def _running_count(function_id: Optional[int] = None):
+    """Subquery counting RUNNING jobs, usable in the claiming UPDATE statement"""
+    # Aliased so it is not correlated with the updated function_jobs row
+    jobs = aliased(database.FunctionJobDB)
+    query = select(func.count()).select_from(jobs).where(
+        jobs.status == models.JobStatus.RUNNING
+    )
+    if function_id is not None:
+        query = query.where(jobs.functionID == function_id)
+    return query.scalar_subquery()
+
+
+class Scheduler:
+    """Picks the next job to run according to the limits and fair share"""
+
+    def __init__(
+        self,
+        refresh_seconds: float = 5.0,
+        queue_refresh_seconds: float = QUEUE_REFRESH_SECONDS,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.queue_refresh_seconds = queue_refresh_seconds
+        self._limits: Dict[Optional[int], Tuple[Optional[int], int]] = {}
+        self._limits_loaded_at: Optional[float] = None
+        self._pending: Dict[Tuple[int, Optional[int]], Dict[str, Any]] = {}
+        self._pending_loaded_at: Optional[float] = None
+        # Incremented by invalidate_queue, so counts read meanwhile are not kept
+        self._queue_generation = 0
+        self._lock = threading.Lock()
+
+    def limits(self, db: Session) -> Dict[Optional[int], Tuple[Optional[int], int]]:
+        """
+        Get the limits, re-read from the database every refresh_seconds.
+
+        Returns:
+            Mapping of function id (None for the global limit) to its
+            (max_parallel_jobs, weight)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._limits_loaded_at is None
+                or now - self._limits_loaded_at > self.refresh_seconds
+            ):
+                self._limits = {
+                    row.functionID: (row.max_parallel_jobs, row.weight or 1)
+                    for row in db.query(database.ExecutionLimitDB).all()
+                }
+                self._limits_loaded_at = now
+            return self._limits
+
+    def invalidate(self) -> None:
+        """Make the next call re-read the limits"""
+        with self._lock:
+            self._limits_loaded_at = None
+
+    def invalidate_queue(self) -> None:
+        """Make the next claim re-count the pending jobs, e.g. after enqueuing"""
+        with self._lock:
+            self._pending_loaded_at = None
+            self._queue_generation += 1
+
+    @staticmethod
+    def _group_counts(
+        db: Session, status: models.JobStatus
+    ) -> Dict[Tuple[int, Optional[int]], Dict[str, Any]]:
+        """
+        Count the jobs with a status per function and collection, joining the
+        memberships once rather than looking them up job by job
+
+        Returns:
+            Mapping of (function id, collection id or None for jobs outside
+            collections) to the "count" of jobs and the creation time of the
+            "oldest" one
+        """
+        jobs = database.FunctionJobDB
+        memberships = database.CollectionJobDB
+        rows = (
+            db.query(
+                jobs.functionID,
+                memberships.collection_id,
+                func.count(jobs.id),
+                func.min(jobs.created_at),
+            )
+            .outerjoin(memberships, memberships.job_id == jobs.id)
+            .filter(jobs.status == status)
+            .group_by(jobs.functionID, memberships.collection_id)
+        )
+        return {
+            (function_id, collection_id): {"count": count, "oldest": oldest}
+            for function_id, collection_id, count, oldest in rows
+        }
+
+    def _pending_counts(
+        self, db: Session
+    ) -> Dict[Tuple[int, Optional[int]], Dict[str, Any]]:
+        """Get the pending counts, re-read every queue_refresh_seconds"""
+        with self._lock:
+            loaded_at = self._pending_loaded_at
+            if (
+                loaded_at is not None
+                and time.monotonic() - loaded_at <= self.queue_refresh_seconds
+            ):
+                return {group: dict(entry) for group, entry in self._pending.items()}
+            generation = self._queue_generation
+        loaded_at = time.monotonic()
+        pending = self._group_counts(db, models.JobStatus.PENDING)
+        with self._lock:
+            self._pending = pending
+            if generation == self._queue_generation:
+                self._pending_loaded_at = loaded_at
+            return {group: dict(entry) for group, entry in pending.items()}
+
+    def _claimed(self, allocation: Dict[Tuple[int, Optional[int]], int]) -> None:
+        """Take jobs handed out by a claim off the cached pending counts"""
+        with self._lock:
+            for group, slots in allocation.items():
+                entry = self._pending.get(group)
+                if entry is not None:
+                    entry["count"] = max(entry["count"] - slots, 0)
+
+    def queue_counts(
+        self, db: Session
+    ) -> Dict[Tuple[int, Optional[int]], Dict[str, Any]]:
+        """
+        Count PENDING and RUNNING jobs per function and collection, pending
+        ones as of at most queue_refresh_seconds ago.
+
+        Returns:
+            Mapping of (function id, collection id or None for jobs outside
+            collections) to its "pending" and "running" counts and the
+            creation time of its oldest pending job
+        """
+        counts: Dict[Tuple[int, Optional[int]], Dict[str, Any]] = {}
+        for group, entry in self._pending_counts(db).items():
+            if entry["count"]:
+                counts[group] = {
+                    "pending": entry["count"],
+                    "running": 0,
+                    "oldest_pending": entry["oldest"],
+                }
+        for group, entry in self._group_counts(db, models.JobStatus.RUNNING).items():
+            counts.setdefault(
+                group, {"pending": 0, "running": 0, "oldest_pending": None}
+            )["running"] = entry["count"]
+        return counts
+
+    @staticmethod
+    def _function_counts(
+        db: Session,
+        statuses: Tuple[models.JobStatus, ...] = (
+            models.JobStatus.PENDING,
+            models.JobStatus.RUNNING,
+        ),
+    ) -> Dict[int, Dict[str, int]]:
+        """Count the jobs with the given statuses per function"""
+        jobs = database.FunctionJobDB
+        rows = (
+            db.query(jobs.functionID, jobs.status, func.count(jobs.id))
+            .filter(jobs.status.in_(statuses))
+            .group_by(jobs.functionID, jobs.status)
+        )
+        counts: Dict[int, Dict[str, int]] = {}
+        for function_id, status, count in rows:
+            entry = counts.setdefault(function_id, {"pending": 0, "running": 0})
+            if status == models.JobStatus.PENDING:
+                entry["pending"] = count
+            else:
+                entry["running"] = count
+        return counts
+
+    def claim(
+        self,
+        db: Session,
+        owner: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_jobs: int = 1,
+        function_id: Optional[int] = None,
+    ) -> List[Tuple[database.FunctionJobDB, FunctionDefinition]]:
+        """
+        Claim up to max_jobs jobs, only of function_id if given, as far as the
+        limits allow, with a single commit.
+
+        Returns:
+            The claimed jobs with the definition of their function, possibly
+            empty if there is nothing to claim right now
+        """
+        limits = self.limits(db)
+        global_limit = limits.get(None, (None, 1))[0]
+        counts = self.queue_counts(db)
+        if function_id is not None:
+            counts = {
+                group: entry
+                for group, entry in counts.items()
+                if group[0] == function_id
+            }
+
+        # Hand out the free slots one by one to the function with the
+        # smallest weighted share of running jobs, and within it to the
+        # collection with the fewest running jobs. Jobs of several
+        # collections are counted once per function.
+        function_running = {function_id: 0 for function_id, _ in counts}
+        for function_id, total in self._function_counts(
+            db, (models.JobStatus.RUNNING,)
+        ).items():
+            function_running[function_id] = total["running"]
+        total_running = sum(function_running.values())
+        if global_limit is not None:
+            max_jobs = min(max_jobs, global_limit - total_running)
+        allocation: Dict[Tuple[int, Optional[int]], int] = {}
+        for _ in range(max(max_jobs, 0)):
+            best = None
+            for group, entry in counts.items():
+                function_id = group[0]
+                limit, weight = limits.get(function_id, (None, 1))
+                running = function_running[function_id]
+                if entry["pending"] <= allocation.get(group, 0):
+                    continue
+                if limit is not None and running >= limit:
+                    continue
+                key = (
+                    running / max(weight, 1),
+                    entry["running"] + allocation.get(group, 0),
+                    entry["oldest_pending"],
+                )
+                if best is None or key < best[0]:
+                    best = (key, group)
+            if best is None:
+                break
+            allocation[best[1]] = allocation.get(best[1], 0) + 1
+            function_running[best[1][0]] += 1
+
+        claimed_ids = []
+        for (function_id, collection_id), slots in allocation.items():
+            claimed_ids += self._claim_jobs(
+                db, owner, lease_seconds, function_id, collection_id, slots, limits
+            )
+        self._claimed(allocation)
+        return self._load_claimed(db, owner, claimed_ids)
+
+    def claim_function(
+        self,
+        db: Session,
+        owner: str,
+        function_id: int,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_jobs: int = 1,
+    ) -> List[Tuple[database.FunctionJobDB, FunctionDefinition]]:
+        """
+        Claim up to max_jobs jobs of a function, as far as the limits allow,
+        shared between its collections like any claim, with a single commit.
+        Used to fill up chunks of vectorized functions once the scheduler gave
+        them a slot. Each job of a chunk counts against the limits.
+        """
+        return self.claim(db, owner, lease_seconds, max_jobs, function_id)
+
+    @staticmethod
+    def _claim_jobs(
+        db: Session,
+        owner: str,
+        lease_seconds: float,
+        function_id: int,
+        collection_id: Optional[int],
+        slots: int,
+        limits: Dict[Optional[int], Tuple[Optional[int], int]],
+    ) -> List[int]:
+        """
+        Claim the oldest pending jobs of a function in a collection (outside
+        collections if collection_id is None), without committing.
+        """
+        jobs = database.FunctionJobDB
+        global_limit = limits.get(None, (None, 1))[0]
+        limit = limits.get(function_id, (None, 1))[0]
+        # Limits are re-checked in the claiming statements, other workers
+        # may have started jobs since the counts were taken
+        conditions = []
+        if global_limit is not None:
+            conditions.append(_running_count() < global_limit)
+        if limit is not None:
+            conditions.append(_running_count(function_id) < limit)
+
+        query = db.query(jobs.id).filter(
+            jobs.functionID == function_id,
+            jobs.status == models.JobStatus.PENDING,
+        )
+        memberships = database.CollectionJobDB
+        if collection_id is None:
+            query = query.filter(~exists().where(memberships.job_id == jobs.id))
+        else:
+            query = query.join(memberships, memberships.job_id == jobs.id).filter(
+                memberships.collection_id == collection_id
+            )
+        candidates = query.order_by(jobs.created_at, jobs.id).limit(slots).all()
+        if not conditions:
+            return claim_pending_many(
+                db, [job_id for (job_id,) in candidates], owner, lease_seconds
+            )
+        return [
+            job_id
+            for (job_id,) in candidates
+            if claim_pending(db, job_id, owner, lease_seconds, conditions)
+        ]
+
+    @staticmethod
+    def _load_claimed(
+        db: Session, owner: str, claimed_ids: List[int]
+    ) -> List[Tuple[database.FunctionJobDB, FunctionDefinition]]:
+        if not claimed_ids:
+            db.rollback()
+            return []
+        record_status_changes(
+            db,
+            [
+                (job_id, models.JobStatus.PENDING, models.JobStatus.RUNNING)
+                for job_id in claimed_ids
+            ],
+        )
+        db.commit()
+        return load_claimed_jobs(db, claimed_ids, owner)
+
+    def stats(self, db: Session) -> Dict[str, Any]:
+        """Queue depth, running counts and limits, overall and per function"""
+        self.invalidate()
+        limits = self.limits(db)
+        counts = self._function_counts(db)
+        functions = []
+        for function_id in sorted(set(counts) | {f for f in limits if f is not None}):
+            entry = counts.get(function_id, {"pending": 0, "running": 0})
+            limit, weight = limits.get(function_id, (None, 1))
+            functions.append(
+                {
+                    "function_id": function_id,
+                    "pending": entry["pending"],
+                    "running": entry["running"],
+                    "max_parallel_jobs": limit,
+                    "weight": weight,
+                }
+            )
+        return {
+            "max_parallel_jobs": limits.get(None, (None, 1))[0],
+            "pending": sum(entry["pending"] for entry in counts.values()),
+            "running": sum(entry["running"] for entry in counts.values()),
+            "functions": functions,
+        }
+
+
+scheduler = Scheduler()
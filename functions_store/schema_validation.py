@@ -0,0 +1,128 @@
+"""
+Validation of function inputs and outputs against their JSON Schemas.
+
+jsonschema.validate() looks up the validator class and checks the schema
+itself on every call. Validators are instead built once per function and
+schema, and cached until the schema of the function changes.
+
+When fastjsonschema is installed, schemas are also compiled to Python code,
+which accepts valid data much faster. Data it rejects is validated again with
+jsonschema, so error messages do not depend on whether it is installed.
+"""
+
+import logging
+import os
+import threading
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
+
+logger = logging.getLogger(__name__)
+
+# Set FUNCTIONS_STORE_FAST_VALIDATION=0 to validate with jsonschema only
+FAST_VALIDATION = os.environ.get("FUNCTIONS_STORE_FAST_VALIDATION", "1") != "0"
+
+
+def check_schema(schema: Dict[str, Any]) -> None:
+    """
+    Validate that a schema is a valid JSON Schema.
+    Raises jsonschema's SchemaError if the schema is invalid.
+    """
+    validator_for(schema).check_schema(schema)
+
+
+class CompiledValidator:
+    """A JSON Schema validator built once for a schema"""
+
+    def __init__(self, schema: Dict[str, Any], context: str):
+        self.schema = deepcopy(schema)
+        self.context = context
+        self._validator = validator_for(schema)(schema)
+        self._fast: Optional[Callable[[Any], Any]] = None
+        if fastjsonschema is not None and FAST_VALIDATION:
+            try:
+                self._fast = fastjsonschema.compile(schema)
+            except Exception as e:
+                # Schemas using features fastjsonschema does not support
+                logger.debug("Schema not compiled by fastjsonschema: %s", e)
+
+    def error(self, data: Any) -> Optional[str]:
+        """Get the validation error of data, None if it is valid"""
+        if self._fast is not None:
+            try:
+                self._fast(data)
+                return None
+            except fastjsonschema.JsonSchemaException:
+                pass
+        error = best_match(self._validator.iter_errors(data))
+        if error is None:
+            return None
+        path = " -> ".join(str(p) for p in error.path) if error.path else "root"
+        return f"{self.context} validation failed at {path}: {error.message}"
+
+    def errors(self, items: Iterable[Any]) -> List[Optional[str]]:
+        """Get the validation error of each item, None for valid items"""
+        return [self.error(item) for item in items]
+
+
+class SchemaValidatorCache:
+    """
+    Validators of the input and output schemas of functions, keyed on the
+    function id. A cached validator is rebuilt when the schema it was built
+    for differs from the current one.
+    """
+
+    def __init__(self):
+        self._validators: Dict[Tuple[int, str], CompiledValidator] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, function_id: int, kind: str, schema: Dict[str, Any]
+    ) -> CompiledValidator:
+        """
+        Get the validator of a schema of a function.
+
+        Parameters:
+            kind: "input" or "output"
+        """
+        key = (function_id, kind)
+        with self._lock:
+            validator = self._validators.get(key)
+        if validator is not None and validator.schema == schema:
+            return validator
+
+        validator = CompiledValidator(schema, kind.capitalize())
+        with self._lock:
+            self._validators[key] = validator
+        return validator
+
+    def input_validator(self, function) -> Optional[CompiledValidator]:
+        """Get the validator of the inputs of a function, None without schema"""
+        if not function.input_schema:
+            return None
+        return self.get(function.id, "input", function.input_schema)
+
+    def output_validator(self, function) -> Optional[CompiledValidator]:
+        """Get the validator of the outputs of a function, None without schema"""
+        if not function.output_schema:
+            return None
+        return self.get(function.id, "output", function.output_schema)
+
+    def invalidate(self, function_id: Optional[int] = None) -> None:
+        """Drop the validators of a function, or of all functions"""
+        with self._lock:
+            if function_id is None:
+                self._validators.clear()
+            else:
+                for kind in ("input", "output"):
+                    self._validators.pop((function_id, kind), None)
+
+
+schema_validators = SchemaValidatorCache()
@@ -7,12 +7,20 @@ setup(
     install_requires=[
         "fastapi>=0.68.0",
         "uvicorn>=0.15.0",
-        "sqlalchemy>=1.4.23",
+        "sqlalchemy>=2.0.10",
         "pydantic>=1.8.2",
+        "httpx>=0.27.0",
+        "numpy>=1.22",
+        "pandas>=2.2.3",
+        "jsonschema>=4.23.0",
     ],
+    extras_require={
+        # Arrow and Parquet exports of collection results
+        "arrow": ["pyarrow>=14.0"],
+    },
     entry_points={
         "console_scripts": [
-            "functions-store=functions_store.main:app",
+            "functions-store=functions_store.__main__:main",
         ],
     },
 )
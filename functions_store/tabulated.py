@@ -0,0 +1,383 @@
+"""
+Tabulated results: functions answered by looking up precomputed results in a
+CSV file instead of running a computation.
+
+The url of a "tabulated" function is the path of the CSV file, optionally
+followed by options as a query string:
+
+    /data/results_Final_50LHS_TitrationProcessed.csv?outputs=Thermal_Peak_Overall,Thermal_Peak_Nerve&digits=12
+
+    outputs: Columns returned (default: all columns that are not inputs)
+    digits: Significant digits the input values are compared with (default:
+        DEFAULT_DIGITS), so values that went through a text round-trip still
+        match
+    mode: How inputs are matched with rows, one of MODES:
+        exact: The row with the same rounded inputs (default)
+        nearest: The nearest row
+        idw: Inverse distance weighting of the numeric outputs of the k
+            nearest rows
+        linear: Affine least-squares fit of the numeric outputs of the k
+            nearest rows
+    k: Number of neighbours of the idw and linear modes (default: the number
+        of inputs + 1 for idw, twice that for linear)
+    tolerance: Largest distance to the nearest row, beyond which a point has
+        no result, with each input scaled by its range in the table
+
+The columns of the inputs a function is called with are the key of the
+lookup. Each file is read once and kept in memory until it changes on disk,
+and a hash index on the rounded key columns is built on first use of each
+set of key columns, so a lookup costs a dict access instead of a scan of
+the table. The other modes search a nearest-neighbour index (see
+neighbours.py) built once per table and set of input columns.
+"""
+
+import functools
+import logging
+import os
+import threading
+import urllib.parse
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from .neighbours import (
+    NeighbourIndex,
+    default_neighbours,
+    inverse_distance,
+    local_linear,
+    within_tolerance,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIGITS = 12
+
+MODES = ("exact", "nearest", "idw", "linear")
+
+# Index value of keys shared by several rows
+_DUPLICATE = -1
+
+
+def round_significant(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round each value to a number of significant digits, vectorized"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude = np.floor(np.log10(np.abs(values)))
+    magnitude = np.where(np.isfinite(magnitude), magnitude, 0)
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.round(values * scale) / scale
+
+
+def _row_keys(values: np.ndarray, digits: int):
+    """Hashable keys of the rows of a matrix of values"""
+    return map(tuple, round_significant(values, digits).tolist())
+
+
+class TabulatedResults:
+    """The rows of a results table, with hash indexes on sets of key columns"""
+
+    def __init__(self, path: str, frame: pd.DataFrame, signature: Tuple[int, int]):
+        self.path = path
+        self.frame = frame
+        self.signature = signature  # (mtime_ns, size) of the file
+        self._indexes: Dict[Tuple[Tuple[str, ...], int], Dict[Tuple, int]] = {}
+        self._neighbour_indexes: Dict[Tuple[str, ...], NeighbourIndex] = {}
+        self._lock = threading.Lock()
+
+    def _check_inputs(self, columns: Tuple[str, ...]) -> None:
+        missing = [column for column in columns if column not in self.frame.columns]
+        if missing:
+            raise ValueError(
+                f"Inputs {missing} not in {self.path}. "
+                f"Columns are: {list(self.frame.columns)}"
+            )
+
+    def index(self, columns: Tuple[str, ...], digits: int) -> Dict[Tuple, int]:
+        """Get the index of the rows on the rounded values of columns"""
+        key = (columns, digits)
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is not None:
+            return index
+
+        self._check_inputs(columns)
+        index = {}
+        values = self.frame[list(columns)].to_numpy(dtype=float)
+        for row, row_key in enumerate(_row_keys(values, digits)):
+            index[row_key] = _DUPLICATE if row_key in index else row
+        with self._lock:
+            self._indexes[key] = index
+        return index
+
+    def neighbour_index(self, columns: Tuple[str, ...]) -> NeighbourIndex:
+        """Get the nearest-neighbour index of the rows on columns"""
+        with self._lock:
+            search = self._neighbour_indexes.get(columns)
+        if search is not None:
+            return search
+
+        self._check_inputs(columns)
+        search = NeighbourIndex(self.frame[list(columns)].to_numpy(dtype=float))
+        with self._lock:
+            self._neighbour_indexes[columns] = search
+        return search
+
+    def output_columns(
+        self, columns: Tuple[str, ...], outputs: Optional[Sequence[str]]
+    ) -> List[str]:
+        if outputs is None:
+            return [column for column in self.frame.columns if column not in columns]
+        missing = [column for column in outputs if column not in self.frame.columns]
+        if missing:
+            raise ValueError(f"Outputs {missing} not in {self.path}")
+        return list(outputs)
+
+    def lookup_many(
+        self,
+        points: List[Dict[str, Any]],
+        outputs: Optional[Sequence[str]] = None,
+        digits: int = DEFAULT_DIGITS,
+        mode: str = "exact",
+        k: Optional[int] = None,
+        tolerance: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Look up the results of many points at once. The points are rounded, or
+        searched for, in a single vectorized pass, and the outputs of all
+        matching rows taken from the table in one go.
+
+        Parameters:
+            mode, k, tolerance: See the module documentation
+
+        Returns:
+            For each point, the dict of its outputs, or a ValueError if it has
+            no result
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown lookup mode {mode}, expected one of {MODES}")
+        # Points are indexed on their input names, in any order
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for position, point in enumerate(points):
+            groups.setdefault(tuple(sorted(point)), []).append(position)
+
+        results: List[Any] = [None] * len(points)
+        for columns, positions in groups.items():
+            group = [points[position] for position in positions]
+            try:
+                found = self._lookup_group(
+                    columns, group, outputs, digits, mode, k, tolerance
+                )
+            except ValueError as e:
+                found = [e] * len(group)
+            for position, result in zip(positions, found):
+                results[position] = result
+        return results
+
+    def _lookup_group(
+        self,
+        columns: Tuple[str, ...],
+        points: List[Dict[str, Any]],
+        outputs: Optional[Sequence[str]],
+        digits: int,
+        mode: str,
+        k: Optional[int],
+        tolerance: Optional[float],
+    ) -> List[Any]:
+        """Look up points with the same input names"""
+        output_columns = self.output_columns(columns, outputs)
+        try:
+            values = np.array(
+                [[point[column] for column in columns] for point in points],
+                dtype=float,
+            )
+        except (TypeError, ValueError):
+            if len(points) == 1:
+                raise ValueError(f"Inputs {points[0]} are not all numbers.")
+            # Find the points with values that are not numbers one by one
+            return [
+                self.lookup_many([point], outputs, digits, mode, k, tolerance)[0]
+                for point in points
+            ]
+
+        if mode != "exact":
+            return self._interpolate(
+                columns, points, values, output_columns, mode, k, tolerance
+            )
+
+        index = self.index(columns, digits)
+        results: List[Any] = [None] * len(points)
+        rows = []
+        positions = []
+        for position, (point, key) in enumerate(zip(points, _row_keys(values, digits))):
+            row = index.get(key)
+            if row is None:
+                results[position] = ValueError(f"No result found for inputs {point}.")
+            elif row == _DUPLICATE:
+                results[position] = ValueError(
+                    f"Multiple results found for inputs {point}."
+                )
+            else:
+                rows.append(row)
+                positions.append(position)
+
+        if rows:
+            found = self.frame[output_columns].iloc[rows].to_dict("records")
+            for position, result in zip(positions, found):
+                results[position] = result
+        return results
+
+    def _interpolate(
+        self,
+        columns: Tuple[str, ...],
+        points: List[Dict[str, Any]],
+        values: np.ndarray,
+        output_columns: List[str],
+        mode: str,
+        k: Optional[int],
+        tolerance: Optional[float],
+    ) -> List[Any]:
+        """Look up points from their nearest rows"""
+        search = self.neighbour_index(columns)
+        if mode == "nearest":
+            k = 1
+        else:
+            k = k or default_neighbours(mode, len(columns))
+        complete = ~np.isnan(values).any(axis=1)
+        distances, neighbours = search.query(np.nan_to_num(values), k)
+        close = within_tolerance(distances, tolerance)
+
+        # Outputs of the nearest row, with the numeric ones interpolated
+        found = self.frame[output_columns].iloc[search.rows[neighbours[:, 0]]]
+        results: List[Any] = found.to_dict("records")
+        numeric = [column for column in output_columns if is_numeric_dtype(found[column])]
+        if mode != "nearest" and numeric:
+            table = self.frame[numeric].to_numpy(dtype=float)[search.rows]
+            if mode == "idw":
+                interpolated = inverse_distance(distances, table[neighbours])
+            else:
+                interpolated = local_linear(
+                    search.normalize(values), search.points[neighbours], table[neighbours]
+                )
+            for result, row in zip(results, interpolated.tolist()):
+                result.update(zip(numeric, row))
+
+        for position, point in enumerate(points):
+            if not complete[position]:
+                results[position] = ValueError(f"Inputs {point} are not all numbers.")
+            elif not close[position]:
+                results[position] = ValueError(
+                    f"No result within tolerance {tolerance} of inputs {point}."
+                )
+        return results
+
+    def lookup(
+        self,
+        point: Dict[str, Any],
+        outputs: Optional[Sequence[str]] = None,
+        digits: int = DEFAULT_DIGITS,
+        mode: str = "exact",
+        k: Optional[int] = None,
+        tolerance: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Look up the outputs of the row matching the inputs of a point"""
+        result = self.lookup_many([point], outputs, digits, mode, k, tolerance)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TableCache:
+    """
+    Thread-safe cache of results tables, each read once and reloaded when
+    its file changes on disk (detected through its mtime and size).
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, TabulatedResults] = {}
+        self._lock = threading.Lock()
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _path_lock(self, abs_path: str) -> threading.Lock:
+        with self._lock:
+            return self._path_locks.setdefault(abs_path, threading.Lock())
+
+    def load(self, file_path: str) -> TabulatedResults:
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            table = self._tables.get(abs_path)
+            if table is not None and table.signature == signature:
+                self.hits += 1
+                return table
+
+        with self._path_lock(abs_path):
+            # Another thread may have read the file while we were waiting
+            table = self._tables.get(abs_path)
+            if table is None or table.signature != signature:
+                table = TabulatedResults(abs_path, pd.read_csv(abs_path), signature)
+                logger.info(f"Loaded {len(table.frame)} results from {abs_path}")
+                with self._lock:
+                    self._tables[abs_path] = table
+                    self.misses += 1
+            return table
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "loaded_tables": len(self._tables),
+            }
+
+
+result_tables = TableCache()
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_url(url: str) -> Tuple[str, Mapping[str, Any]]:
+    """
+    Split the url of a tabulated function into the path of its table and
+    the (read-only) options of lookup_many. Urls are parsed once, not once
+    per job.
+    """
+    path, _, query = url.partition("?")
+    values = {name: value[-1] for name, value in urllib.parse.parse_qs(query).items()}
+    options: Dict[str, Any] = {}
+    if "outputs" in values:
+        options["outputs"] = values["outputs"].split(",")
+    if "digits" in values:
+        options["digits"] = int(values["digits"])
+    if "mode" in values:
+        options["mode"] = values["mode"]
+    if "k" in values:
+        options["k"] = int(values["k"])
+    if "tolerance" in values:
+        options["tolerance"] = float(values["tolerance"])
+    return path, MappingProxyType(options)
+
+
+def execute_tabulated(url: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute a tabulated function: look up the results of its inputs"""
+    path, options = parse_url(url)
+    return result_tables.load(path).lookup(inputs, **options)
+
+
+def execute_tabulated_many(url: str, inputs: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Execute a tabulated function for many inputs in one call.
+
+    Returns:
+        The outputs of each input, or the exception it failed with
+    """
+    path, options = parse_url(url)
+    return result_tables.load(path).lookup_many(inputs, **options)
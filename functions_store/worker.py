@@ -0,0 +1,446 @@
+"""
+Workers executing the jobs of the durable job queue.
+
+A worker can run embedded in the API process (the default, convenient for
+development) or standalone via `python -m functions_store worker`, which starts
+several worker processes so compute scales independently of the API tier.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import database, models
+from .events import job_changes
+from .executors import (
+    VECTORIZED_CHUNK_SIZE,
+    async_executors,
+    execute_function,
+    execute_function_batch,
+    shutdown_process_pool,
+)
+from .function_cache import FunctionDefinition
+from .job_queue import (
+    DEFAULT_LEASE_SECONDS,
+    LeaseKeeper,
+    finish_jobs,
+    new_owner_id,
+    release_owner_jobs,
+    requeue_stale_jobs,
+)
+from .remote import remote_http
+from .result_cache import cache_hit_job_info, make_cache_key, result_cache
+from .scheduler import scheduler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = int(os.environ.get("FUNCTIONS_STORE_WORKER_CONCURRENCY", 10))
+DEFAULT_POLL_INTERVAL = float(os.environ.get("FUNCTIONS_STORE_POLL_INTERVAL", 0.5))
+# Job outcomes are written in batches of up to FLUSH_SIZE jobs, at least every
+# FLUSH_INTERVAL seconds
+DEFAULT_FLUSH_SIZE = int(os.environ.get("FUNCTIONS_STORE_FLUSH_SIZE", 200))
+DEFAULT_FLUSH_INTERVAL = float(os.environ.get("FUNCTIONS_STORE_FLUSH_INTERVAL", 0.2))
+
+
+def with_session(fn: Callable, *args, **kwargs) -> Any:
+    """Call fn with a new database session as first argument"""
+    db = database.SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+def store_outcomes(
+    db: Session,
+    owner: str,
+    outcomes: List[Dict[str, Any]],
+    cache_entries: List[Tuple[str, int, Dict[str, Any], Optional[int]]],
+) -> None:
+    """Write a batch of job outcomes and the results to memoize"""
+    stored = set(finish_jobs(db, owner, outcomes))
+    cache_entries = [entry for entry in cache_entries if entry[3] in stored]
+    if cache_entries:
+        result_cache.put_many(db, cache_entries)
+
+
+class WriteBehindBuffer:
+    """
+    Collects job outcomes and writes them in batches, so a large map does a
+    few hundred commits instead of one or more per job.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Dict[str, Any]], List[Tuple]], Awaitable[None]],
+        max_size: int = DEFAULT_FLUSH_SIZE,
+        max_delay: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self._flush = flush
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._outcomes: List[Dict[str, Any]] = []
+        self._cache_entries: List[Tuple] = []
+        self._full = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        return len(self._outcomes)
+
+    def add(self, outcome: Dict[str, Any], cache_entry: Optional[Tuple] = None):
+        self._outcomes.append(outcome)
+        if cache_entry is not None:
+            self._cache_entries.append(cache_entry)
+        if len(self._outcomes) >= self.max_size:
+            self._full.set()
+
+    async def flush(self) -> None:
+        outcomes, self._outcomes = self._outcomes, []
+        cache_entries, self._cache_entries = self._cache_entries, []
+        self._full.clear()
+        if outcomes:
+            try:
+                await self._flush(outcomes, cache_entries)
+            except Exception as e:
+                # The leases expire and the jobs get requeued
+                logger.error(f"Writing outcomes of {len(outcomes)} jobs failed: {str(e)}")
+
+    async def run(self) -> None:
+        """Flush periodically, or earlier when the buffer is full"""
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.max_delay)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+
+class JobWorker:
+    """
+    Claims PENDING jobs from the queue and executes up to `concurrency` of them
+    at a time in a thread pool. Which job is claimed next, and whether the
+    server-wide limits allow one more, is decided by the scheduler.
+
+    Jobs of vectorized functions take a single slot of the worker for a
+    whole chunk: the slot is filled up with more jobs of the function, which
+    is then called once for all of them. The server-wide limits still count
+    every job of a chunk, and the jobs filling it are shared between the
+    collections of the function like any claim.
+
+    Jobs are claimed in batches and their outcomes are written behind in
+    batches, each database call using its own session.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        owner: Optional[str] = None,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.owner = owner or new_owner_id()
+        self._lease_keeper = LeaseKeeper(self.owner, lease_seconds)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._tasks: Set[asyncio.Task] = set()
+        self._buffer = WriteBehindBuffer(self._store, flush_size, flush_interval)
+        # Database calls are serialized on a dedicated thread
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="functions-store-db"
+        )
+        self._job_executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="functions-store-job"
+        )
+
+    async def _db_call(self, fn: Callable, *args, **kwargs) -> Any:
+        return await self._loop.run_in_executor(
+            self._db_executor, lambda: with_session(fn, *args, **kwargs)
+        )
+
+    async def _store(self, outcomes: List[Dict[str, Any]], cache_entries: List[Tuple]):
+        await self._db_call(store_outcomes, self.owner, outcomes, cache_entries)
+        job_changes.notify()
+        # Claims may have been held back by the jobs written now
+        self._wakeup.set()
+
+    def notify(self) -> None:
+        """Wake the worker up, e.g. after new jobs were enqueued (thread-safe)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def stop(self) -> None:
+        """Ask the worker to stop claiming jobs (thread-safe)"""
+        self._stopping = True
+        self.notify()
+
+    def _claim(
+        self, db: Session, max_jobs: int, function_id: Optional[int] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Claim jobs, only of function_id if given, and look up the memoized
+        results of cacheable ones.
+
+        Returns:
+            Tuples of (job, function, cache_key, cached entry or None)
+        """
+        if function_id is None:
+            claimed = scheduler.claim(db, self.owner, self.lease_seconds, max_jobs)
+        else:
+            claimed = scheduler.claim_function(
+                db, self.owner, function_id, self.lease_seconds, max_jobs
+            )
+        keys = [
+            make_cache_key(function, job.inputs) if function.cacheable else None
+            for job, function in claimed
+        ]
+        cached = {}
+        if any(keys):
+            cached = result_cache.get_many(
+                db, [key for key in keys if key], use_memory=False
+            )
+        return [
+            (job, function, key, cached.get(key) if key else None)
+            for (job, function), key in zip(claimed, keys)
+        ]
+
+    async def run(self) -> None:
+        """Run the claim/execute loop until stop() is called"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._lease_keeper.start()
+        flusher = asyncio.create_task(self._buffer.run())
+        logger.info(f"Worker {self.owner} started with concurrency {self.concurrency}")
+
+        await self._db_call(requeue_stale_jobs, include_orphans=True)
+        last_requeue = time.monotonic()
+
+        try:
+            while not self._stopping:
+                if time.monotonic() - last_requeue > self.lease_seconds / 2:
+                    await self._db_call(requeue_stale_jobs)
+                    last_requeue = time.monotonic()
+
+                self._wakeup.clear()
+                free_slots = self.concurrency - len(self._tasks)
+                if free_slots > 0:
+                    claimed = await self._db_call(self._claim, free_slots)
+                    if claimed:
+                        job_changes.notify()
+                    batches: Dict[int, List[Tuple[Any, ...]]] = {}
+                    for job, function, cache_key, cached in claimed:
+                        if cached is not None:
+                            # An identical job finished since this one was enqueued
+                            self._add_cached(job, cached)
+                        elif function.vectorized:
+                            batches.setdefault(function.id, []).append(
+                                (job, function, cache_key)
+                            )
+                        else:
+                            self._start(self._process(job, function, cache_key))
+                    for function_id, batch in batches.items():
+                        await self._fill_batch(function_id, batch)
+                        self._start(self._process_batch(batch))
+                    if claimed and len(self._tasks) < self.concurrency:
+                        # There may be more to claim right away
+                        continue
+                    if not claimed and self._buffer.pending:
+                        # Finished jobs count against the limits until they
+                        # are written, write them now rather than idle
+                        await self._buffer.flush()
+                        continue
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # Jobs still running are handed back to the queue
+            for task in self._tasks:
+                task.cancel()
+            flusher.cancel()
+            await self._buffer.flush()
+            self._lease_keeper.stop()
+            released = await self._db_call(release_owner_jobs, self.owner)
+            if released:
+                logger.info(f"Worker {self.owner} released {released} jobs")
+            self._db_executor.shutdown(wait=True)
+            self._job_executor.shutdown(wait=False)
+            shutdown_process_pool()
+            await remote_http.aclose()
+            logger.info(f"Worker {self.owner} stopped")
+
+    def _start(self, job: Awaitable[None]) -> None:
+        task = asyncio.create_task(job)
+        self._tasks.add(task)
+        task.add_done_callback(self._job_done)
+
+    def _add_cached(self, job: database.FunctionJobDB, cached: Dict[str, Any]) -> None:
+        self._buffer.add(
+            {
+                "job_id": job.id,
+                "status": models.JobStatus.COMPLETED,
+                "outputs": cached["outputs"],
+                "job_info": cache_hit_job_info(cached),
+            }
+        )
+
+    async def _fill_batch(self, function_id: int, batch: List[Tuple[Any, ...]]) -> None:
+        """Claim more jobs of a vectorized function, up to a full chunk"""
+        if len(batch) >= VECTORIZED_CHUNK_SIZE:
+            return
+        more = await self._db_call(
+            self._claim, VECTORIZED_CHUNK_SIZE - len(batch), function_id
+        )
+        for job, function, cache_key, cached in more:
+            if cached is not None:
+                self._add_cached(job, cached)
+            else:
+                batch.append((job, function, cache_key))
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._wakeup.set()
+
+    async def _process(
+        self,
+        job: database.FunctionJobDB,
+        function: FunctionDefinition,
+        cache_key: Optional[str],
+    ) -> None:
+        """Execute a claimed job and buffer its outcome."""
+        job_id = job.id
+        logger.info(f"Job {job_id} claimed by {self.owner}")
+
+        try:
+            async_executor = async_executors.get(function.type)
+            if async_executor is not None:
+                result = await async_executor(function.url, job.inputs)
+            else:
+                result = await self._loop.run_in_executor(
+                    self._job_executor,
+                    execute_function,
+                    function.type,
+                    function.url,
+                    job.inputs,
+                )
+        except Exception as e:
+            logger.error(f"Error processing job {job_id}: {str(e)}", exc_info=True)
+            self._add_outcome(job_id, function, cache_key, e)
+            return
+
+        self._add_outcome(job_id, function, cache_key, result)
+        logger.info(f"Job {job_id} completed")
+
+    async def _process_batch(self, batch: List[Tuple[Any, ...]]) -> None:
+        """Execute claimed jobs of a vectorized function in one call."""
+        function = batch[0][1]
+        logger.info(
+            f"{len(batch)} jobs of function {function.id} claimed by {self.owner}"
+        )
+
+        try:
+            results = await self._loop.run_in_executor(
+                self._job_executor,
+                execute_function_batch,
+                function.type,
+                function.url,
+                [job.inputs for job, _, _ in batch],
+            )
+        except Exception as e:
+            logger.error(
+                f"Error processing {len(batch)} jobs of function {function.id}: {str(e)}",
+                exc_info=True,
+            )
+            results = [e] * len(batch)
+        for (job, _, cache_key), result in zip(batch, results):
+            self._add_outcome(job.id, function, cache_key, result)
+
+    def _add_outcome(
+        self,
+        job_id: int,
+        function: FunctionDefinition,
+        cache_key: Optional[str],
+        result: Any,
+    ) -> None:
+        """
+        Buffer the outcome of a job: its result, validated against the output
+        schema of the function, or the exception it failed with
+        """
+        if isinstance(result, Exception):
+            outputs, error = None, str(result)
+        else:
+            outputs, error = function.outputs(result)
+        if error is not None:
+            self._buffer.add(
+                {
+                    "job_id": job_id,
+                    "status": models.JobStatus.FAILED,
+                    "job_info": {"error": error},
+                }
+            )
+            return
+
+        cache_entry = (cache_key, function.id, outputs, job_id) if cache_key else None
+        self._buffer.add(
+            {"job_id": job_id, "status": models.JobStatus.COMPLETED, "outputs": outputs},
+            cache_entry,
+        )
+
+
+def _run_worker_process(concurrency: int, lease_seconds: float, poll_interval: float):
+    # Connections pooled by the parent (e.g. by the migrations run on import)
+    # were inherited through fork: drop them without closing them, so this
+    # process opens its own and the parent's stay usable
+    database.engine.dispose(close=False)
+    worker = JobWorker(concurrency, lease_seconds, poll_interval)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(main())
+
+
+def run_workers(
+    processes: int = 1,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> None:
+    """Run worker processes until interrupted"""
+    children: List[multiprocessing.Process] = []
+    for i in range(processes):
+        process = multiprocessing.Process(
+            target=_run_worker_process,
+            args=(concurrency, lease_seconds, poll_interval),
+            name=f"functions-store-worker-{i}",
+        )
+        process.start()
+        children.append(process)
+    logger.info(f"Started {processes} worker processes")
+
+    def terminate(signum, frame):
+        # Workers stop gracefully on SIGTERM, handing back their running jobs
+        for process in children:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGINT, terminate)
+    signal.signal(signal.SIGTERM, terminate)
+    for process in children:
+        process.join()
@@ -0,0 +1,36 @@
+import os
+import tempfile
+
+import pytest
+
+# The database is configured on import of functions_store.database: point it
+# to a scratch SQLite file before the tests import the server modules
+_scratch = tempfile.mkdtemp(prefix="functions_store_tests_")
+os.environ.setdefault(
+    "FUNCTIONS_STORE_DATABASE_URL", f"sqlite:///{os.path.join(_scratch, 'store.db')}"
+)
+os.environ.setdefault("FUNCTIONS_STORE_EMBEDDED_WORKER", "0")
+
+
+@pytest.fixture
+def empty_queue():
+    """Start from a database without jobs, collections or execution limits"""
+    from functions_store import database
+    from functions_store.scheduler import scheduler
+
+    db = database.SessionLocal()
+    try:
+        for table in (
+            database.FunctionJobLeaseDB,
+            database.CollectionJobEventDB,
+            database.CollectionJobDB,
+            database.FunctionJobCollectionDB,
+            database.FunctionJobDB,
+            database.ExecutionLimitDB,
+        ):
+            db.query(table).delete()
+        db.commit()
+    finally:
+        db.close()
+    scheduler.invalidate()
+    scheduler.invalidate_queue()
@@ -0,0 +1,47 @@
+from fastapi.testclient import TestClient
+
+from functions_store import database
+from functions_store.catalog import CatalogVersion
+from functions_store.main import app
+
+
+def create_function(client, name):
+    return client.post(
+        "/function",
+        json={"name": name, "type": "local.python", "url": "f.py:f", "description": ""},
+    )
+
+
+def test_listing_is_not_modified_until_functions_change():
+    client = TestClient(app)
+    create_function(client, "first")
+    listing = client.get("/function/summary")
+    etag = listing.headers["ETag"]
+
+    unchanged = client.get("/function/summary", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    create_function(client, "second")
+    changed = client.get("/function/summary", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_other_processes_see_changes_after_refresh_seconds():
+    # Another API process, with its own cache of the version
+    other = CatalogVersion(refresh_seconds=0)
+    cached = CatalogVersion(refresh_seconds=3600)
+    before = other.version
+    assert cached.version == before
+
+    db = database.SessionLocal()
+    try:
+        CatalogVersion.bump(db)
+        db.commit()
+    finally:
+        db.close()
+
+    assert other.version != before
+    assert cached.version == before
+    cached.invalidate()
+    assert cached.version == other.version
@@ -0,0 +1,85 @@
+import csv
+import io
+
+import pytest
+
+from functions_store import columnar, database, job_collections, models
+from functions_store.job_queue import enqueue
+
+
+def make_collection(outputs):
+    """Create a collection of COMPLETED jobs with the given outputs"""
+    db = database.SessionLocal()
+    try:
+        jobs = enqueue(
+            db,
+            [
+                {
+                    "functionID": 1,
+                    "status": models.JobStatus.COMPLETED,
+                    "inputs": {"x": index},
+                    "outputs": job_outputs,
+                }
+                for index, job_outputs in enumerate(outputs)
+            ],
+        )
+        collection = job_collections.create_collection(
+            db, name="export", description=None, job_ids=[job.id for job in jobs]
+        )
+        db.commit()
+        return collection.id
+    finally:
+        db.close()
+
+
+def read_csv(collection_id):
+    body = b"".join(columnar.export_results(collection_id, "csv")).decode("utf-8")
+    return list(csv.DictReader(io.StringIO(body)))
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(columnar, "EXPORT_CHUNK_SIZE", 2)
+
+
+def test_nested_outputs_are_flattened():
+    collection_id = make_collection([{"result": {"y": 2, "z": {"w": 3}}}])
+
+    (row,) = read_csv(collection_id)
+
+    assert row["outputs.result.y"] == "2"
+    assert row["outputs.result.z.w"] == "3"
+    assert "outputs.result" not in row
+
+
+def test_csv_has_keys_of_later_chunks(small_chunks):
+    collection_id = make_collection([{"y": 1}, {"y": 2}, {"y": 3, "late": "a"}])
+
+    rows = read_csv(collection_id)
+
+    assert list(rows[0]) == ["id", "status", "inputs.x", "outputs.y", "outputs.late", "error"]
+    assert [row["outputs.late"] for row in rows] == ["", "", "a"]
+
+
+@pytest.mark.parametrize("format", ["arrow", "parquet"])
+def test_arrow_types_cover_all_chunks(small_chunks, format):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    # Only missing values in the first chunk, numbers and new keys later on
+    collection_id = make_collection(
+        [{"y": None}, {"y": None}, {"y": 1.5, "flag": True}, {"y": 2, "items": [1, 2]}]
+    )
+
+    body = b"".join(columnar.export_results(collection_id, format))
+    if format == "parquet":
+        table = pyarrow.parquet.read_table(io.BytesIO(body))
+    else:
+        table = pyarrow.ipc.open_stream(body).read_all()
+
+    assert table.schema.field("outputs.y").type == pyarrow.float64()
+    assert table.schema.field("outputs.flag").type == pyarrow.bool_()
+    assert table.column("outputs.y").to_pylist() == [None, None, 1.5, 2.0]
+    assert table.column("outputs.items").to_pylist() == [None, None, None, "[1, 2]"]
+    assert table.column_names[-1] == "error"
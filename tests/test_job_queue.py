@@ -0,0 +1,182 @@
+import asyncio
+import time
+
+import pytest
+
+from functions_store import database, job_collections, job_queue, models
+from functions_store.scheduler import Scheduler
+from functions_store.worker import JobWorker
+
+
+@pytest.fixture
+def db(empty_queue):
+    session = database.SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def function_id(db, tmp_path):
+    code = tmp_path / "slow.py"
+    code.write_text(
+        "import time\n\n\ndef slow(x):\n    time.sleep(x)\n    return {'x': x}\n"
+    )
+    function = database.FunctionDB(
+        name="slow", type="local.python", url=f"{code}:slow", description=""
+    )
+    db.add(function)
+    db.commit()
+    return function.id
+
+
+def enqueue(db, function_id, count=1, inputs=None):
+    jobs = job_queue.enqueue(
+        db,
+        [
+            {
+                "functionID": function_id,
+                "status": models.JobStatus.PENDING,
+                "inputs": inputs or {"x": 0},
+            }
+            for _ in range(count)
+        ],
+    )
+    collection = job_collections.create_collection(
+        db, "batch", None, [job.id for job in jobs]
+    )
+    db.commit()
+    return [job.id for job in jobs], collection.id
+
+
+def claim(db, owner, lease_seconds=60.0, max_jobs=1):
+    claimed = Scheduler().claim(db, owner, lease_seconds, max_jobs)
+    return [job.id for job, _ in claimed]
+
+
+def job(db, job_id):
+    db.expire_all()
+    return db.get(database.FunctionJobDB, job_id)
+
+
+def status(job_id):
+    db = database.SessionLocal()
+    try:
+        return job(db, job_id).status
+    finally:
+        db.close()
+
+
+def counts(db, collection_id):
+    db.expire_all()
+    collection = db.get(database.FunctionJobCollectionDB, collection_id)
+    return job_collections.job_status_counts(collection)
+
+
+def lease_owners(db):
+    leases = database.FunctionJobLeaseDB
+    return dict(db.query(leases.job_id, leases.worker_id))
+
+
+def test_jobs_of_expired_leases_are_requeued(db, function_id):
+    (job_id,), collection_id = enqueue(db, function_id)
+    assert claim(db, "dead-worker", lease_seconds=0) == [job_id]
+
+    assert job_queue.requeue_stale_jobs(db) == 1
+
+    assert job(db, job_id).status == models.JobStatus.PENDING
+    assert job(db, job_id).job_info == {"requeues": 1}
+    assert lease_owners(db) == {}
+    assert counts(db, collection_id)["PENDING"] == 1
+    assert claim(db, "other-worker") == [job_id]
+
+
+def test_heartbeats_keep_leases_alive(db, function_id):
+    (job_id,), _ = enqueue(db, function_id)
+    claim(db, "worker", lease_seconds=0)
+
+    assert job_queue.heartbeat(db, "worker", lease_seconds=60) == 1
+
+    assert job_queue.requeue_stale_jobs(db) == 0
+    assert job(db, job_id).status == models.JobStatus.RUNNING
+
+
+def test_jobs_requeued_too_often_fail(db, function_id):
+    (job_id,), collection_id = enqueue(db, function_id)
+    for attempt in range(job_queue.MAX_REQUEUES + 1):
+        assert claim(db, f"worker-{attempt}", lease_seconds=0) == [job_id]
+        job_queue.requeue_stale_jobs(db)
+
+    failed = job(db, job_id)
+    assert failed.status == models.JobStatus.FAILED
+    assert "requeued too many times" in failed.job_info["error"]
+    assert failed.finished_at is not None
+    assert counts(db, collection_id)["FAILED"] == 1
+
+
+def test_running_jobs_without_lease_are_requeued_on_startup(db, function_id):
+    (job_id,), _ = enqueue(db, function_id)
+    claim(db, "api")
+    db.query(database.FunctionJobLeaseDB).delete()
+    db.commit()
+
+    assert job_queue.requeue_stale_jobs(db) == 0
+    assert job_queue.requeue_stale_jobs(db, include_orphans=True) == 1
+    assert job(db, job_id).status == models.JobStatus.PENDING
+
+
+def test_outcomes_of_a_worker_that_lost_its_lease_are_discarded(db, function_id):
+    (job_id,), collection_id = enqueue(db, function_id)
+    claim(db, "slow-worker", lease_seconds=0)
+    job_queue.requeue_stale_jobs(db)
+    claim(db, "new-worker")
+
+    late = {"job_id": job_id, "status": models.JobStatus.FAILED, "job_info": {}}
+    assert job_queue.finish_jobs(db, "slow-worker", [late]) == []
+    assert job(db, job_id).status == models.JobStatus.RUNNING
+    assert lease_owners(db) == {job_id: "new-worker"}
+
+    assert job_queue.finish_job(
+        db, job_id, "new-worker", models.JobStatus.COMPLETED, outputs={"x": 0}
+    )
+    finished = job(db, job_id)
+    assert (finished.status, finished.outputs) == (models.JobStatus.COMPLETED, {"x": 0})
+    # What was recorded while queued is kept
+    assert finished.job_info == {"requeues": 1}
+    assert counts(db, collection_id) == {
+        "PENDING": 0,
+        "RUNNING": 0,
+        "COMPLETED": 1,
+        "FAILED": 0,
+    }
+
+
+def test_released_jobs_are_handed_back_to_the_queue(db, function_id):
+    _, collection_id = enqueue(db, function_id, count=3)
+    stopping = claim(db, "stopping-worker", max_jobs=2)
+    other = claim(db, "other-worker")
+
+    assert job_queue.release_owner_jobs(db, "stopping-worker") == 2
+
+    assert {job(db, job_id).status for job_id in stopping} == {models.JobStatus.PENDING}
+    assert lease_owners(db) == {other[0]: "other-worker"}
+    assert counts(db, collection_id)["PENDING"] == 2
+    assert counts(db, collection_id)["RUNNING"] == 1
+
+
+def test_stopped_worker_releases_its_running_jobs(db, function_id):
+    (job_id,), _ = enqueue(db, function_id, inputs={"x": 1.0})
+
+    async def main():
+        worker = JobWorker(concurrency=1, poll_interval=0.05)
+        task = asyncio.create_task(worker.run())
+        deadline = time.monotonic() + 10
+        while await asyncio.to_thread(status, job_id) != models.JobStatus.RUNNING:
+            assert time.monotonic() < deadline, "Job was not claimed in time"
+            await asyncio.sleep(0.02)
+        worker.stop()
+        await task
+
+    asyncio.run(main())
+
+    assert job(db, job_id).status == models.JobStatus.PENDING
+    assert lease_owners(db) == {}
@@ -0,0 +1,146 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from functions_store import database, events, job_collections, migrations
+
+# Schema created by the first release, before any migration existed
+BASELINE_SCHEMA = """
+CREATE TABLE functions (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR,
+    type VARCHAR,
+    url VARCHAR,
+    description VARCHAR,
+    input_schema JSON,
+    output_schema JSON,
+    tags JSON
+);
+CREATE INDEX ix_functions_id ON functions (id);
+CREATE TABLE function_jobs (
+    id INTEGER NOT NULL PRIMARY KEY,
+    "functionID" INTEGER,
+    status VARCHAR(9),
+    inputs JSON,
+    outputs JSON,
+    job_info JSON,
+    created_at DATETIME
+);
+CREATE INDEX ix_function_jobs_id ON function_jobs (id);
+CREATE TABLE function_job_collections (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR,
+    description VARCHAR,
+    job_ids JSON,
+    status VARCHAR,
+    created_at DATETIME
+);
+CREATE INDEX ix_function_job_collections_id ON function_job_collections (id);
+CREATE INDEX ix_function_job_collections_name ON function_job_collections (name);
+"""
+
+STATUSES = ["COMPLETED", "PENDING", "FAILED", "RUNNING", "COMPLETED"]
+
+
+@pytest.fixture
+def baseline_engine(tmp_path):
+    """Engine of a database created by the first release, with a collection"""
+    engine = database.create_database_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    connection = engine.raw_connection()
+    try:
+        connection.executescript(BASELINE_SCHEMA)
+        created_at = datetime(2024, 1, 1)
+        connection.execute(
+            "INSERT INTO functions (id, name, type, url, description) "
+            "VALUES (1, 'f', 'local.python', 'f.py:f', '')"
+        )
+        for index, status in enumerate(STATUSES):
+            connection.execute(
+                'INSERT INTO function_jobs (id, "functionID", status, created_at) '
+                "VALUES (?, 1, ?, ?)",
+                # Later jobs were created first
+                (index + 1, status, str(created_at - timedelta(minutes=index))),
+            )
+        connection.execute(
+            "INSERT INTO function_job_collections (id, name, job_ids, status) "
+            "VALUES (1, 'batch', ?, 'RUNNING')",
+            # Duplicates were not prevented
+            (json.dumps(list(range(1, len(STATUSES) + 1)) + [1]),),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    yield engine
+    engine.dispose()
+
+
+def upgrade(engine):
+    applied = migrations.upgrade(engine, database.Base.metadata)
+    assert applied == [version for version, _, _ in migrations.MIGRATIONS]
+    assert migrations.current_version(engine) == migrations.MIGRATIONS[-1][0]
+
+
+def test_jobs_finished_before_the_upgrade_are_streamed(baseline_engine):
+    upgrade(baseline_engine)
+
+    with Session(baseline_engine) as db:
+        finished = events._finished_jobs(db, 1, None)
+    # In the order they were created, as they have no finish time
+    assert [job.id for _, job in finished] == [5, 3, 1]
+
+
+def test_upgrading_twice_changes_nothing(baseline_engine):
+    upgrade(baseline_engine)
+
+    assert migrations.upgrade(baseline_engine, database.Base.metadata) == []
+    with Session(baseline_engine) as db:
+        assert db.query(database.CollectionJobEventDB).count() == 3
+
+
+def test_jobs_finished_before_the_upgrade_are_streamed_in_new_collections(
+    baseline_engine,
+):
+    upgrade(baseline_engine)
+
+    with Session(baseline_engine) as db:
+        collection = job_collections.create_collection(db, "again", None, [1, 2, 3])
+        db.commit()
+        finished = events._finished_jobs(db, collection.id, None)
+    assert [job.id for _, job in finished] == [3, 1]
+
+
+def test_collection_counters_are_counted_from_existing_jobs(baseline_engine):
+    upgrade(baseline_engine)
+
+    with Session(baseline_engine) as db:
+        collection = db.get(database.FunctionJobCollectionDB, 1)
+        status = job_collections.to_model(db, collection, include_job_ids=False)
+    assert status.job_counts == {"PENDING": 1, "RUNNING": 1, "COMPLETED": 2, "FAILED": 1}
+    assert status.progress == pytest.approx(0.6)
+    assert status.job_ids == []
+
+
+def test_queue_indexes_are_added_to_existing_jobs_table(baseline_engine):
+    upgrade(baseline_engine)
+
+    indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(baseline_engine).get_indexes("function_jobs")
+    }
+    assert indexes["ix_function_jobs_function_status_created"] == [
+        "functionID",
+        "status",
+        "created_at",
+    ]
+    assert indexes["ix_function_jobs_status_created"] == ["status", "created_at"]
+
+
+def test_collection_memberships_move_to_their_own_table(baseline_engine):
+    upgrade(baseline_engine)
+
+    with Session(baseline_engine) as db:
+        assert job_collections.collection_job_ids(db, 1) == [1, 2, 3, 4, 5]
+        assert job_collections.add_jobs(db, 1, [5]) == 0
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from functions_store import neighbours
+from functions_store.tabulated import TabulatedResults, execute_tabulated
+
+
+def results(**columns):
+    return TabulatedResults("results.csv", pd.DataFrame(columns), (0, 0))
+
+
+def test_nearest_row_gives_all_outputs():
+    table = results(x=[0.0, 1.0, 2.0], y=[0.0, 10.0, 20.0], label=["a", "b", "c"])
+
+    assert table.lookup({"x": 1.4}, mode="nearest") == {"y": 10.0, "label": "b"}
+    assert table.lookup({"x": 1.6}, mode="nearest") == {"y": 20.0, "label": "c"}
+
+
+def test_inverse_distance_weighting():
+    table = results(x=[0.0, 1.0], y=[0.0, 10.0], label=["a", "b"])
+
+    # Weights 1 / 0.25**2 and 1 / 0.75**2
+    assert table.lookup({"x": 0.25}, mode="idw", k=2)["y"] == pytest.approx(1.0)
+    # Outputs that cannot be interpolated are those of the nearest row
+    assert table.lookup({"x": 0.25}, mode="idw", k=2)["label"] == "a"
+    assert table.lookup({"x": 1.0}, mode="idw", k=2) == {"y": 10.0, "label": "b"}
+
+
+def test_linear_interpolation_reproduces_affine_outputs():
+    x, y = np.meshgrid(np.arange(5.0), np.arange(0.0, 50.0, 10.0))
+    x, y = x.ravel(), y.ravel()
+    table = results(x=x, y=y, z=2 * x + 3 * y + 1)
+
+    points = [{"x": 1.3, "y": 27.0}, {"x": 3.9, "y": 2.5}, {"x": 2.0, "y": 10.0}]
+    found = table.lookup_many(points, mode="linear")
+
+    for point, result in zip(points, found):
+        assert result["z"] == pytest.approx(2 * point["x"] + 3 * point["y"] + 1)
+
+
+def test_points_beyond_tolerance_have_no_result():
+    table = results(x=[0.0, 1.0], y=[0.0, 10.0])
+
+    # Distances are in units of the range of each input
+    assert table.lookup({"x": 0.05}, mode="nearest", tolerance=0.1) == {"y": 0.0}
+    with pytest.raises(ValueError, match="No result within tolerance 0.1"):
+        table.lookup({"x": 1.5}, mode="nearest", tolerance=0.1)
+
+
+def test_rows_with_missing_inputs_are_skipped():
+    table = results(x=[0.0, np.nan, 1.0], y=[0.0, 5.0, 10.0])
+
+    assert table.lookup({"x": 0.5}, mode="idw", k=3)["y"] == pytest.approx(5.0)
+    assert table.lookup({"x": 0.9}, mode="nearest") == {"y": 10.0}
+
+
+def test_modes_are_options_of_the_url(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_text("x,y\n0,0\n1,10\n")
+
+    assert execute_tabulated(f"{path}?mode=idw&k=2", {"x": 0.25}) == {
+        "y": pytest.approx(1.0)
+    }
+    with pytest.raises(ValueError, match="No result within tolerance"):
+        execute_tabulated(f"{path}?mode=nearest&tolerance=0.1", {"x": 0.5})
+
+
+def test_brute_force_search_finds_nearest_rows(monkeypatch):
+    monkeypatch.setattr(neighbours, "cKDTree", None)
+    monkeypatch.setattr(neighbours, "_BRUTE_FORCE_BLOCK", 64)
+    rng = np.random.default_rng(0)
+    values = rng.random((50, 3))
+    queries = rng.random((20, 3))
+
+    index = neighbours.NeighbourIndex(values)
+    distances, found = index.query(queries, k=4)
+
+    expected = np.linalg.norm(
+        index.normalize(queries)[:, None, :] - index.points[None, :, :], axis=2
+    )
+    assert np.array_equal(found, np.argsort(expected, axis=1)[:, :4])
+    assert distances == pytest.approx(np.sort(expected, axis=1)[:, :4])
@@ -0,0 +1,117 @@
+import asyncio
+
+import httpx
+import pytest
+
+from functions_store import remote
+from functions_store.remote import RemoteHttpClient
+
+URL = "http://functions.test/run"
+
+
+class StubServer:
+    """Answers the calls of a client with the given responses, in order"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def client(self) -> RemoteHttpClient:
+        return RemoteHttpClient(transport=httpx.MockTransport(self))
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    """Record the delays before retries instead of waiting"""
+    recorded = []
+
+    async def sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(remote.time, "sleep", recorded.append)
+    monkeypatch.setattr(remote.asyncio, "sleep", sleep)
+    return recorded
+
+
+def test_post_sends_inputs_and_returns_json(delays):
+    server = StubServer(httpx.Response(200, json={"y": 6}))
+
+    assert server.client().post(URL, {"x": 3}) == {"y": 6}
+    assert server.requests[0].method == "POST"
+    assert server.requests[0].read() == b'{"x":3}'
+    assert delays == []
+
+
+def test_connection_errors_are_retried_with_backoff(delays):
+    server = StubServer(
+        httpx.ConnectError("refused"),
+        httpx.ConnectError("refused"),
+        httpx.Response(200, json={"y": 1}),
+    )
+
+    assert server.client().post(URL, {}) == {"y": 1}
+    assert len(server.requests) == 3
+    assert delays == [remote.RETRY_BACKOFF, remote.RETRY_BACKOFF * 2]
+
+
+def test_retry_after_is_honored(delays):
+    server = StubServer(
+        httpx.Response(503, headers={"Retry-After": "2"}),
+        httpx.Response(429, headers={"Retry-After": "3600"}),
+        httpx.Response(200, json={"y": 1}),
+    )
+
+    assert server.client().post(URL, {}) == {"y": 1}
+    assert delays == [2.0, remote.MAX_RETRY_DELAY]
+
+
+def test_server_errors_are_not_retried(delays):
+    server = StubServer(httpx.Response(500, text="boom"))
+
+    with pytest.raises(Exception, match="500"):
+        server.client().post(URL, {})
+    assert len(server.requests) == 1
+    assert delays == []
+
+
+def test_timeouts_of_calls_that_reached_the_function_are_not_retried(delays):
+    server = StubServer(httpx.ReadTimeout("slow"))
+
+    with pytest.raises(Exception, match="slow"):
+        server.client().post(URL, {})
+    assert len(server.requests) == 1
+
+
+def test_retries_give_up_after_max_retries(delays):
+    server = StubServer(*[httpx.Response(503)] * (remote.MAX_RETRIES + 1))
+
+    with pytest.raises(Exception, match="503"):
+        server.client().post(URL, {})
+    assert len(server.requests) == remote.MAX_RETRIES + 1
+    assert len(delays) == remote.MAX_RETRIES
+
+
+def test_apost_retries_without_blocking(delays):
+    server = StubServer(
+        httpx.ConnectError("refused"),
+        httpx.Response(503, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"y": 2}),
+    )
+    client = server.client()
+
+    async def call():
+        try:
+            return await client.apost(URL, {"x": 1})
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(call()) == {"y": 2}
+    assert len(server.requests) == 3
+    assert delays == [remote.RETRY_BACKOFF, 1.0]
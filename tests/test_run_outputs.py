@@ -0,0 +1,79 @@
+import asyncio
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from functions_store import database, models
+from functions_store.main import app
+from functions_store.worker import JobWorker
+
+FINISHED = (models.JobStatus.COMPLETED, models.JobStatus.FAILED)
+
+OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {"y": {"type": "integer", "maximum": 10}},
+    "required": ["y"],
+}
+
+
+def finished(job_ids):
+    db = database.SessionLocal()
+    try:
+        jobs = database.FunctionJobDB
+        return db.query(jobs.id).filter(
+            jobs.id.in_(job_ids), jobs.status.in_(FINISHED)
+        ).count() == len(job_ids)
+    finally:
+        db.close()
+
+
+def run_worker_until_finished(job_ids, timeout=10.0):
+    async def main():
+        worker = JobWorker(concurrency=2, poll_interval=0.05, flush_interval=0.01)
+        task = asyncio.create_task(worker.run())
+        deadline = time.monotonic() + timeout
+        while not await asyncio.to_thread(finished, job_ids):
+            assert time.monotonic() < deadline, "Jobs did not finish in time"
+            await asyncio.sleep(0.05)
+        worker.stop()
+        await task
+
+    asyncio.run(main())
+
+
+def test_queued_and_sync_runs_store_the_same_outcome(tmp_path):
+    code = tmp_path / "double.py"
+    code.write_text("def double(x):\n    return {'y': 2 * x}\n")
+    client = TestClient(app)
+    function = client.post(
+        "/function",
+        json={
+            "name": "double",
+            "type": "local.python",
+            "url": f"{code}:double",
+            "description": "",
+            "output_schema": OUTPUT_SCHEMA,
+        },
+    ).json()
+    run = f"/function/{function['id']}/run"
+
+    # 12 breaks the maximum of the output schema
+    sync = [
+        client.post(run, params={"inputs": json.dumps({"x": x}), "sync": True}).json()
+        for x in (3, 6)
+    ]
+    queued = [
+        client.post(run, params={"inputs": json.dumps({"x": x})}).json() for x in (3, 6)
+    ]
+    run_worker_until_finished([job["id"] for job in queued])
+    queued = [client.get(f"/functionJob/{job['id']}").json() for job in queued]
+
+    assert [job["status"] for job in queued] == ["COMPLETED", "FAILED"]
+    assert queued[0]["outputs"] == sync[0]["outputs"] == {"y": 6}
+    for queued_job, sync_job in zip(queued, sync):
+        assert queued_job["status"] == sync_job["status"]
+        assert queued_job["outputs"] == sync_job["outputs"]
+        assert (queued_job["job_info"] or {}).get("error") == (
+            sync_job["job_info"] or {}
+        ).get("error")
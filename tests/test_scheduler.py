@@ -0,0 +1,125 @@
+from collections import Counter
+
+import pytest
+
+from functions_store import database, job_collections, models
+from functions_store.job_queue import enqueue
+from functions_store.scheduler import Scheduler, set_execution_limit
+
+
+@pytest.fixture
+def db(empty_queue):
+    session = database.SessionLocal()
+    yield session
+    session.close()
+
+
+def add_function(db, name="f"):
+    function = database.FunctionDB(
+        name=name, type="local.python", url="/nonexistent.py:f", description=""
+    )
+    db.add(function)
+    db.commit()
+    return function.id
+
+
+def add_jobs(db, function_id, count, collection=None):
+    jobs = enqueue(
+        db,
+        [
+            {"functionID": function_id, "status": models.JobStatus.PENDING}
+            for _ in range(count)
+        ],
+    )
+    job_ids = [job.id for job in jobs]
+    if collection is not None:
+        job_collections.create_collection(db, collection, None, job_ids)
+    db.commit()
+    return job_ids
+
+
+def claimed_per(claimed, key):
+    return Counter(key(job) for job, _ in claimed)
+
+
+def test_claim_respects_function_and_global_limits(db):
+    limited = add_function(db, "limited")
+    other = add_function(db, "other")
+    add_jobs(db, limited, 5)
+    add_jobs(db, other, 5)
+    set_execution_limit(db, 2, limited)
+    set_execution_limit(db, 6)
+
+    claimed = Scheduler().claim(db, "worker-1", max_jobs=10)
+
+    assert claimed_per(claimed, lambda job: job.functionID) == {limited: 2, other: 4}
+    # Both limits are reached, nothing more is handed out
+    assert Scheduler().claim(db, "worker-2", max_jobs=10) == []
+
+
+def test_claim_shares_a_function_between_its_collections(db):
+    function_id = add_function(db)
+    first = set(add_jobs(db, function_id, 10, collection="first"))
+    second = set(add_jobs(db, function_id, 10, collection="second"))
+    add_jobs(db, function_id, 10)
+
+    claimed = Scheduler().claim(db, "worker", max_jobs=6)
+
+    def group(job):
+        return "first" if job.id in first else "second" if job.id in second else "alone"
+
+    assert claimed_per(claimed, group) == {"first": 2, "second": 2, "alone": 2}
+
+
+def test_claim_shares_workers_by_weight(db):
+    heavy = add_function(db, "heavy")
+    light = add_function(db, "light")
+    add_jobs(db, heavy, 10)
+    add_jobs(db, light, 10)
+    set_execution_limit(db, None, heavy, weight=3)
+
+    claimed = Scheduler().claim(db, "worker", max_jobs=8)
+
+    assert claimed_per(claimed, lambda job: job.functionID) == {heavy: 6, light: 2}
+
+
+def test_pending_counts_are_cached_until_invalidated(db):
+    function_id = add_function(db)
+    scheduler = Scheduler(queue_refresh_seconds=3600)
+    assert scheduler.claim(db, "worker", max_jobs=1) == []
+
+    # Enqueued by another process: not seen before the counts are refreshed
+    job_ids = add_jobs(db, function_id, 3)
+    assert scheduler.claim(db, "worker", max_jobs=1) == []
+
+    scheduler.invalidate_queue()
+    claimed = scheduler.claim(db, "worker", max_jobs=2)
+    assert [job.id for job, _ in claimed] == job_ids[:2]
+    # Claims are taken off the cached counts
+    assert scheduler.queue_counts(db)[(function_id, None)]["pending"] == 1
+    claimed = scheduler.claim(db, "worker", max_jobs=2)
+    assert [job.id for job, _ in claimed] == job_ids[2:]
+
+
+def test_stats_count_jobs_of_several_collections_once(db):
+    function_id = add_function(db)
+    job_ids = add_jobs(db, function_id, 4, collection="first")
+    job_collections.create_collection(db, "second", None, job_ids[:2])
+    db.commit()
+    Scheduler().claim(db, "worker", max_jobs=1)
+
+    stats = Scheduler().stats(db)
+
+    assert (stats["pending"], stats["running"]) == (3, 1)
+
+
+def test_chunks_are_filled_within_limits_from_all_collections(db):
+    function_id = add_function(db)
+    first = set(add_jobs(db, function_id, 10, collection="first"))
+    add_jobs(db, function_id, 10, collection="second")
+    set_execution_limit(db, 4, function_id)
+
+    claimed = Scheduler().claim_function(db, "worker", function_id, max_jobs=10)
+
+    # Each job of a chunk counts against the limit of its function
+    assert claimed_per(claimed, lambda job: job.id in first) == {True: 2, False: 2}
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from functions_store.tabulated import (
+    TableCache,
+    execute_tabulated,
+    execute_tabulated_many,
+    parse_url,
+)
+
+RESULTS = """\
+x,y,label,z
+0.1,1,a,10.5
+0.2,1,b,20.5
+0.3,1,c,30.5
+0.3,2,d,40.5
+0.4,2,e,50.5
+0.4,2,f,60.5
+"""
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_text(RESULTS)
+    return path
+
+
+def test_lookup_matches_inputs_rounded_to_significant_digits(table):
+    # 0.1 + 0.2 is not 0.3, as values read back from text often are not
+    assert execute_tabulated(str(table), {"y": 1, "x": 0.1 + 0.2}) == {
+        "label": "c",
+        "z": 30.5,
+    }
+
+
+def test_lookup_returns_the_requested_outputs(table):
+    url = f"{table}?outputs=z"
+    assert execute_tabulated(url, {"x": 0.2, "y": 1}) == {"z": 20.5}
+    # By default, columns that are not inputs of a call are outputs
+    assert execute_tabulated(str(table), {"x": 0.1}) == {
+        "y": 1,
+        "label": "a",
+        "z": 10.5,
+    }
+
+
+def test_lookup_many_reports_errors_per_point(table):
+    results = execute_tabulated_many(
+        str(table),
+        [
+            {"x": 0.1, "y": 1},
+            {"x": 0.5, "y": 1},
+            {"x": 0.4, "y": 2},
+            {"x": "a", "y": 1},
+            {"x": 0.3},
+            {"x": 0.3, "w": 1},
+        ],
+    )
+
+    assert results[0] == {"label": "a", "z": 10.5}
+    assert str(results[1]) == "No result found for inputs {'x': 0.5, 'y': 1}."
+    assert str(results[2]) == "Multiple results found for inputs {'x': 0.4, 'y': 2}."
+    assert str(results[3]) == "Inputs {'x': 'a', 'y': 1} are not all numbers."
+    assert str(results[4]) == "Multiple results found for inputs {'x': 0.3}."
+    assert str(results[5]).startswith("Inputs ['w'] not in")
+
+
+def test_tables_are_read_once_and_reloaded_when_changed(table):
+    cache = TableCache()
+    first = cache.load(str(table))
+    assert cache.load(str(table)) is first
+    assert first.index(("x", "y"), 12) is first.index(("x", "y"), 12)
+
+    table.write_text(RESULTS.replace("10.5", "11.5") + "0.5,3,g,70.5\n")
+    os.utime(table, ns=(0, first.signature[0] + 1))
+    reloaded = cache.load(str(table))
+
+    assert reloaded is not first
+    assert reloaded.lookup({"x": 0.1, "y": 1}) == {"label": "a", "z": 11.5}
+    assert cache.stats() == {"hits": 1, "misses": 2, "loaded_tables": 1}
+
+
+def test_url_options_are_parsed_once(table):
+    path, options = parse_url(f"{table}?outputs=label,z&digits=6")
+
+    assert path == str(table)
+    assert dict(options) == {"outputs": ["label", "z"], "digits": 6}
+    assert parse_url(f"{table}?outputs=label,z&digits=6") is parse_url(
+        f"{table}?outputs=label,z&digits=6"
+    )